@@ -7,8 +7,9 @@ from typing import Union, Tuple, Optional
 from packaging import version
 
 from .widgets.theme import ThemeManager
-from .widgets.scaling import CTkScalingBaseClass
-from .widgets.appearance_mode import CTkAppearanceModeBaseClass
+from .widgets.scaling import CTkScalingBaseClass, ScalingTracker
+from .widgets.appearance_mode import CTkAppearanceModeBaseClass, AppearanceModeTracker
+from .widgets.font import FontManager
 
 from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty
 
@@ -36,6 +37,9 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
 
         self._enable_macos_dark_title_bar()
 
+        # install fonts before Tk gets initialized, so it finds them without font cache rescan
+        FontManager.install_fonts()
+
         # call init methods of super classes
         CTK_PARENT_CLASS.__init__(self, **pop_from_dict_by_set(kwargs, self._valid_tk_constructor_arguments))
         CTkAppearanceModeBaseClass.__init__(self)
@@ -79,6 +83,7 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
 
         self.bind('<Configure>', self._update_dimensions_event)
         self.bind('<FocusIn>', self._focus_in_event)
+        self.bind('<Map>', self._map_event)
 
     def destroy(self):
         self._disable_macos_dark_title_bar()
@@ -88,12 +93,20 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         CTkAppearanceModeBaseClass.destroy(self)
         CTkScalingBaseClass.destroy(self)
 
+    def _map_event(self, event):
+        # binding on the window gets events of all children as well
+        if event.widget is self:
+            AppearanceModeTracker.update_stale_widgets(self)  # redraw widgets which missed appearance mode switch while withdrawn
+
     def _focus_in_event(self, event):
         # sometimes window looses jumps back on macOS if window is selected from Mission Control, so has to be lifted again
         if sys.platform == "darwin":
             self.lift()
 
     def _update_dimensions_event(self, event=None):
+        if event is not None and event.widget is self:
+            ScalingTracker.request_dpi_check(self)  # window got moved or resized, maybe to a monitor with different DPI
+
         if not self._block_update_dimensions_event:
 
             detected_width = super().winfo_width()  # detect current window size
@@ -119,7 +132,7 @@ class CTk(CTK_PARENT_CLASS, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         self.after(1000, self._set_scaled_min_max)  # Why 1000ms delay? Experience! (Everything tested on Windows 11)
 
     def block_update_dimensions_event(self):
-        self._block_update_dimensions_event = False
+        self._block_update_dimensions_event = True
 
     def unblock_update_dimensions_event(self):
         self._block_update_dimensions_event = False
@@ -1,18 +1,54 @@
+import sys
+import time
 import tkinter
-from typing import Callable
+import threading
+import weakref
+from typing import Callable, Union, Hashable
 import darkdetect
 
 
+class _CallbackListView:
+    """ replaces the former callback_list attribute, returns a read-only tuple of the registered callbacks,
+        use AppearanceModeTracker.add() and .remove() to change them """
+
+    def __get__(self, instance, owner) -> tuple:
+        return owner.get_callbacks()
+
+
 class AppearanceModeTracker:
+    """ Tracks the system appearance mode and calls the callbacks on changes.
+
+        If darkdetect provides a listener for the platform, it runs in a background thread and only stores
+        the detected mode, the update loop on the Tk thread applies it. Otherwise the mode is polled, the interval
+        starts at update_loop_interval and doubles while the mode doesn't change, up to update_loop_max_interval. """
+
+    callback_dict = {}  # key of callback -> weak reference to bound method, or the callback itself if it's not a bound method
+    callback_list = _CallbackListView()  # read-only tuple of the callbacks in callback_dict
+    callback_error_count = 0  # number of exceptions raised by callbacks
+    last_callback_error: Union[Exception, None] = None
 
-    callback_list = []
     app_list = []
     update_loop_running = False
     update_loop_interval = 30  # milliseconds
+    update_loop_max_interval = 2000  # milliseconds, maximum polling interval if there is no listener
+    listener_check_interval = 250  # milliseconds, interval of the update loop while the listener is running, only compares the stored mode
+    use_listener = True
+
+    # widgets not redrawn on the last switch because they were not visible, indexed by their toplevel window
+    _stale_widgets = weakref.WeakKeyDictionary()  # toplevel window -> weakref.WeakSet of stale widgets
+    _stale_widget_toplevels = weakref.WeakKeyDictionary()  # stale widget -> toplevel window
+
+    _current_update_interval = 30
+    _listener_thread = None
+    _listener_running = False
+    _listener_appearance_mode = None  # last mode detected by listener thread
 
     appearance_mode_set_by = "system"
     appearance_mode = 0  # Light (standard)
 
+    last_switch_duration: float = 0  # seconds the last appearance mode switch took, including the redraw
+    switch_duration_callback: Union[Callable[[str, float], None], None] = None  # called with mode string and duration after every switch
+
     @classmethod
     def init_appearance_mode(cls):
         if cls.appearance_mode_set_by == "system":
@@ -22,9 +58,22 @@ class AppearanceModeTracker:
                 cls.appearance_mode = new_appearance_mode
                 cls.update_callbacks()
 
+    @staticmethod
+    def _get_callback_key(callback: Callable) -> Hashable:
+        # bound methods are recreated on every attribute access, so they are identified by object id and function
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return id(callback.__self__), callback.__func__
+        else:
+            return callback
+
     @classmethod
     def add(cls, callback: Callable, widget=None):
-        cls.callback_list.append(callback)
+        """ bound methods are referenced weakly and get removed when their object is deleted """
+        key = cls._get_callback_key(callback)
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            cls.callback_dict[key] = weakref.WeakMethod(callback, lambda _, key=key: cls.callback_dict.pop(key, None))
+        else:
+            cls.callback_dict[key] = callback
 
         if widget is not None:
             app = cls.get_tk_root_of_widget(widget)
@@ -32,16 +81,56 @@ class AppearanceModeTracker:
                 cls.app_list.append(app)
 
                 if not cls.update_loop_running:
+                    cls._start_listener()
                     app.after(cls.update_loop_interval, cls.update)
                     cls.update_loop_running = True
 
     @classmethod
     def remove(cls, callback: Callable):
-        try:
-            cls.callback_list.remove(callback)
-        except ValueError:
+        cls.callback_dict.pop(cls._get_callback_key(callback), None)
+
+    @classmethod
+    def get_callbacks(cls) -> tuple:
+        """ returns tuple of all registered callbacks, bound methods of deleted objects are left out """
+        callbacks = (callback() if isinstance(callback, weakref.WeakMethod) else callback for callback in list(cls.callback_dict.values()))
+        return tuple(callback for callback in callbacks if callback is not None)
+
+    @classmethod
+    def mark_stale(cls, widget):
+        """ widget missed the redraw of an appearance mode switch, it gets redrawn by update_stale_widgets() when visible """
+        if widget not in cls._stale_widget_toplevels:
+            toplevel = widget.winfo_toplevel()
+            cls._stale_widget_toplevels[widget] = toplevel
+            cls._stale_widgets.setdefault(toplevel, weakref.WeakSet()).add(widget)
+
+    @classmethod
+    def unmark_stale(cls, widget):
+        toplevel = cls._stale_widget_toplevels.pop(widget, None)
+        if toplevel is not None:
+            cls._stale_widgets[toplevel].discard(widget)
+
+    @classmethod
+    def is_stale(cls, widget) -> bool:
+        return widget in cls._stale_widget_toplevels
+
+    @classmethod
+    def update_stale_widgets(cls, parent):
+        """ request redraw of stale widgets which are parent or inside of parent and are visible now,
+            only the stale widgets of the toplevel window of parent get checked """
+        if len(cls._stale_widget_toplevels) == 0:
             return
 
+        stale_widgets = cls._stale_widgets.get(parent.winfo_toplevel())
+        if not stale_widgets:
+            return
+
+        parent_path = str(parent)
+        prefix = parent_path if parent_path.endswith(".") else parent_path + "."
+        for widget in [widget for widget in stale_widgets if str(widget) == parent_path or str(widget).startswith(prefix)]:
+            if widget._is_visible():
+                cls.unmark_stale(widget)
+                widget._request_draw()
+
     @staticmethod
     def detect_appearance_mode() -> int:
         try:
@@ -52,6 +141,36 @@ class AppearanceModeTracker:
         except NameError:
             return 0  # Light
 
+    @classmethod
+    def _start_listener(cls):
+        if cls.use_listener and cls._listener_thread is None and hasattr(darkdetect, "listener"):
+            cls._listener_running = True
+            cls._listener_thread = threading.Thread(target=cls._run_listener, daemon=True, name="AppearanceModeListener")
+            cls._listener_thread.start()
+
+    @classmethod
+    def _run_listener(cls):
+        # runs in background thread, must not call tkinter, Tcl objects may only be used by the thread that created them
+        try:
+            cls._listener_appearance_mode = cls.detect_appearance_mode()
+            darkdetect.listener(cls._listener_callback)
+        except Exception:
+            pass
+        cls._listener_running = False  # listener not supported on this platform or stopped, polling takes over
+
+    @classmethod
+    def _listener_callback(cls, theme: str):
+        # detect again instead of using theme, so the result is consistent with detect_appearance_mode(),
+        # the change gets applied by the next update loop call on the Tk thread
+        cls._listener_appearance_mode = cls.detect_appearance_mode()
+
+    @classmethod
+    def _apply_listener_appearance_mode(cls):
+        if cls.appearance_mode_set_by == "system" and cls._listener_appearance_mode is not None:
+            if cls._listener_appearance_mode != cls.appearance_mode:
+                cls.appearance_mode = cls._listener_appearance_mode
+                cls.update_callbacks()
+
     @classmethod
     def get_tk_root_of_widget(cls, widget):
         current_widget = widget
@@ -63,33 +182,60 @@ class AppearanceModeTracker:
 
     @classmethod
     def update_callbacks(cls):
-        if cls.appearance_mode == 0:
-            for callback in cls.callback_list:
-                try:
-                    callback("Light")
-                except Exception:
-                    continue
+        start_time = time.perf_counter()
+        mode_string = "Dark" if cls.appearance_mode == 1 else "Light"
 
-        elif cls.appearance_mode == 1:
-            for callback in cls.callback_list:
-                try:
-                    callback("Dark")
-                except Exception:
+        for key, callback in list(cls.callback_dict.items()):
+            if isinstance(callback, weakref.WeakMethod):
+                callback = callback()
+                if callback is None:
+                    cls.callback_dict.pop(key, None)  # object was deleted
                     continue
+            try:
+                callback(mode_string)
+            except Exception as err:
+                cls.callback_error_count += 1
+                cls.last_callback_error = err
+                sys.stderr.write(f"AppearanceModeTracker error: callback {callback} raised {type(err).__name__}: {err}\n")
+
+        # widgets only request a redraw in their callback, so all of them get drawn with a single flush per app
+        for app in cls.app_list:
+            try:
+                app.update_idletasks()
+            except Exception:
+                continue
+
+        cls.last_switch_duration = time.perf_counter() - start_time
+        if cls.switch_duration_callback is not None:
+            try:
+                cls.switch_duration_callback(mode_string, cls.last_switch_duration)
+            except Exception as err:
+                sys.stderr.write(f"AppearanceModeTracker error: switch_duration_callback raised {type(err).__name__}: {err}\n")
 
     @classmethod
     def update(cls):
-        if cls.appearance_mode_set_by == "system":
+        if cls.appearance_mode_set_by == "system" and cls._listener_running:
+            cls._apply_listener_appearance_mode()  # no detection needed, listener thread reports changes
+            next_interval = cls.listener_check_interval
+
+        elif cls.appearance_mode_set_by == "system":
             new_appearance_mode = cls.detect_appearance_mode()
 
             if new_appearance_mode != cls.appearance_mode:
                 cls.appearance_mode = new_appearance_mode
                 cls.update_callbacks()
+                cls._current_update_interval = cls.update_loop_interval
+            else:
+                cls._current_update_interval = min(cls._current_update_interval * 2, cls.update_loop_max_interval)
+            next_interval = cls._current_update_interval
+
+        else:
+            next_interval = cls.update_loop_max_interval  # mode set by user, nothing to detect
 
         # find an existing tkinter.Tk object for the next call of .after()
         for app in cls.app_list:
             try:
-                app.after(cls.update_loop_interval, cls.update)
+                app.after(next_interval, cls.update)
                 return
             except Exception:
                 continue
@@ -120,3 +266,6 @@ class AppearanceModeTracker:
 
         elif mode_string.lower() == "system":
             cls.appearance_mode_set_by = "system"
+            cls._current_update_interval = cls.update_loop_interval  # poll with shortest interval again
+            if cls._listener_running:
+                cls._apply_listener_appearance_mode()
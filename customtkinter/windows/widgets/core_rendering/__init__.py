@@ -2,6 +2,7 @@ import sys
 
 from .ctk_canvas import CTkCanvas
 from .draw_engine import DrawEngine
+from .shape_image_atlas import ShapeImageAtlas
 
 CTkCanvas.init_font_character_mapping()
 
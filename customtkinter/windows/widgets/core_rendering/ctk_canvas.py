@@ -2,6 +2,8 @@ import tkinter
 import sys
 from typing import Union, Tuple
 
+from .shape_image_atlas import ShapeImageAtlas
+
 
 class CTkCanvas(tkinter.Canvas):
     """
@@ -13,7 +15,19 @@ class CTkCanvas(tkinter.Canvas):
 
     - .create_aa_circle() creates antialiased circle and returns int identifier.
     - .coords() is modified to support the aa-circle shapes correctly like you would expect.
-    - .itemconfig() is also modified to support aa-cricle shapes.
+    - .itemconfig() is also modified to support aa-cricle shapes. With a plain tag it configures all
+      regular items and all aa-circles of the tag with at most two tag-level calls, aa-circles and
+      image shapes are kept apart by the internal group tags 'ctk_aa_circle_font_element' and 'ctk_image_shape'.
+    - .get_item_handle() returns the id of the item whose first tag is the given name, without
+      a Tcl round-trip. The handle table is filled when items are created and updated when
+      items are deleted.
+    - .create_image_shape() creates an image item showing a pre-rendered shape from the ShapeImageAtlas,
+      the shape and its color are set with the additional 'shape' and 'fill' options of .itemconfig().
+    - .begin_batch() and .end_batch() collect all coords, itemconfigure, delete, lower and raise calls
+      in between and send them to Tcl with a single call, which runs them with a Tcl procedure
+      registered once per interpreter. If the procedure can't be registered, the calls run one by one.
+    - .coords() and .itemconfig() remember the last values set per item id and tag, and skip
+      the Tcl call if nothing changed. Skipped calls are counted in CTkCanvas.suppressed_calls.
 
     The aa-circles are created by choosing a character from the custom created and loaded
     font 'CustomTkinter_shapes_font'. It contains circle shapes with different sizes filling
@@ -26,10 +40,24 @@ class CTkCanvas(tkinter.Canvas):
     """
 
     radius_to_char_fine: dict = None  # dict to map radius to font circle character
+    suppressed_calls: int = 0  # number of coords and itemconfig calls skipped because nothing changed
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._aa_circle_canvas_ids = set()
+        self._image_shapes: dict = {}  # item id -> [shape, fill, displayed PhotoImage]
+
+        self._item_handles: dict = {}  # first tag of item (name) -> item id
+        self._item_tags: dict = {}  # item id -> tuple of tags
+        self._item_handles_valid: bool = True  # False if tags changed in a way the handle table can't follow
+
+        # last coords and options passed per item id or tag, calls with unchanged values get skipped
+        self._item_coords: dict = {}  # item id -> flattened tuple of coords args
+        self._item_options: dict = {}  # item id -> dict of options
+        self._tag_options: dict = {}  # tag -> dict of options set for all items with this tag
+
+        self._batched_commands: Union[list, None] = None  # canvas commands collected between begin_batch() and end_batch()
+        self._batch_depth: int = 0
 
     @classmethod
     def init_font_character_mapping(cls):
@@ -70,48 +98,376 @@ class CTkCanvas(tkinter.Canvas):
         else:
             return self.radius_to_char_fine[radius]
 
+    @staticmethod
+    def _add_group_tag(tags: Union[str, Tuple[str, ...]], group_tag: str) -> Tuple[str, ...]:
+        if isinstance(tags, str):
+            return tuple(tags.split()) + (group_tag,)
+        else:
+            return tuple(tags) + (group_tag,)
+
     def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
                          tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.CENTER) -> int:
         # create a circle with a font element
         circle_1 = self.create_text(x_pos, y_pos, text=self._get_char_from_radius(radius), anchor=anchor, fill=fill,
-                                    font=("CustomTkinter_shapes_font", -radius * 2), tags=tags, angle=angle)
-        self.addtag_withtag("ctk_aa_circle_font_element", circle_1)
+                                    font=("CustomTkinter_shapes_font", -radius * 2), angle=angle,
+                                    tags=self._add_group_tag(tags, "ctk_aa_circle_font_element"))
         self._aa_circle_canvas_ids.add(circle_1)
 
         return circle_1
 
+    def create_image_shape(self, x_pos: int, y_pos: int, shape: tuple = None, fill: str = None,
+                           tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.NW) -> int:
+        # create an image item, which gets an image as soon as shape and fill are known
+        image_shape = self.create_image(x_pos, y_pos, anchor=anchor, tags=self._add_group_tag(tags, "ctk_image_shape"))
+        self._image_shapes[image_shape] = [None, None, None]
+        self._configure_image_shape(image_shape, shape=shape, fill=fill)
+
+        return image_shape
+
+    def _configure_image_shape(self, item_id: int, *args, shape: tuple = None, fill: str = None, **kwargs):
+        image_shape = self._image_shapes[item_id]
+
+        if shape is not None or fill is not None:
+            if shape is not None:
+                image_shape[0] = shape
+            if fill is not None:
+                image_shape[1] = fill
+
+            if image_shape[0] is not None and image_shape[1] is not None:
+                # keep reference to displayed image, so it stays valid if the atlas drops it
+                image_shape[2] = ShapeImageAtlas.get_photo_image(self, image_shape[0], image_shape[1])
+                kwargs["image"] = "" if image_shape[2] is None else image_shape[2]
+
+        if len(args) > 0 or len(kwargs) > 0:
+            self._set_item_options(item_id, *args, **kwargs)
+
+    def begin_batch(self):
+        self._batch_depth += 1
+        if self._batched_commands is None:
+            self._batched_commands = []
+
+    def end_batch(self):
+        self._batch_depth -= 1
+        if self._batch_depth <= 0:
+            self._batch_depth = 0
+            self._flush_batch()
+            self._batched_commands = None
+
+    def _load_batch_procedure(self) -> bool:
+        # flag is stored on the root window of the Tcl interpreter, so it is dropped with the interpreter
+        root = self._root()
+        loaded = getattr(root, "_ctk_batch_procedure_loaded", None)
+        if loaded is None:
+            try:
+                self.tk.eval("namespace eval ::customtkinter {}\n"
+                             "proc ::customtkinter::canvas_batch {canvas commands} {\n"
+                             "    foreach command $commands {$canvas {*}$command}\n"
+                             "}")
+                loaded = True
+            except Exception:
+                loaded = False  # fall back to single calls
+            root._ctk_batch_procedure_loaded = loaded
+        return loaded
+
+    def _flush_batch(self):
+        if not self._batched_commands:
+            return
+        commands, self._batched_commands = tuple(self._batched_commands), []
+
+        if len(commands) > 1 and self._load_batch_procedure():
+            self.tk.call("::customtkinter::canvas_batch", self._w, commands)
+        else:
+            for command in commands:
+                self.tk.call((self._w,) + command)
+
+    def _call_canvas_command(self, *command):
+        if self._batched_commands is not None:
+            self._batched_commands.append(command)
+        else:
+            self.tk.call((self._w,) + command)
+
+    def _set_item_options(self, tag_or_id, cnf=None, **kwargs):
+        if "tags" in kwargs or (cnf is not None and "tags" in cnf):
+            self._item_handles_valid = False  # tags get replaced, handle table gets rebuilt on next lookup
+
+        if self._batched_commands is not None and (cnf is not None or len(kwargs) > 0):
+            self._batched_commands.append(("itemconfigure", tag_or_id) + self._options(cnf, kwargs))
+        else:
+            self._flush_batch()
+            return super().itemconfigure(tag_or_id, cnf, **kwargs)
+
+    def find(self, *args):
+        self._flush_batch()
+        return super().find(*args)
+
+    def gettags(self, *args):
+        self._flush_batch()
+        return super().gettags(*args)
+
+    def itemcget(self, tag_or_id, option):
+        self._flush_batch()
+        return super().itemcget(tag_or_id, option)
+
+    def bbox(self, *args):
+        self._flush_batch()
+        return super().bbox(*args)
+
+    def tag_lower(self, *args):
+        self._call_canvas_command("lower", *args)
+
+    def tag_raise(self, *args):
+        self._call_canvas_command("raise", *args)
+
+    lower = tag_lower
+    lift = tkraise = tag_raise
+
+    def _create(self, item_type, args, kw):
+        self._flush_batch()
+        item_id = super()._create(item_type, args, kw)
+
+        # remember tags of the new item, the first tag is used as its name in the handle table
+        tags = kw.get("tags", ())
+        if args and isinstance(args[-1], dict):
+            tags = args[-1].get("tags", tags)
+        if isinstance(tags, str):
+            tags = tuple(tags.split())
+        else:
+            tags = tuple(str(tag) for tag in tags)
+
+        self._item_tags[item_id] = tags
+        if len(tags) > 0 and tags[0] not in self._item_handles:
+            self._item_handles[tags[0]] = item_id
+
+        for tag in tags:
+            self._tag_options.pop(tag, None)  # new item doesn't have the memorized options of its tags
+
+        return item_id
+
+    def get_item_handle(self, name: str) -> Union[int, None]:
+        """ returns id of the item which has name as first tag, or None if no such item exists """
+        if not self._item_handles_valid:
+            self._rebuild_item_handles()
+        return self._item_handles.get(name)
+
+    def _find_items_with_tag(self, tag: str) -> list:
+        # ids of all items with the given plain tag, taken from the handle table instead of a Tcl round-trip
+        if not self._item_handles_valid:
+            self._rebuild_item_handles()
+        return [item_id for item_id, tags in self._item_tags.items() if tag in tags]
+
+    def _rebuild_item_handles(self):
+        # ask Tcl for all items and tags, only needed after tag changes the handle table can't follow
+        self._item_tags = {item_id: tuple(self.gettags(item_id)) for item_id in self.find_withtag(tkinter.ALL)}
+        self._item_handles = {}
+        for item_id, tags in self._item_tags.items():
+            if len(tags) > 0 and tags[0] not in self._item_handles:
+                self._item_handles[tags[0]] = item_id
+        self._item_handles_valid = True
+
+    def _forget_items(self, item_ids):
+        for item_id in item_ids:
+            tags = self._item_tags.pop(item_id, ())
+            if len(tags) > 0 and self._item_handles.get(tags[0]) == item_id:
+                del self._item_handles[tags[0]]
+                for other_id, other_tags in self._item_tags.items():  # another item with same name takes over
+                    if len(other_tags) > 0 and other_tags[0] == tags[0]:
+                        self._item_handles[tags[0]] = other_id
+                        break
+            self._aa_circle_canvas_ids.discard(item_id)
+            self._image_shapes.pop(item_id, None)
+            self._item_coords.pop(item_id, None)
+            self._item_options.pop(item_id, None)
+
+    def delete(self, *args):
+        self._call_canvas_command("delete", *args)
+
+        for tag_or_id in args:
+            if type(tag_or_id) == int or (type(tag_or_id) == str and tag_or_id.isdigit()):
+                self._forget_items((int(tag_or_id),))
+            elif tag_or_id == tkinter.ALL:
+                self._item_handles, self._item_tags = {}, {}
+                self._aa_circle_canvas_ids.clear()
+                self._image_shapes.clear()
+                self._clear_memo()
+            elif type(tag_or_id) == str and not any(c in tag_or_id for c in "!&|^()"):
+                self._forget_items([item_id for item_id, tags in self._item_tags.items() if tag_or_id in tags])
+            else:
+                self._item_handles_valid = False  # tag expression, handle table gets rebuilt on next lookup
+                self._clear_memo()
+
+    def addtag(self, *args):
+        self._call_canvas_command("addtag", *args)
+
+        if len(args) == 3 and args[1] == "withtag" and type(args[2]) == int and args[2] in self._item_tags:
+            self._item_tags[args[2]] += (str(args[0]),)
+            self._tag_options.pop(str(args[0]), None)
+        else:
+            self._item_handles_valid = False
+            self._tag_options.clear()
+
+    def dtag(self, *args):
+        self._call_canvas_command("dtag", *args)
+        self._item_handles_valid = False
+        self._tag_options.clear()
+
+    def _forget_option_memo(self, item_id: int, option_names):
+        # values of tags containing this item may no longer be the same for all items of the tag
+        for tag in self._item_tags.get(item_id, ()):
+            tag_options = self._tag_options.get(tag)
+            if tag_options is not None:
+                for option_name in option_names:
+                    tag_options.pop(option_name, None)
+
+    def _clear_memo(self):
+        self._item_coords.clear()
+        self._item_options.clear()
+        self._tag_options.clear()
+
+    def move(self, *args):
+        self._flush_batch()
+        super().move(*args)
+        self._item_coords.clear()
+
+    def moveto(self, *args, **kwargs):
+        self._flush_batch()
+        super().moveto(*args, **kwargs)
+        self._item_coords.clear()
+
+    def scale(self, *args):
+        self._flush_batch()
+        super().scale(*args)
+        self._item_coords.clear()
+
     def coords(self, tag_or_id, *args):
 
-        if type(tag_or_id) == str and "ctk_aa_circle_font_element" in self.gettags(tag_or_id):
-            coords_id = self.find_withtag(tag_or_id)[0]  # take the lowest id for the given tag
-            super().coords(coords_id, *args[:2])
+        if type(tag_or_id) == str and tag_or_id in self._item_handles and self._item_handles_valid:
+            tag_or_id = self._item_handles[tag_or_id]  # use handle table instead of Tcl round-trips
 
-            if len(args) == 3:
-                super().itemconfigure(coords_id, font=("CustomTkinter_shapes_font", -int(args[2]) * 2), text=self._get_char_from_radius(args[2]))
+        if type(tag_or_id) == int and len(args) > 0:
+            coords = tkinter._flatten(args)  # new tuple, so later changes of a list passed in can't affect the memo
+            if self._item_coords.get(tag_or_id) == coords:
+                CTkCanvas.suppressed_calls += 1  # coords did not change since last call
+                return
+            self._item_coords[tag_or_id] = coords
+        elif len(args) > 0:
+            self._item_coords.clear()  # unknown which item gets moved
+
+        if type(tag_or_id) == str and tag_or_id != tkinter.ALL and not any(c in tag_or_id for c in "!&|^()"):
+            item_ids = self._find_items_with_tag(tag_or_id)
+            if len(item_ids) > 0 and item_ids[0] in self._aa_circle_canvas_ids:
+                tag_or_id = item_ids[0]  # take the lowest id for the given tag
 
-        elif type(tag_or_id) == int and tag_or_id in self._aa_circle_canvas_ids:
-            super().coords(tag_or_id, *args[:2])
+        if type(tag_or_id) == int and tag_or_id in self._aa_circle_canvas_ids:
+            self._call_canvas_command("coords", tag_or_id, *args[:2])
 
             if len(args) == 3:
-                super().itemconfigure(tag_or_id, font=("CustomTkinter_shapes_font", -args[2] * 2), text=self._get_char_from_radius(args[2]))
+                self._set_item_options(tag_or_id, font=("CustomTkinter_shapes_font", -int(args[2]) * 2), text=self._get_char_from_radius(args[2]))
+
+        elif len(args) > 0:
+            self._call_canvas_command("coords", tag_or_id, *tkinter._flatten(args))
 
         else:
-            super().coords(tag_or_id, *args)
+            self._flush_batch()
+            return super().coords(tag_or_id)
+
+    def itemconfigure(self, tag_or_id, cnf=None, **kw):
+        # raw itemconfigure bypasses the memo, so forget memorized values of the given options
+        if cnf is None and type(tag_or_id) == int:
+            for option_name in kw:
+                self._item_options.get(tag_or_id, {}).pop(option_name, None)
+            self._forget_option_memo(tag_or_id, kw.keys())
+        elif cnf is not None or len(kw) > 0:
+            self._item_options.clear()
+            self._tag_options.clear()
+        return self._set_item_options(tag_or_id, cnf, **kw)
 
     def itemconfig(self, tag_or_id, *args, **kwargs):
+        if type(tag_or_id) == str and tag_or_id.isdigit():
+            tag_or_id = int(tag_or_id)  # item id given as string
+
+        if len(args) > 0 or len(kwargs) == 0:
+            self._item_options.clear()
+            self._tag_options.clear()
+            memorize = False
+        elif type(tag_or_id) == int:
+            if tag_or_id in self._aa_circle_canvas_ids or tag_or_id in self._image_shapes:
+                kwargs.pop("outline", None)
+
+            item_options = self._item_options.setdefault(tag_or_id, {})
+            kwargs = {key: value for key, value in kwargs.items() if key not in item_options or item_options[key] != value}
+            if len(kwargs) == 0:
+                CTkCanvas.suppressed_calls += 1  # options did not change since last call
+                return
+            item_options.update(kwargs)
+            self._forget_option_memo(tag_or_id, kwargs.keys())
+            memorize = False
+        elif tag_or_id != tkinter.ALL and not any(c in tag_or_id for c in "!&|^()"):
+            tag_options = self._tag_options.setdefault(tag_or_id, {})
+            kwargs = {key: value for key, value in kwargs.items() if key not in tag_options or tag_options[key] != value}
+            if len(kwargs) == 0:
+                CTkCanvas.suppressed_calls += 1  # options of all items with this tag did not change since last call
+                return
+            memorize = True
+        else:
+            self._item_options.clear()
+            self._tag_options.clear()
+            memorize = False
+
         kwargs_except_outline = kwargs.copy()
         if "outline" in kwargs_except_outline:
             del kwargs_except_outline["outline"]
 
         if type(tag_or_id) == int:
-            if tag_or_id in self._aa_circle_canvas_ids:
-                super().itemconfigure(tag_or_id, *args, **kwargs_except_outline)
+            if tag_or_id in self._image_shapes:
+                self._configure_image_shape(tag_or_id, *args, **kwargs_except_outline)
+            elif tag_or_id in self._aa_circle_canvas_ids:
+                self._set_item_options(tag_or_id, *args, **kwargs_except_outline)
             else:
-                super().itemconfigure(tag_or_id, *args, **kwargs)
+                self._set_item_options(tag_or_id, *args, **kwargs)
+        elif memorize:
+            item_ids = self._find_items_with_tag(tag_or_id)
+            image_shape_ids = [item_id for item_id in item_ids if item_id in self._image_shapes]
+            aa_circle_count = sum(1 for item_id in item_ids if item_id in self._aa_circle_canvas_ids)
+            regular_count = len(item_ids) - aa_circle_count - len(image_shape_ids)
+
+            self.begin_batch()
+            try:
+                # one call for all regular items and one for all aa-circles, image shapes show their own image each
+                if regular_count > 0:
+                    if aa_circle_count == 0 and len(image_shape_ids) == 0:
+                        self._set_item_options(tag_or_id, *args, **kwargs)
+                    else:
+                        self._set_item_options(f"{tag_or_id}&&!ctk_aa_circle_font_element&&!ctk_image_shape", *args, **kwargs)
+                if aa_circle_count > 0:
+                    if regular_count == 0 and len(image_shape_ids) == 0:
+                        self._set_item_options(tag_or_id, *args, **kwargs_except_outline)
+                    else:
+                        self._set_item_options(f"{tag_or_id}&&ctk_aa_circle_font_element", *args, **kwargs_except_outline)
+                for image_shape_id in image_shape_ids:
+                    self._configure_image_shape(image_shape_id, *args, **kwargs_except_outline)
+
+                for item_id in item_ids:
+                    if item_id in self._aa_circle_canvas_ids or item_id in self._image_shapes:
+                        self._item_options.setdefault(item_id, {}).update(kwargs_except_outline)
+                    else:
+                        self._item_options.setdefault(item_id, {}).update(kwargs)
+                    self._forget_option_memo(item_id, kwargs.keys())
+            finally:
+                self.end_batch()
+
         else:
             configure_ids = self.find_withtag(tag_or_id)
-            for configure_id in configure_ids:
-                if configure_id in self._aa_circle_canvas_ids:
-                    super().itemconfigure(configure_id, *args, **kwargs_except_outline)
-                else:
-                    super().itemconfigure(configure_id, *args, **kwargs)
+            self.begin_batch()
+            try:
+                for configure_id in configure_ids:
+                    if configure_id in self._image_shapes:
+                        self._configure_image_shape(configure_id, *args, **kwargs_except_outline)
+                    elif configure_id in self._aa_circle_canvas_ids:
+                        self._set_item_options(configure_id, *args, **kwargs_except_outline)
+                    else:
+                        self._set_item_options(configure_id, *args, **kwargs)
+            finally:
+                self.end_batch()
+
+        if memorize:
+            self._tag_options[tag_or_id].update(kwargs)
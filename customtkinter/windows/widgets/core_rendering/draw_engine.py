@@ -2,7 +2,10 @@ from __future__ import annotations
 import sys
 import math
 import tkinter
-from typing import Union, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Union, Callable, TYPE_CHECKING
+
+from .shape_image_atlas import ShapeImageAtlas
 
 if TYPE_CHECKING:
     from ..core_rendering import CTkCanvas
@@ -24,15 +27,50 @@ class DrawEngine:
      - draw_checkmark()
      - draw_dropdown_arrow()
 
+    Every function first calculates the geometry of the shape (which canvas items are needed, their coordinates
+    and options) and then replays it on the canvas. The geometry only depends on the arguments, so it gets stored
+    in a process-wide LRU cache, and widgets with the same dimensions only calculate it once.
+
+    The 'image_shapes' method draws pre-rendered images of the shapes from the ShapeImageAtlas,
+    which reduces the number of canvas items per widget. It needs PIL and falls back to 'polygon_shapes'
+    if PIL is not installed.
+
+    A geometry is a tuple of sections, and every section is a tuple of:
+     - parts: tuple of (name, item_type, create_kwargs, coords, options), name is the first tag of the item
+     - deleted_tags: tuple of tags, which items get deleted because they are not needed
+     - z_order_operations: tuple of (canvas_method_name, args), executed if new parts were created
+     - z_order_after_any_creation: bool, if True z_order_operations also get executed if parts
+       of a previous section were created
+
     """
 
-    preferred_drawing_method: str = None  # 'polygon_shapes', 'font_shapes', 'circle_shapes'
+    preferred_drawing_method: str = None  # 'polygon_shapes', 'font_shapes', 'circle_shapes', 'image_shapes'
+
+    geometry_cache_max_size: int = 2048  # max number of cached shape geometries
+    geometry_cache_hits: int = 0
+    geometry_cache_misses: int = 0
+    _geometry_cache: OrderedDict = OrderedDict()
 
     def __init__(self, canvas: CTkCanvas):
         self._canvas = canvas
         self._round_width_to_even_numbers: bool = True
         self._round_height_to_even_numbers: bool = True
 
+    @classmethod
+    def get_geometry_cache_info(cls) -> dict:
+        """ returns dict with hits, misses, current size and max size of the shape geometry cache """
+        return {"hits": cls.geometry_cache_hits,
+                "misses": cls.geometry_cache_misses,
+                "size": len(cls._geometry_cache),
+                "max_size": cls.geometry_cache_max_size}
+
+    @classmethod
+    def clear_geometry_cache(cls):
+        """ remove all cached shape geometries and reset the hit and miss counters """
+        cls._geometry_cache.clear()
+        cls.geometry_cache_hits = 0
+        cls.geometry_cache_misses = 0
+
     def set_round_to_even_numbers(self, round_width_to_even_numbers: bool = True, round_height_to_even_numbers: bool = True):
         self._round_width_to_even_numbers: bool = round_width_to_even_numbers
         self._round_height_to_even_numbers: bool = round_height_to_even_numbers
@@ -49,6 +87,10 @@ class DrawEngine:
         elif self.preferred_drawing_method == "font_shapes":
             return round(user_corner_radius)
 
+        # optimize for drawing with pre-rendered images, integer radius results in fewer different images
+        elif self.preferred_drawing_method == "image_shapes":
+            return round(user_corner_radius)
+
         # optimize for drawing with circles and rects
         elif self.preferred_drawing_method == "circle_shapes":
             user_corner_radius = 0.5 * round(user_corner_radius / 0.5)  # round to 0.5 steps
@@ -61,37 +103,92 @@ class DrawEngine:
             else:
                 return user_corner_radius
 
+    def __get_geometry(self, calc_function: Callable, *args) -> tuple:
+        """ get geometry from cache or calculate it with calc_function(*args) """
+
+        # the geometry depends on the arguments, the rounding options and the preferred drawing method
+        cache_key = (calc_function.__name__, self.preferred_drawing_method,
+                     self._round_width_to_even_numbers, self._round_height_to_even_numbers) + args
+
+        geometry = DrawEngine._geometry_cache.get(cache_key)
+        if geometry is None:
+            DrawEngine.geometry_cache_misses += 1
+            geometry = calc_function(*args)
+            DrawEngine._geometry_cache[cache_key] = geometry
+            if len(DrawEngine._geometry_cache) > DrawEngine.geometry_cache_max_size:
+                DrawEngine._geometry_cache.popitem(last=False)  # remove least recently used geometry
+        else:
+            DrawEngine.geometry_cache_hits += 1
+            DrawEngine._geometry_cache.move_to_end(cache_key)
+
+        return geometry
+
+    def __replay_geometry(self, geometry: tuple) -> bool:
+        """ creates, deletes and moves the canvas items according to the geometry, returns bool if recoloring is necessary """
+        requires_recoloring = False
+        self._canvas.begin_batch()  # send all canvas calls of this draw with a single Tcl call
+        try:
+            for parts, deleted_tags, z_order_operations, z_order_after_any_creation in geometry:
+                section_requires_recoloring = False
+
+                if deleted_tags:
+                    self._canvas.delete(*deleted_tags)
+
+                for name, item_type, create_kwargs, coords, options in parts:
+                    item_id = self._canvas.get_item_handle(name)  # no Tcl round-trip if part already exists
+                    if item_id is None:
+                        if item_type == "aa_circle":
+                            item_id = self._canvas.create_aa_circle(0, 0, 0, **create_kwargs)
+                        elif item_type == "image_shape":
+                            item_id = self._canvas.create_image_shape(0, 0, **create_kwargs)
+                        elif item_type == "text":
+                            item_id = self._canvas.create_text(0, 0, **create_kwargs)
+                        else:
+                            item_id = getattr(self._canvas, "create_" + item_type)(0, 0, 0, 0, **create_kwargs)
+                        section_requires_recoloring = True
+
+                    if coords is not None:
+                        self._canvas.coords(item_id, *coords)
+                    if options is not None:
+                        self._canvas.itemconfig(item_id, **options)
+
+                requires_recoloring = requires_recoloring or section_requires_recoloring
+
+                if section_requires_recoloring or (z_order_after_any_creation and requires_recoloring):  # new parts were added -> manage z-order
+                    for method_name, args in z_order_operations:
+                        getattr(self._canvas, method_name)(*args)
+        finally:
+            self._canvas.end_batch()
+
+        return requires_recoloring
+
+    @staticmethod
+    def __part(name: str, item_type: str, tags: tuple, coords: Union[tuple, None], options: dict = None, **create_kwargs) -> tuple:
+        create_kwargs["tags"] = (name,) + tags
+        return name, item_type, create_kwargs, coords, options
+
+    @classmethod
+    def __aa_circle_parts(cls, name: str, tags: tuple, x_pos: Union[float, int], y_pos: Union[float, int], radius: Union[float, int]) -> list:
+        # two aa-circles on top of each other, one is rotated by 180 degrees for a more symmetric look
+        return [cls.__part(name + "_a", "aa_circle", tags, (x_pos, y_pos, radius), anchor=tkinter.CENTER),
+                cls.__part(name + "_b", "aa_circle", tags, (x_pos, y_pos, radius), anchor=tkinter.CENTER, angle=180)]
+
     def draw_background_corners(self, width: Union[float, int], height: Union[float, int], ):
+        return self.__replay_geometry(self.__get_geometry(self.__calc_background_corners, width, height))
+
+    def __calc_background_corners(self, width: Union[float, int], height: Union[float, int]) -> tuple:
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round (floor) _current_width and _current_height and restrict them to even values only
         if self._round_height_to_even_numbers:
             height = math.floor(height / 2) * 2
 
-        requires_recoloring = False
-
-        if not self._canvas.find_withtag("background_corner_top_left"):
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("background_parts", "background_corner_top_left"), width=0)
-            requires_recoloring = True
-        if not self._canvas.find_withtag("background_corner_top_right"):
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("background_parts", "background_corner_top_right"), width=0)
-            requires_recoloring = True
-        if not self._canvas.find_withtag("background_corner_bottom_right"):
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("background_parts", "background_corner_bottom_right"), width=0)
-            requires_recoloring = True
-        if not self._canvas.find_withtag("background_corner_bottom_left"):
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("background_parts", "background_corner_bottom_left"), width=0)
-            requires_recoloring = True
-
         mid_width, mid_height = round(width / 2), round(height / 2)
-        self._canvas.coords("background_corner_top_left", (0, 0, mid_width, mid_height))
-        self._canvas.coords("background_corner_top_right", (mid_width, 0, width, mid_height))
-        self._canvas.coords("background_corner_bottom_right", (mid_width, mid_height, width, height))
-        self._canvas.coords("background_corner_bottom_left", (0, mid_height, mid_width, height))
+        parts = (self.__part("background_corner_top_left", "rectangle", ("background_parts",), (0, 0, mid_width, mid_height), width=0),
+                 self.__part("background_corner_top_right", "rectangle", ("background_parts",), (mid_width, 0, width, mid_height), width=0),
+                 self.__part("background_corner_bottom_right", "rectangle", ("background_parts",), (mid_width, mid_height, width, height), width=0),
+                 self.__part("background_corner_bottom_left", "rectangle", ("background_parts",), (0, mid_height, mid_width, height), width=0))
 
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_lower("background_parts")
-
-        return requires_recoloring
+        return (parts, (), (("tag_lower", ("background_parts",)),), False),
 
     def draw_rounded_rect_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
                                       border_width: Union[float, int], overwrite_preferred_drawing_method: str = None) -> bool:
@@ -100,6 +197,11 @@ class DrawEngine:
 
             returns bool if recoloring is necessary """
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_rounded_rect_with_border, width, height, corner_radius,
+                                                          border_width, overwrite_preferred_drawing_method))
+
+    def __calc_rounded_rect_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                        border_width: Union[float, int], overwrite_preferred_drawing_method: Union[str, None]) -> tuple:
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round (floor) _current_width and _current_height and restrict them to even values only
         if self._round_height_to_even_numbers:
@@ -122,279 +224,208 @@ class DrawEngine:
         else:
             preferred_drawing_method = self.preferred_drawing_method
 
-        if preferred_drawing_method == "polygon_shapes":
-            return self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+        if preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            return self.__calc_rounded_rect_with_border_image_shapes(width, height, corner_radius, border_width, inner_corner_radius),
+        elif preferred_drawing_method == "polygon_shapes" or preferred_drawing_method == "image_shapes":
+            return self.__calc_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius),
         elif preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, ())
+            return self.__calc_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius),
         elif preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_rect_with_border_circle_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+            return self.__calc_rounded_rect_with_border_circle_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+        else:
+            return ()
 
-    def __draw_rounded_rect_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> bool:
-        requires_recoloring = False
+    def __calc_rounded_rect_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> tuple:
+        parts, deleted_tags = [], []
 
         # create border button parts (only if border exists)
         if border_width > 0:
-            if not self._canvas.find_withtag("border_parts"):
-                self._canvas.create_polygon((0, 0, 0, 0), tags=("border_line_1", "border_parts"))
-                requires_recoloring = True
-
-            self._canvas.coords("border_line_1",
-                                (corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 height - corner_radius,
-                                 corner_radius,
-                                 height - corner_radius))
-            self._canvas.itemconfig("border_line_1",
-                                    joinstyle=tkinter.ROUND,
-                                    width=corner_radius * 2)
-
+            parts.append(self.__part("border_line_1", "polygon", ("border_parts",),
+                                     (corner_radius,
+                                      corner_radius,
+                                      width - corner_radius,
+                                      corner_radius,
+                                      width - corner_radius,
+                                      height - corner_radius,
+                                      corner_radius,
+                                      height - corner_radius),
+                                     {"joinstyle": tkinter.ROUND, "width": corner_radius * 2}))
         else:
-            self._canvas.delete("border_parts")
-
-        # create inner button parts
-        if not self._canvas.find_withtag("inner_parts"):
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("inner_line_1", "inner_parts"), joinstyle=tkinter.ROUND)
-            requires_recoloring = True
+            deleted_tags.append("border_parts")
 
         if corner_radius <= border_width:
             bottom_right_shift = -1  # weird canvas rendering inaccuracy that has to be corrected in some cases
         else:
             bottom_right_shift = 0
 
-        self._canvas.coords("inner_line_1",
-                            border_width + inner_corner_radius,
-                            border_width + inner_corner_radius,
-                            width - (border_width + inner_corner_radius) + bottom_right_shift,
-                            border_width + inner_corner_radius,
-                            width - (border_width + inner_corner_radius) + bottom_right_shift,
-                            height - (border_width + inner_corner_radius) + bottom_right_shift,
-                            border_width + inner_corner_radius,
-                            height - (border_width + inner_corner_radius) + bottom_right_shift)
-        self._canvas.itemconfig("inner_line_1",
-                                width=inner_corner_radius * 2)
-
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_lower("inner_parts")
-            self._canvas.tag_lower("border_parts")
-            self._canvas.tag_lower("background_parts")
+        # create inner button parts
+        parts.append(self.__part("inner_line_1", "polygon", ("inner_parts",),
+                                 (border_width + inner_corner_radius,
+                                  border_width + inner_corner_radius,
+                                  width - (border_width + inner_corner_radius) + bottom_right_shift,
+                                  border_width + inner_corner_radius,
+                                  width - (border_width + inner_corner_radius) + bottom_right_shift,
+                                  height - (border_width + inner_corner_radius) + bottom_right_shift,
+                                  border_width + inner_corner_radius,
+                                  height - (border_width + inner_corner_radius) + bottom_right_shift),
+                                 {"width": inner_corner_radius * 2},
+                                 joinstyle=tkinter.ROUND))
+
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
+
+    def __calc_rounded_rect_with_border_image_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> tuple:
+        width, height = round(width), round(height)
+        parts, deleted_tags = [], []
+        all_corners = (True, True, True, True)
+
+        # border image below the inner image (only if border exists)
+        if border_width > 0:
+            parts.append(self.__part("border_image_1", "image_shape", ("border_parts",), (0, 0),
+                                     {"shape": ("rounded_rect", width, height, corner_radius, all_corners)}))
+        else:
+            deleted_tags.append("border_parts")
 
-        return requires_recoloring
+        parts.append(self.__part("inner_image_1", "image_shape", ("inner_parts",), (border_width, border_width),
+                                 {"shape": ("rounded_rect", width - 2 * border_width, height - 2 * border_width, inner_corner_radius, all_corners)}))
 
-    def __draw_rounded_rect_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                    exclude_parts: tuple) -> bool:
-        requires_recoloring = False
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
+
+    def __calc_rounded_rect_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> tuple:
+        parts, deleted_tags = [], []
 
         # create border button parts
         if border_width > 0:
             if corner_radius > 0:
-                # create canvas border corner parts if not already created, but only if needed, and delete if not needed
-                if not self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" in exclude_parts:
-                    self._canvas.delete("border_oval_1_a", "border_oval_1_b")
-
-                if not self._canvas.find_withtag("border_oval_2_a") and width > 2 * corner_radius and "border_oval_2" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_2_a") and (not width > 2 * corner_radius or "border_oval_2" in exclude_parts):
-                    self._canvas.delete("border_oval_2_a", "border_oval_2_b")
-
-                if not self._canvas.find_withtag("border_oval_3_a") and height > 2 * corner_radius \
-                    and width > 2 * corner_radius and "border_oval_3" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_3_a") and (not (height > 2 * corner_radius
-                                                                            and width > 2 * corner_radius) or "border_oval_3" in exclude_parts):
-                    self._canvas.delete("border_oval_3_a", "border_oval_3_b")
-
-                if not self._canvas.find_withtag("border_oval_4_a") and height > 2 * corner_radius and "border_oval_4" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_a", "border_corner_part", "border_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_b", "border_corner_part", "border_parts"), anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_4_a") and (not height > 2 * corner_radius or "border_oval_4" in exclude_parts):
-                    self._canvas.delete("border_oval_4_a", "border_oval_4_b")
-
-                # change position of border corner parts
-                self._canvas.coords("border_oval_1_a", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_1_b", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_a", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_b", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_a", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_b", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_a", corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_b", corner_radius, height - corner_radius, corner_radius)
+                # border corner parts, but only if needed, and delete if not needed
+                parts += self.__aa_circle_parts("border_oval_1", ("border_corner_part", "border_parts"), corner_radius, corner_radius, corner_radius)
 
-            else:
-                self._canvas.delete("border_corner_part")  # delete border corner parts if not needed
+                if width > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_2", ("border_corner_part", "border_parts"), width - corner_radius, corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_2_a", "border_oval_2_b"]
+
+                if height > 2 * corner_radius and width > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_3", ("border_corner_part", "border_parts"), width - corner_radius, height - corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_3_a", "border_oval_3_b"]
 
-            # create canvas border rectangle parts if not already created
-            if not self._canvas.find_withtag("border_rectangle_1"):
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_1", "border_rectangle_part", "border_parts"), width=0)
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_2", "border_rectangle_part", "border_parts"), width=0)
-                requires_recoloring = True
+                if height > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_4", ("border_corner_part", "border_parts"), corner_radius, height - corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_4_a", "border_oval_4_b"]
 
-            # change position of border rectangle parts
-            self._canvas.coords("border_rectangle_1", (0, corner_radius, width, height - corner_radius))
-            self._canvas.coords("border_rectangle_2", (corner_radius, 0, width - corner_radius, height))
+            else:
+                deleted_tags.append("border_corner_part")  # delete border corner parts if not needed
+
+            # border rectangle parts
+            parts += [self.__part("border_rectangle_1", "rectangle", ("border_rectangle_part", "border_parts"), (0, corner_radius, width, height - corner_radius), width=0),
+                      self.__part("border_rectangle_2", "rectangle", ("border_rectangle_part", "border_parts"), (corner_radius, 0, width - corner_radius, height), width=0)]
 
         else:
-            self._canvas.delete("border_parts")
+            deleted_tags.append("border_parts")
 
         # create inner button parts
         if inner_corner_radius > 0:
 
-            # create canvas border corner parts if not already created, but only if they're needed and delete if not needed
-            if not self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" in exclude_parts:
-                self._canvas.delete("inner_oval_1_a", "inner_oval_1_b")
-
-            if not self._canvas.find_withtag("inner_oval_2_a") and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_2" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_2_a") and (not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts):
-                self._canvas.delete("inner_oval_2_a", "inner_oval_2_b")
-
-            if not self._canvas.find_withtag("inner_oval_3_a") and height - (2 * border_width) > 2 * inner_corner_radius \
-                and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_3" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_3_a") and (not (height - (2 * border_width) > 2 * inner_corner_radius
-                                                                       and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts):
-                self._canvas.delete("inner_oval_3_a", "inner_oval_3_b")
-
-            if not self._canvas.find_withtag("inner_oval_4_a") and height - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_4" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_a", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_b", "inner_corner_part", "inner_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_4_a") and (not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts):
-                self._canvas.delete("inner_oval_4_a", "inner_oval_4_b")
-
-            # change position of border corner parts
-            self._canvas.coords("inner_oval_1_a", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_1_b", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_a", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_b", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_a", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_b", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_a", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_b", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            # inner corner parts, but only if they're needed and delete if not needed
+            parts += self.__aa_circle_parts("inner_oval_1", ("inner_corner_part", "inner_parts"),
+                                            border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
+
+            if width - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_2", ("inner_corner_part", "inner_parts"),
+                                                width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_2_a", "inner_oval_2_b"]
+
+            if height - (2 * border_width) > 2 * inner_corner_radius and width - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_3", ("inner_corner_part", "inner_parts"),
+                                                width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_3_a", "inner_oval_3_b"]
+
+            if height - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_4", ("inner_corner_part", "inner_parts"),
+                                                border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_4_a", "inner_oval_4_b"]
         else:
-            self._canvas.delete("inner_corner_part")  # delete inner corner parts if not needed
-
-        # create canvas inner rectangle parts if not already created
-        if not self._canvas.find_withtag("inner_rectangle_1"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_1", "inner_rectangle_part", "inner_parts"), width=0)
-            requires_recoloring = True
-
-        if not self._canvas.find_withtag("inner_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_2", "inner_rectangle_part", "inner_parts"), width=0)
-            requires_recoloring = True
-
-        elif self._canvas.find_withtag("inner_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("inner_rectangle_2")
-
-        # change position of inner rectangle parts
-        self._canvas.coords("inner_rectangle_1", (border_width + inner_corner_radius,
-                                                  border_width,
-                                                  width - border_width - inner_corner_radius,
-                                                  height - border_width))
-        self._canvas.coords("inner_rectangle_2", (border_width,
-                                                  border_width + inner_corner_radius,
-                                                  width - border_width,
-                                                  height - inner_corner_radius - border_width))
-
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_lower("inner_parts")
-            self._canvas.tag_lower("border_parts")
-            self._canvas.tag_lower("background_parts")
+            deleted_tags.append("inner_corner_part")  # delete inner corner parts if not needed
+
+        # inner rectangle parts
+        parts.append(self.__part("inner_rectangle_1", "rectangle", ("inner_rectangle_part", "inner_parts"),
+                                 (border_width + inner_corner_radius,
+                                  border_width,
+                                  width - border_width - inner_corner_radius,
+                                  height - border_width), width=0))
+
+        if inner_corner_radius * 2 < height - (border_width * 2):
+            parts.append(self.__part("inner_rectangle_2", "rectangle", ("inner_rectangle_part", "inner_parts"),
+                                     (border_width,
+                                      border_width + inner_corner_radius,
+                                      width - border_width,
+                                      height - inner_corner_radius - border_width), width=0))
+        else:
+            deleted_tags.append("inner_rectangle_2")
 
-        return requires_recoloring
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
 
-    def __draw_rounded_rect_with_border_circle_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> bool:
-        requires_recoloring = False
+    def __calc_rounded_rect_with_border_circle_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int) -> tuple:
+        border_parts, border_deleted_tags = [], []
+        inner_parts, inner_deleted_tags = [], []
 
         # border button parts
         if border_width > 0:
             if corner_radius > 0:
-
-                if not self._canvas.find_withtag("border_oval_1"):
-                    self._canvas.create_oval(0, 0, 0, 0, tags=("border_oval_1", "border_corner_part", "border_parts"), width=0)
-                    self._canvas.create_oval(0, 0, 0, 0, tags=("border_oval_2", "border_corner_part", "border_parts"), width=0)
-                    self._canvas.create_oval(0, 0, 0, 0, tags=("border_oval_3", "border_corner_part", "border_parts"), width=0)
-                    self._canvas.create_oval(0, 0, 0, 0, tags=("border_oval_4", "border_corner_part", "border_parts"), width=0)
-                    self._canvas.tag_lower("border_parts")
-                    requires_recoloring = True
-
-                self._canvas.coords("border_oval_1", 0, 0, corner_radius * 2 - 1, corner_radius * 2 - 1)
-                self._canvas.coords("border_oval_2", width - corner_radius * 2, 0, width - 1, corner_radius * 2 - 1)
-                self._canvas.coords("border_oval_3", 0, height - corner_radius * 2, corner_radius * 2 - 1, height - 1)
-                self._canvas.coords("border_oval_4", width - corner_radius * 2, height - corner_radius * 2, width - 1, height - 1)
-
+                border_parts += [self.__part("border_oval_1", "oval", ("border_corner_part", "border_parts"),
+                                             (0, 0, corner_radius * 2 - 1, corner_radius * 2 - 1), width=0),
+                                 self.__part("border_oval_2", "oval", ("border_corner_part", "border_parts"),
+                                             (width - corner_radius * 2, 0, width - 1, corner_radius * 2 - 1), width=0),
+                                 self.__part("border_oval_3", "oval", ("border_corner_part", "border_parts"),
+                                             (0, height - corner_radius * 2, corner_radius * 2 - 1, height - 1), width=0),
+                                 self.__part("border_oval_4", "oval", ("border_corner_part", "border_parts"),
+                                             (width - corner_radius * 2, height - corner_radius * 2, width - 1, height - 1), width=0)]
             else:
-                self._canvas.delete("border_corner_part")
+                border_deleted_tags.append("border_corner_part")
 
-            if not self._canvas.find_withtag("border_rectangle_1"):
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_1", "border_rectangle_part", "border_parts"), width=0)
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_2", "border_rectangle_part", "border_parts"), width=0)
-                self._canvas.tag_lower("border_parts")
-                requires_recoloring = True
-
-            self._canvas.coords("border_rectangle_1", (0, corner_radius, width, height - corner_radius))
-            self._canvas.coords("border_rectangle_2", (corner_radius, 0, width - corner_radius, height))
+            border_parts += [self.__part("border_rectangle_1", "rectangle", ("border_rectangle_part", "border_parts"), (0, corner_radius, width, height - corner_radius), width=0),
+                             self.__part("border_rectangle_2", "rectangle", ("border_rectangle_part", "border_parts"), (corner_radius, 0, width - corner_radius, height), width=0)]
 
         else:
-            self._canvas.delete("border_parts")
+            border_deleted_tags.append("border_parts")
 
         # inner button parts
         if inner_corner_radius > 0:
-
-            if not self._canvas.find_withtag("inner_oval_1"):
-                self._canvas.create_oval(0, 0, 0, 0, tags=("inner_oval_1", "inner_corner_part", "inner_parts"), width=0)
-                self._canvas.create_oval(0, 0, 0, 0, tags=("inner_oval_2", "inner_corner_part", "inner_parts"), width=0)
-                self._canvas.create_oval(0, 0, 0, 0, tags=("inner_oval_3", "inner_corner_part", "inner_parts"), width=0)
-                self._canvas.create_oval(0, 0, 0, 0, tags=("inner_oval_4", "inner_corner_part", "inner_parts"), width=0)
-                self._canvas.tag_raise("inner_parts")
-                requires_recoloring = True
-
-            self._canvas.coords("inner_oval_1", (border_width, border_width,
-                                                 border_width + inner_corner_radius * 2 - 1, border_width + inner_corner_radius * 2 - 1))
-            self._canvas.coords("inner_oval_2", (width - border_width - inner_corner_radius * 2, border_width,
-                                                 width - border_width - 1, border_width + inner_corner_radius * 2 - 1))
-            self._canvas.coords("inner_oval_3", (border_width, height - border_width - inner_corner_radius * 2,
-                                                 border_width + inner_corner_radius * 2 - 1, height - border_width - 1))
-            self._canvas.coords("inner_oval_4", (width - border_width - inner_corner_radius * 2, height - border_width - inner_corner_radius * 2,
-                                                 width - border_width - 1, height - border_width - 1))
+            inner_parts += [self.__part("inner_oval_1", "oval", ("inner_corner_part", "inner_parts"),
+                                        (border_width, border_width,
+                                         border_width + inner_corner_radius * 2 - 1, border_width + inner_corner_radius * 2 - 1), width=0),
+                            self.__part("inner_oval_2", "oval", ("inner_corner_part", "inner_parts"),
+                                        (width - border_width - inner_corner_radius * 2, border_width,
+                                         width - border_width - 1, border_width + inner_corner_radius * 2 - 1), width=0),
+                            self.__part("inner_oval_3", "oval", ("inner_corner_part", "inner_parts"),
+                                        (border_width, height - border_width - inner_corner_radius * 2,
+                                         border_width + inner_corner_radius * 2 - 1, height - border_width - 1), width=0),
+                            self.__part("inner_oval_4", "oval", ("inner_corner_part", "inner_parts"),
+                                        (width - border_width - inner_corner_radius * 2, height - border_width - inner_corner_radius * 2,
+                                         width - border_width - 1, height - border_width - 1), width=0)]
         else:
-            self._canvas.delete("inner_corner_part")  # delete inner corner parts if not needed
-
-        if not self._canvas.find_withtag("inner_rectangle_1"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_1", "inner_rectangle_part", "inner_parts"), width=0)
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_2", "inner_rectangle_part", "inner_parts"), width=0)
-            self._canvas.tag_raise("inner_parts")
-            requires_recoloring = True
-
-        self._canvas.coords("inner_rectangle_1", (border_width + inner_corner_radius,
-                                                  border_width,
-                                                  width - border_width - inner_corner_radius,
-                                                  height - border_width))
-        self._canvas.coords("inner_rectangle_2", (border_width,
-                                                  border_width + inner_corner_radius,
-                                                  width - border_width,
-                                                  height - inner_corner_radius - border_width))
-
-        return requires_recoloring
+            inner_deleted_tags.append("inner_corner_part")  # delete inner corner parts if not needed
+
+        inner_parts += [self.__part("inner_rectangle_1", "rectangle", ("inner_rectangle_part", "inner_parts"),
+                                    (border_width + inner_corner_radius,
+                                     border_width,
+                                     width - border_width - inner_corner_radius,
+                                     height - border_width), width=0),
+                        self.__part("inner_rectangle_2", "rectangle", ("inner_rectangle_part", "inner_parts"),
+                                    (border_width,
+                                     border_width + inner_corner_radius,
+                                     width - border_width,
+                                     height - inner_corner_radius - border_width), width=0)]
+
+        return ((tuple(border_parts), tuple(border_deleted_tags), (("tag_lower", ("border_parts",)),), False),
+                (tuple(inner_parts), tuple(inner_deleted_tags), (("tag_raise", ("inner_parts",)),), False))
 
     def draw_rounded_rect_with_border_vertical_split(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
                                                      border_width: Union[float, int], left_section_width: Union[float, int]) -> bool:
@@ -405,6 +436,11 @@ class DrawEngine:
 
             returns bool if recoloring is necessary """
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_rounded_rect_with_border_vertical_split, width, height, corner_radius,
+                                                          border_width, left_section_width))
+
+    def __calc_rounded_rect_with_border_vertical_split(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                                       border_width: Union[float, int], left_section_width: Union[float, int]) -> tuple:
         left_section_width = round(left_section_width)
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round (floor) _current_width and _current_height and restrict them to even values only
@@ -428,267 +464,212 @@ class DrawEngine:
         elif left_section_width < corner_radius * 2:
             left_section_width = corner_radius * 2
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_rect_with_border_vertical_split_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width)
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            return self.__calc_rounded_rect_with_border_vertical_split_image_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width),
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            return self.__calc_rounded_rect_with_border_vertical_split_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width),
         elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_rect_with_border_vertical_split_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width, ())
+            return self.__calc_rounded_rect_with_border_vertical_split_font_shapes(width, height, corner_radius, border_width, inner_corner_radius, left_section_width),
+        else:
+            return ()
 
-    def __draw_rounded_rect_with_border_vertical_split_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                                      left_section_width: int) -> bool:
-        requires_recoloring = False
+    def __calc_rounded_rect_with_border_vertical_split_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                      left_section_width: int) -> tuple:
+        parts, deleted_tags = [], []
 
         # create border button parts (only if border exists)
         if border_width > 0:
-            if not self._canvas.find_withtag("border_parts"):
-                self._canvas.create_polygon((0, 0, 0, 0), tags=("border_line_left_1", "border_parts_left", "border_parts", "left_parts"))
-                self._canvas.create_polygon((0, 0, 0, 0), tags=("border_line_right_1", "border_parts_right", "border_parts", "right_parts"))
-                self._canvas.create_rectangle((0, 0, 0, 0), tags=("border_rect_left_1", "border_parts_left", "border_parts", "left_parts"), width=0)
-                self._canvas.create_rectangle((0, 0, 0, 0), tags=("border_rect_right_1", "border_parts_right", "border_parts", "right_parts"), width=0)
-                requires_recoloring = True
-
-            self._canvas.coords("border_line_left_1",
-                                (corner_radius,
-                                 corner_radius,
-                                 left_section_width - corner_radius,
-                                 corner_radius,
-                                 left_section_width - corner_radius,
-                                 height - corner_radius,
-                                 corner_radius,
-                                 height - corner_radius))
-            self._canvas.coords("border_line_right_1",
-                                (left_section_width + corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 corner_radius,
-                                 width - corner_radius,
-                                 height - corner_radius,
-                                 left_section_width + corner_radius,
-                                 height - corner_radius))
-            self._canvas.coords("border_rect_left_1",
-                                (left_section_width - corner_radius,
-                                 0,
-                                 left_section_width,
-                                 height))
-            self._canvas.coords("border_rect_right_1",
-                                (left_section_width,
-                                 0,
-                                 left_section_width + corner_radius,
-                                 height))
-            self._canvas.itemconfig("border_line_left_1", joinstyle=tkinter.ROUND, width=corner_radius * 2)
-            self._canvas.itemconfig("border_line_right_1", joinstyle=tkinter.ROUND, width=corner_radius * 2)
+            parts += [self.__part("border_line_left_1", "polygon", ("border_parts_left", "border_parts", "left_parts"),
+                                  (corner_radius,
+                                   corner_radius,
+                                   left_section_width - corner_radius,
+                                   corner_radius,
+                                   left_section_width - corner_radius,
+                                   height - corner_radius,
+                                   corner_radius,
+                                   height - corner_radius),
+                                  {"joinstyle": tkinter.ROUND, "width": corner_radius * 2}),
+                      self.__part("border_line_right_1", "polygon", ("border_parts_right", "border_parts", "right_parts"),
+                                  (left_section_width + corner_radius,
+                                   corner_radius,
+                                   width - corner_radius,
+                                   corner_radius,
+                                   width - corner_radius,
+                                   height - corner_radius,
+                                   left_section_width + corner_radius,
+                                   height - corner_radius),
+                                  {"joinstyle": tkinter.ROUND, "width": corner_radius * 2}),
+                      self.__part("border_rect_left_1", "rectangle", ("border_parts_left", "border_parts", "left_parts"),
+                                  (left_section_width - corner_radius,
+                                   0,
+                                   left_section_width,
+                                   height), width=0),
+                      self.__part("border_rect_right_1", "rectangle", ("border_parts_right", "border_parts", "right_parts"),
+                                  (left_section_width,
+                                   0,
+                                   left_section_width + corner_radius,
+                                   height), width=0)]
 
         else:
-            self._canvas.delete("border_parts")
+            deleted_tags.append("border_parts")
 
         # create inner button parts
-        if not self._canvas.find_withtag("inner_parts"):
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("inner_line_left_1", "inner_parts_left", "inner_parts", "left_parts"), joinstyle=tkinter.ROUND)
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("inner_line_right_1", "inner_parts_right", "inner_parts", "right_parts"), joinstyle=tkinter.ROUND)
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("inner_rect_left_1", "inner_parts_left", "inner_parts", "left_parts"), width=0)
-            self._canvas.create_rectangle((0, 0, 0, 0), tags=("inner_rect_right_1", "inner_parts_right", "inner_parts", "right_parts"), width=0)
-            requires_recoloring = True
-
-        self._canvas.coords("inner_line_left_1",
-                            corner_radius,
-                            corner_radius,
-                            left_section_width - inner_corner_radius,
-                            corner_radius,
-                            left_section_width - inner_corner_radius,
-                            height - corner_radius,
-                            corner_radius,
-                            height - corner_radius)
-        self._canvas.coords("inner_line_right_1",
-                            left_section_width + inner_corner_radius,
-                            corner_radius,
-                            width - corner_radius,
-                            corner_radius,
-                            width - corner_radius,
-                            height - corner_radius,
-                            left_section_width + inner_corner_radius,
-                            height - corner_radius)
-        self._canvas.coords("inner_rect_left_1",
-                            (left_section_width - inner_corner_radius,
-                             border_width,
-                             left_section_width,
-                             height - border_width))
-        self._canvas.coords("inner_rect_right_1",
-                            (left_section_width,
-                             border_width,
-                             left_section_width + inner_corner_radius,
-                             height - border_width))
-        self._canvas.itemconfig("inner_line_left_1", width=inner_corner_radius * 2)
-        self._canvas.itemconfig("inner_line_right_1", width=inner_corner_radius * 2)
-
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_lower("inner_parts")
-            self._canvas.tag_lower("border_parts")
-            self._canvas.tag_lower("background_parts")
+        parts += [self.__part("inner_line_left_1", "polygon", ("inner_parts_left", "inner_parts", "left_parts"),
+                              (corner_radius,
+                               corner_radius,
+                               left_section_width - inner_corner_radius,
+                               corner_radius,
+                               left_section_width - inner_corner_radius,
+                               height - corner_radius,
+                               corner_radius,
+                               height - corner_radius),
+                              {"width": inner_corner_radius * 2}, joinstyle=tkinter.ROUND),
+                  self.__part("inner_line_right_1", "polygon", ("inner_parts_right", "inner_parts", "right_parts"),
+                              (left_section_width + inner_corner_radius,
+                               corner_radius,
+                               width - corner_radius,
+                               corner_radius,
+                               width - corner_radius,
+                               height - corner_radius,
+                               left_section_width + inner_corner_radius,
+                               height - corner_radius),
+                              {"width": inner_corner_radius * 2}, joinstyle=tkinter.ROUND),
+                  self.__part("inner_rect_left_1", "rectangle", ("inner_parts_left", "inner_parts", "left_parts"),
+                              (left_section_width - inner_corner_radius,
+                               border_width,
+                               left_section_width,
+                               height - border_width), width=0),
+                  self.__part("inner_rect_right_1", "rectangle", ("inner_parts_right", "inner_parts", "right_parts"),
+                              (left_section_width,
+                               border_width,
+                               left_section_width + inner_corner_radius,
+                               height - border_width), width=0)]
+
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
+
+    def __calc_rounded_rect_with_border_vertical_split_image_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                    left_section_width: int) -> tuple:
+        width, height = round(width), round(height)
+        parts, deleted_tags = [], []
+        left_corners, right_corners = (True, False, False, True), (False, True, True, False)
 
-        return requires_recoloring
+        if border_width > 0:
+            parts += [self.__part("border_image_left_1", "image_shape", ("border_parts_left", "border_parts", "left_parts"), (0, 0),
+                                  {"shape": ("rounded_rect", left_section_width, height, corner_radius, left_corners)}),
+                      self.__part("border_image_right_1", "image_shape", ("border_parts_right", "border_parts", "right_parts"), (left_section_width, 0),
+                                  {"shape": ("rounded_rect", width - left_section_width, height, corner_radius, right_corners)})]
+        else:
+            deleted_tags.append("border_parts")
 
-    def __draw_rounded_rect_with_border_vertical_split_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                                   left_section_width: int, exclude_parts: tuple) -> bool:
-        requires_recoloring = False
+        parts += [self.__part("inner_image_left_1", "image_shape", ("inner_parts_left", "inner_parts", "left_parts"), (border_width, border_width),
+                              {"shape": ("rounded_rect", left_section_width - border_width, height - 2 * border_width, inner_corner_radius, left_corners)}),
+                  self.__part("inner_image_right_1", "image_shape", ("inner_parts_right", "inner_parts", "right_parts"), (left_section_width, border_width),
+                              {"shape": ("rounded_rect", width - border_width - left_section_width, height - 2 * border_width, inner_corner_radius, right_corners)})]
+
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
+
+    def __calc_rounded_rect_with_border_vertical_split_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                   left_section_width: int) -> tuple:
+        parts, deleted_tags = [], []
 
         # create border button parts
         if border_width > 0:
             if corner_radius > 0:
-                # create canvas border corner parts if not already created, but only if needed, and delete if not needed
-                if not self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_a", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_1_b", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER,
-                                                  angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_1_a") and "border_oval_1" in exclude_parts:
-                    self._canvas.delete("border_oval_1_a", "border_oval_1_b")
-
-                if not self._canvas.find_withtag("border_oval_2_a") and width > 2 * corner_radius and "border_oval_2" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_a", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
-                                                  anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_2_b", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
-                                                  anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_2_a") and (not width > 2 * corner_radius or "border_oval_2" in exclude_parts):
-                    self._canvas.delete("border_oval_2_a", "border_oval_2_b")
-
-                if not self._canvas.find_withtag("border_oval_3_a") and height > 2 * corner_radius \
-                    and width > 2 * corner_radius and "border_oval_3" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_a", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
-                                                  anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_3_b", "border_corner_part", "border_parts_right", "border_parts", "right_parts"),
-                                                  anchor=tkinter.CENTER, angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_3_a") and (not (height > 2 * corner_radius
-                                                                            and width > 2 * corner_radius) or "border_oval_3" in exclude_parts):
-                    self._canvas.delete("border_oval_3_a", "border_oval_3_b")
-
-                if not self._canvas.find_withtag("border_oval_4_a") and height > 2 * corner_radius and "border_oval_4" not in exclude_parts:
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_a", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER)
-                    self._canvas.create_aa_circle(0, 0, 0, tags=("border_oval_4_b", "border_corner_part", "border_parts_left", "border_parts", "left_parts"), anchor=tkinter.CENTER,
-                                                  angle=180)
-                    requires_recoloring = True
-                elif self._canvas.find_withtag("border_oval_4_a") and (not height > 2 * corner_radius or "border_oval_4" in exclude_parts):
-                    self._canvas.delete("border_oval_4_a", "border_oval_4_b")
-
-                # change position of border corner parts
-                self._canvas.coords("border_oval_1_a", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_1_b", corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_a", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_2_b", width - corner_radius, corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_a", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_3_b", width - corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_a", corner_radius, height - corner_radius, corner_radius)
-                self._canvas.coords("border_oval_4_b", corner_radius, height - corner_radius, corner_radius)
+                # border corner parts, but only if needed, and delete if not needed
+                parts += self.__aa_circle_parts("border_oval_1", ("border_corner_part", "border_parts_left", "border_parts", "left_parts"),
+                                                corner_radius, corner_radius, corner_radius)
+
+                if width > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_2", ("border_corner_part", "border_parts_right", "border_parts", "right_parts"),
+                                                    width - corner_radius, corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_2_a", "border_oval_2_b"]
+
+                if height > 2 * corner_radius and width > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_3", ("border_corner_part", "border_parts_right", "border_parts", "right_parts"),
+                                                    width - corner_radius, height - corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_3_a", "border_oval_3_b"]
+
+                if height > 2 * corner_radius:
+                    parts += self.__aa_circle_parts("border_oval_4", ("border_corner_part", "border_parts_left", "border_parts", "left_parts"),
+                                                    corner_radius, height - corner_radius, corner_radius)
+                else:
+                    deleted_tags += ["border_oval_4_a", "border_oval_4_b"]
 
             else:
-                self._canvas.delete("border_corner_part")  # delete border corner parts if not needed
-
-            # create canvas border rectangle parts if not already created
-            if not self._canvas.find_withtag("border_rectangle_1"):
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_left_1", "border_rectangle_part", "border_parts_left", "border_parts", "left_parts"), width=0)
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_left_2", "border_rectangle_part", "border_parts_left", "border_parts", "left_parts"), width=0)
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_right_1", "border_rectangle_part", "border_parts_right", "border_parts", "right_parts"), width=0)
-                self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_right_2", "border_rectangle_part", "border_parts_right", "border_parts", "right_parts"), width=0)
-                requires_recoloring = True
-
-            # change position of border rectangle parts
-            self._canvas.coords("border_rectangle_left_1", (0, corner_radius, left_section_width, height - corner_radius))
-            self._canvas.coords("border_rectangle_left_2", (corner_radius, 0, left_section_width, height))
-            self._canvas.coords("border_rectangle_right_1", (left_section_width, corner_radius, width, height - corner_radius))
-            self._canvas.coords("border_rectangle_right_2", (left_section_width, 0, width - corner_radius, height))
+                deleted_tags.append("border_corner_part")  # delete border corner parts if not needed
+
+            # border rectangle parts
+            parts += [self.__part("border_rectangle_left_1", "rectangle", ("border_rectangle_part", "border_parts_left", "border_parts", "left_parts"),
+                                  (0, corner_radius, left_section_width, height - corner_radius), width=0),
+                      self.__part("border_rectangle_left_2", "rectangle", ("border_rectangle_part", "border_parts_left", "border_parts", "left_parts"),
+                                  (corner_radius, 0, left_section_width, height), width=0),
+                      self.__part("border_rectangle_right_1", "rectangle", ("border_rectangle_part", "border_parts_right", "border_parts", "right_parts"),
+                                  (left_section_width, corner_radius, width, height - corner_radius), width=0),
+                      self.__part("border_rectangle_right_2", "rectangle", ("border_rectangle_part", "border_parts_right", "border_parts", "right_parts"),
+                                  (left_section_width, 0, width - corner_radius, height), width=0)]
 
         else:
-            self._canvas.delete("border_parts")
+            deleted_tags.append("border_parts")
 
         # create inner button parts
         if inner_corner_radius > 0:
 
-            # create canvas border corner parts if not already created, but only if they're needed and delete if not needed
-            if not self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_a", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_1_b", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER,
-                                              angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_1_a") and "inner_oval_1" in exclude_parts:
-                self._canvas.delete("inner_oval_1_a", "inner_oval_1_b")
-
-            if not self._canvas.find_withtag("inner_oval_2_a") and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_2" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_a", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_2_b", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER,
-                                              angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_2_a") and (not width - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_2" in exclude_parts):
-                self._canvas.delete("inner_oval_2_a", "inner_oval_2_b")
-
-            if not self._canvas.find_withtag("inner_oval_3_a") and height - (2 * border_width) > 2 * inner_corner_radius \
-                and width - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_3" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_a", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_3_b", "inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"), anchor=tkinter.CENTER,
-                                              angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_3_a") and (not (height - (2 * border_width) > 2 * inner_corner_radius
-                                                                       and width - (2 * border_width) > 2 * inner_corner_radius) or "inner_oval_3" in exclude_parts):
-                self._canvas.delete("inner_oval_3_a", "inner_oval_3_b")
-
-            if not self._canvas.find_withtag("inner_oval_4_a") and height - (2 * border_width) > 2 * inner_corner_radius and "inner_oval_4" not in exclude_parts:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_a", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("inner_oval_4_b", "inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"), anchor=tkinter.CENTER,
-                                              angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("inner_oval_4_a") and (not height - (2 * border_width) > 2 * inner_corner_radius or "inner_oval_4" in exclude_parts):
-                self._canvas.delete("inner_oval_4_a", "inner_oval_4_b")
-
-            # change position of border corner parts
-            self._canvas.coords("inner_oval_1_a", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_1_b", border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_a", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_2_b", width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_a", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_3_b", width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_a", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("inner_oval_4_b", border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            # inner corner parts, but only if they're needed and delete if not needed
+            parts += self.__aa_circle_parts("inner_oval_1", ("inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"),
+                                            border_width + inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
+
+            if width - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_2", ("inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"),
+                                                width - border_width - inner_corner_radius, border_width + inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_2_a", "inner_oval_2_b"]
+
+            if height - (2 * border_width) > 2 * inner_corner_radius and width - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_3", ("inner_corner_part", "inner_parts_right", "inner_parts", "right_parts"),
+                                                width - border_width - inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_3_a", "inner_oval_3_b"]
+
+            if height - (2 * border_width) > 2 * inner_corner_radius:
+                parts += self.__aa_circle_parts("inner_oval_4", ("inner_corner_part", "inner_parts_left", "inner_parts", "left_parts"),
+                                                border_width + inner_corner_radius, height - border_width - inner_corner_radius, inner_corner_radius)
+            else:
+                deleted_tags += ["inner_oval_4_a", "inner_oval_4_b"]
+        else:
+            deleted_tags.append("inner_corner_part")  # delete inner corner parts if not needed
+
+        # inner rectangle parts
+        parts += [self.__part("inner_rectangle_left_1", "rectangle", ("inner_rectangle_part", "inner_parts_left", "inner_parts", "left_parts"),
+                              (border_width + inner_corner_radius,
+                               border_width,
+                               left_section_width,
+                               height - border_width), width=0),
+                  self.__part("inner_rectangle_right_1", "rectangle", ("inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"),
+                              (left_section_width,
+                               border_width,
+                               width - border_width - inner_corner_radius,
+                               height - border_width), width=0)]
+
+        if inner_corner_radius * 2 < height - (border_width * 2):
+            parts += [self.__part("inner_rectangle_left_2", "rectangle", ("inner_rectangle_part", "inner_parts_left", "inner_parts", "left_parts"),
+                                  (border_width,
+                                   border_width + inner_corner_radius,
+                                   left_section_width,
+                                   height - inner_corner_radius - border_width), width=0),
+                      self.__part("inner_rectangle_right_2", "rectangle", ("inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"),
+                                  (left_section_width,
+                                   border_width + inner_corner_radius,
+                                   width - border_width,
+                                   height - inner_corner_radius - border_width), width=0)]
         else:
-            self._canvas.delete("inner_corner_part")  # delete inner corner parts if not needed
-
-        # create canvas inner rectangle parts if not already created
-        if not self._canvas.find_withtag("inner_rectangle_1"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_left_1", "inner_rectangle_part", "inner_parts_left", "inner_parts", "left_parts"), width=0)
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_right_1", "inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"), width=0)
-            requires_recoloring = True
-
-        if not self._canvas.find_withtag("inner_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_left_2", "inner_rectangle_part", "inner_parts_left", "inner_parts", "left_parts"), width=0)
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("inner_rectangle_right_2", "inner_rectangle_part", "inner_parts_right", "inner_parts", "right_parts"), width=0)
-            requires_recoloring = True
-
-        elif self._canvas.find_withtag("inner_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("inner_rectangle_left_2")
-            self._canvas.delete("inner_rectangle_right_2")
-
-        # change position of inner rectangle parts
-        self._canvas.coords("inner_rectangle_left_1", (border_width + inner_corner_radius,
-                                                       border_width,
-                                                       left_section_width,
-                                                       height - border_width))
-        self._canvas.coords("inner_rectangle_left_2", (border_width,
-                                                       border_width + inner_corner_radius,
-                                                       left_section_width,
-                                                       height - inner_corner_radius - border_width))
-        self._canvas.coords("inner_rectangle_right_1", (left_section_width,
-                                                        border_width,
-                                                        width - border_width - inner_corner_radius,
-                                                        height - border_width))
-        self._canvas.coords("inner_rectangle_right_2", (left_section_width,
-                                                        border_width + inner_corner_radius,
-                                                        width - border_width,
-                                                        height - inner_corner_radius - border_width))
-
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_lower("inner_parts")
-            self._canvas.tag_lower("border_parts")
-            self._canvas.tag_lower("background_parts")
+            deleted_tags += ["inner_rectangle_left_2", "inner_rectangle_right_2"]
 
-        return requires_recoloring
+        z_order_operations = (("tag_lower", ("inner_parts",)), ("tag_lower", ("border_parts",)), ("tag_lower", ("background_parts",)))
+        return tuple(parts), tuple(deleted_tags), z_order_operations, False
 
     def draw_rounded_progress_bar_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
                                               border_width: Union[float, int], progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
@@ -698,6 +679,11 @@ class DrawEngine:
 
             returns bool if recoloring is necessary """
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_rounded_progress_bar_with_border, width, height, corner_radius,
+                                                          border_width, progress_value_1, progress_value_2, orientation))
+
+    def __calc_rounded_progress_bar_with_border(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                                border_width: Union[float, int], progress_value_1: float, progress_value_2: float, orientation: str) -> tuple:
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round _current_width and _current_height and restrict them to even values only
         if self._round_height_to_even_numbers:
@@ -714,164 +700,156 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            return self.__calc_rounded_progress_bar_with_border_image_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                             progress_value_1, progress_value_2, orientation)
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            return self.__calc_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
                                                                                progress_value_1, progress_value_2, orientation)
         elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+            return self.__calc_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
                                                                             progress_value_1, progress_value_2, orientation)
+        else:
+            return ()
 
-    def __draw_rounded_progress_bar_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                               progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
+    def __calc_rounded_progress_bar_with_border_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                               progress_value_1: float, progress_value_2: float, orientation: str) -> tuple:
 
-        requires_recoloring = self.__draw_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+        rect_section = self.__calc_rounded_rect_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius)
 
-        if corner_radius <= border_width:
-            bottom_right_shift = 0  # weird canvas rendering inaccuracy that has to be corrected in some cases
+        if orientation == "w":
+            progress_coords = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
+                               border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
+                               border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
+                               height - (border_width + inner_corner_radius),
+                               border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
+                               height - (border_width + inner_corner_radius))
+
+        elif orientation == "s":
+            progress_coords = (border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
+                               width - (border_width + inner_corner_radius),
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
+                               width - (border_width + inner_corner_radius),
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1),
+                               border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
         else:
-            bottom_right_shift = 0
+            progress_coords = None
 
-        # create progress parts
-        if not self._canvas.find_withtag("progress_parts"):
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("progress_line_1", "progress_parts"), joinstyle=tkinter.ROUND)
-            self._canvas.tag_raise("progress_parts", "inner_parts")
-            requires_recoloring = True
+        # progress parts
+        parts = (self.__part("progress_line_1", "polygon", ("progress_parts",), progress_coords, {"width": inner_corner_radius * 2}, joinstyle=tkinter.ROUND),)
+        progress_section = parts, (), (("tag_raise", ("progress_parts", "inner_parts")),), False
 
-        if orientation == "w":
-            self._canvas.coords("progress_line_1",
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                height - (border_width + inner_corner_radius) + bottom_right_shift,
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                height - (border_width + inner_corner_radius) + bottom_right_shift)
+        return rect_section, progress_section
+
+    def __calc_rounded_progress_bar_with_border_image_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                             progress_value_1: float, progress_value_2: float, orientation: str) -> tuple:
 
+        rect_section = self.__calc_rounded_rect_with_border_image_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+
+        if orientation == "w":
+            x_1 = round(border_width + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1)
+            x_2 = round(border_width + 2 * inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2)
+            progress_coords = (x_1, border_width)
+            progress_shape = ("rounded_rect", x_2 - x_1, round(height) - 2 * border_width, inner_corner_radius, (True, True, True, True))
         elif orientation == "s":
-            self._canvas.coords("progress_line_1",
-                                border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
-                                width - (border_width + inner_corner_radius),
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
-                                width - (border_width + inner_corner_radius),
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1),
-                                border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
-
-        self._canvas.itemconfig("progress_line_1", width=inner_corner_radius * 2)
+            y_1 = round(border_width + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2))
+            y_2 = round(border_width + 2 * inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
+            progress_coords = (border_width, y_1)
+            progress_shape = ("rounded_rect", round(width) - 2 * border_width, y_2 - y_1, inner_corner_radius, (True, True, True, True))
+        else:
+            progress_coords, progress_shape = None, None
 
-        return requires_recoloring
+        parts = (self.__part("progress_image_1", "image_shape", ("progress_parts",), progress_coords,
+                             None if progress_shape is None else {"shape": progress_shape}),)
+        progress_section = parts, (), (("tag_raise", ("progress_parts", "inner_parts")),), False
 
-    def __draw_rounded_progress_bar_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                            progress_value_1: float, progress_value_2: float, orientation: str) -> bool:
+        return rect_section, progress_section
 
-        requires_recoloring, requires_recoloring_2 = False, False
+    def __calc_rounded_progress_bar_with_border_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                            progress_value_1: float, progress_value_2: float, orientation: str) -> tuple:
+        parts, deleted_tags = [], []
 
-        if inner_corner_radius > 0:
-            # create canvas border corner parts if not already created
-            if not self._canvas.find_withtag("progress_oval_1_a"):
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_1_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_1_b", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER, angle=180)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_2_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_2_b", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-
-            if not self._canvas.find_withtag("progress_oval_3_a") and round(inner_corner_radius) * 2 < height - 2 * border_width:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_3_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_3_b", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER, angle=180)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_4_a", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("progress_oval_4_b", "progress_corner_part", "progress_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("progress_oval_3_a") and not round(inner_corner_radius) * 2 < height - 2 * border_width:
-                self._canvas.delete("progress_oval_3_a", "progress_oval_3_b", "progress_oval_4_a", "progress_oval_4_b")
-
-        if not self._canvas.find_withtag("progress_rectangle_1"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_1", "progress_rectangle_part", "progress_parts"), width=0)
-            requires_recoloring = True
-
-        if not self._canvas.find_withtag("progress_rectangle_2") and inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("progress_rectangle_2", "progress_rectangle_part", "progress_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("progress_rectangle_2") and not inner_corner_radius * 2 < height - (border_width * 2):
-            self._canvas.delete("progress_rectangle_2")
-
-        # horizontal orientation from the bottom
+        # horizontal orientation from the left
         if orientation == "w":
-            requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                     ())
-
-            # set positions of progress corner parts
-            self._canvas.coords("progress_oval_1_a", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_1_b", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_2_a", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_2_b", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                border_width + inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_3_a", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_3_b", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_4_a", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                height - border_width - inner_corner_radius, inner_corner_radius)
-            self._canvas.coords("progress_oval_4_b", border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                height - border_width - inner_corner_radius, inner_corner_radius)
-
-            # set positions of progress rect parts
-            self._canvas.coords("progress_rectangle_1",
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
-                                border_width,
-                                border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
-                                height - border_width)
-            self._canvas.coords("progress_rectangle_2",
-                                border_width + 2 * inner_corner_radius + (width - 2 * inner_corner_radius - 2 * border_width) * progress_value_1,
-                                border_width + inner_corner_radius,
-                                border_width + 2 * inner_corner_radius + (width - 2 * inner_corner_radius - 2 * border_width) * progress_value_2,
-                                height - inner_corner_radius - border_width)
+            oval_1_position = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
+                               border_width + inner_corner_radius)
+            oval_2_position = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
+                               border_width + inner_corner_radius)
+            oval_3_position = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
+                               height - border_width - inner_corner_radius)
+            oval_4_position = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
+                               height - border_width - inner_corner_radius)
+
+            rectangle_1_coords = (border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_1,
+                                  border_width,
+                                  border_width + inner_corner_radius + (width - 2 * border_width - 2 * inner_corner_radius) * progress_value_2,
+                                  height - border_width)
+            rectangle_2_coords = (border_width + 2 * inner_corner_radius + (width - 2 * inner_corner_radius - 2 * border_width) * progress_value_1,
+                                  border_width + inner_corner_radius,
+                                  border_width + 2 * inner_corner_radius + (width - 2 * inner_corner_radius - 2 * border_width) * progress_value_2,
+                                  height - inner_corner_radius - border_width)
 
         # vertical orientation from the bottom
-        if orientation == "s":
-            requires_recoloring_2 = self.__draw_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                     ())
-
-            # set positions of progress corner parts
-            self._canvas.coords("progress_oval_1_a", border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2), inner_corner_radius)
-            self._canvas.coords("progress_oval_1_b", border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2), inner_corner_radius)
-            self._canvas.coords("progress_oval_2_a", width - border_width - inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2), inner_corner_radius)
-            self._canvas.coords("progress_oval_2_b", width - border_width - inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2), inner_corner_radius)
-            self._canvas.coords("progress_oval_3_a", width - border_width - inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1), inner_corner_radius)
-            self._canvas.coords("progress_oval_3_b", width - border_width - inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1), inner_corner_radius)
-            self._canvas.coords("progress_oval_4_a", border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1), inner_corner_radius)
-            self._canvas.coords("progress_oval_4_b", border_width + inner_corner_radius,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1), inner_corner_radius)
-
-            # set positions of progress rect parts
-            self._canvas.coords("progress_rectangle_1",
-                                border_width + inner_corner_radius,
-                                border_width + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
-                                width - border_width - inner_corner_radius,
-                                border_width + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
-            self._canvas.coords("progress_rectangle_2",
-                                border_width,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
-                                width - border_width,
-                                border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
-
-        return requires_recoloring or requires_recoloring_2
+        elif orientation == "s":
+            oval_1_position = (border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2))
+            oval_2_position = (width - border_width - inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2))
+            oval_3_position = (width - border_width - inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
+            oval_4_position = (border_width + inner_corner_radius,
+                               border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
+
+            rectangle_1_coords = (border_width + inner_corner_radius,
+                                  border_width + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
+                                  width - border_width - inner_corner_radius,
+                                  border_width + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
+            rectangle_2_coords = (border_width,
+                                  border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_2),
+                                  width - border_width,
+                                  border_width + inner_corner_radius + (height - 2 * border_width - 2 * inner_corner_radius) * (1 - progress_value_1))
+        else:
+            return ()
+
+        rect_section = self.__calc_rounded_rect_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius)
+
+        # progress corner parts
+        if inner_corner_radius > 0:
+            parts += self.__aa_circle_parts("progress_oval_1", ("progress_corner_part", "progress_parts"), *oval_1_position, inner_corner_radius)
+            parts += self.__aa_circle_parts("progress_oval_2", ("progress_corner_part", "progress_parts"), *oval_2_position, inner_corner_radius)
+
+            if round(inner_corner_radius) * 2 < height - 2 * border_width:
+                parts += self.__aa_circle_parts("progress_oval_3", ("progress_corner_part", "progress_parts"), *oval_3_position, inner_corner_radius)
+                parts += self.__aa_circle_parts("progress_oval_4", ("progress_corner_part", "progress_parts"), *oval_4_position, inner_corner_radius)
+            else:
+                deleted_tags += ["progress_oval_3_a", "progress_oval_3_b", "progress_oval_4_a", "progress_oval_4_b"]
+        else:
+            deleted_tags.append("progress_corner_part")
+
+        # progress rectangle parts
+        parts.append(self.__part("progress_rectangle_1", "rectangle", ("progress_rectangle_part", "progress_parts"), rectangle_1_coords, width=0))
+
+        if inner_corner_radius * 2 < height - (border_width * 2):
+            parts.append(self.__part("progress_rectangle_2", "rectangle", ("progress_rectangle_part", "progress_parts"), rectangle_2_coords, width=0))
+        else:
+            deleted_tags.append("progress_rectangle_2")
+
+        return rect_section, (tuple(parts), tuple(deleted_tags), (), False)
 
     def draw_rounded_slider_with_border_and_button(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
                                                    border_width: Union[float, int], button_length: Union[float, int], button_corner_radius: Union[float, int],
                                                    slider_value: float, orientation: str) -> bool:
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_rounded_slider_with_border_and_button, width, height, corner_radius,
+                                                          border_width, button_length, button_corner_radius, slider_value, orientation))
+
+    def __calc_rounded_slider_with_border_and_button(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                                     border_width: Union[float, int], button_length: Union[float, int], button_corner_radius: Union[float, int],
+                                                     slider_value: float, orientation: str) -> tuple:
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round _current_width and _current_height and restrict them to even values only
         if self._round_height_to_even_numbers:
@@ -893,144 +871,158 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_slider_with_border_and_button_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            return self.__calc_rounded_slider_with_border_and_button_image_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                  button_length, button_corner_radius, slider_value, orientation)
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            return self.__calc_rounded_slider_with_border_and_button_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
                                                                                     button_length, button_corner_radius, slider_value, orientation)
         elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_slider_with_border_and_button_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+            return self.__calc_rounded_slider_with_border_and_button_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
                                                                                  button_length, button_corner_radius, slider_value, orientation)
+        else:
+            return ()
 
-    def __draw_rounded_slider_with_border_and_button_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                                    button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> bool:
+    def __calc_rounded_slider_with_border_and_button_polygon_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                    button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> tuple:
 
         # draw normal progressbar
-        requires_recoloring = self.__draw_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                          0, slider_value, orientation)
+        progress_bar_sections = self.__calc_rounded_progress_bar_with_border_polygon_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                            0, slider_value, orientation)
 
-        # create slider button part
-        if not self._canvas.find_withtag("slider_parts"):
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("slider_line_1", "slider_parts"), joinstyle=tkinter.ROUND)
-            self._canvas.tag_raise("slider_parts")  # manage z-order
-            requires_recoloring = True
-
-        if corner_radius <= border_width:
-            bottom_right_shift = -1  # weird canvas rendering inaccuracy that has to be corrected in some cases
+        if orientation == "w":
+            slider_x_position = corner_radius + (button_length / 2) + (width - 2 * corner_radius - button_length) * slider_value
+            slider_coords = (slider_x_position - (button_length / 2), button_corner_radius,
+                             slider_x_position + (button_length / 2), button_corner_radius,
+                             slider_x_position + (button_length / 2), height - button_corner_radius,
+                             slider_x_position - (button_length / 2), height - button_corner_radius)
+            slider_options = {"width": button_corner_radius * 2}
+        elif orientation == "s":
+            slider_y_position = corner_radius + (button_length / 2) + (height - 2 * corner_radius - button_length) * (1 - slider_value)
+            slider_coords = (button_corner_radius, slider_y_position - (button_length / 2),
+                             button_corner_radius, slider_y_position + (button_length / 2),
+                             width - button_corner_radius, slider_y_position + (button_length / 2),
+                             width - button_corner_radius, slider_y_position - (button_length / 2))
+            slider_options = {"width": button_corner_radius * 2}
         else:
-            bottom_right_shift = 0
+            slider_coords, slider_options = None, None
+
+        # slider button part
+        parts = (self.__part("slider_line_1", "polygon", ("slider_parts",), slider_coords, slider_options, joinstyle=tkinter.ROUND),)
+        slider_section = parts, (), (("tag_raise", ("slider_parts",)),), False  # manage z-order
+
+        return progress_bar_sections + (slider_section,)
+
+    def __calc_rounded_slider_with_border_and_button_image_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                  button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> tuple:
+
+        # draw normal progressbar
+        progress_bar_sections = self.__calc_rounded_progress_bar_with_border_image_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                          0, slider_value, orientation)
 
         if orientation == "w":
             slider_x_position = corner_radius + (button_length / 2) + (width - 2 * corner_radius - button_length) * slider_value
-            self._canvas.coords("slider_line_1",
-                                slider_x_position - (button_length / 2), button_corner_radius,
-                                slider_x_position + (button_length / 2), button_corner_radius,
-                                slider_x_position + (button_length / 2), height - button_corner_radius,
-                                slider_x_position - (button_length / 2), height - button_corner_radius)
-            self._canvas.itemconfig("slider_line_1",
-                                    width=button_corner_radius * 2)
+            slider_coords = (round(slider_x_position - (button_length / 2) - button_corner_radius), 0)
+            slider_shape = ("rounded_rect", button_length + 2 * button_corner_radius, round(height), button_corner_radius, (True, True, True, True))
         elif orientation == "s":
             slider_y_position = corner_radius + (button_length / 2) + (height - 2 * corner_radius - button_length) * (1 - slider_value)
-            self._canvas.coords("slider_line_1",
-                                button_corner_radius, slider_y_position - (button_length / 2),
-                                button_corner_radius, slider_y_position + (button_length / 2),
-                                width - button_corner_radius, slider_y_position + (button_length / 2),
-                                width - button_corner_radius, slider_y_position - (button_length / 2))
-            self._canvas.itemconfig("slider_line_1",
-                                    width=button_corner_radius * 2)
+            slider_coords = (0, round(slider_y_position - (button_length / 2) - button_corner_radius))
+            slider_shape = ("rounded_rect", round(width), button_length + 2 * button_corner_radius, button_corner_radius, (True, True, True, True))
+        else:
+            slider_coords, slider_shape = None, None
 
-        return requires_recoloring
+        # slider button part
+        parts = (self.__part("slider_image_1", "image_shape", ("slider_parts",), slider_coords,
+                             None if slider_shape is None else {"shape": slider_shape}),)
+        slider_section = parts, (), (("tag_raise", ("slider_parts",)),), False  # manage z-order
 
-    def __draw_rounded_slider_with_border_and_button_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
-                                                                 button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> bool:
+        return progress_bar_sections + (slider_section,)
 
-        # draw normal progressbar
-        requires_recoloring = self.__draw_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
-                                                                                       0, slider_value, orientation)
+    def __calc_rounded_slider_with_border_and_button_font_shapes(self, width: int, height: int, corner_radius: int, border_width: int, inner_corner_radius: int,
+                                                                 button_length: int, button_corner_radius: int, slider_value: float, orientation: str) -> tuple:
 
-        # create 4 circles (if not needed, then less)
-        if not self._canvas.find_withtag("slider_oval_1_a"):
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_1_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_1_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
-            requires_recoloring = True
-
-        if not self._canvas.find_withtag("slider_oval_2_a") and button_length > 0:
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_2_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_2_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("slider_oval_2_a") and not button_length > 0:
-            self._canvas.delete("slider_oval_2_a", "slider_oval_2_b")
-
-        if not self._canvas.find_withtag("slider_oval_4_a") and height > 2 * button_corner_radius:
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_4_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_4_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("slider_oval_4_a") and not height > 2 * button_corner_radius:
-            self._canvas.delete("slider_oval_4_a", "slider_oval_4_b")
-
-        if not self._canvas.find_withtag("slider_oval_3_a") and button_length > 0 and height > 2 * button_corner_radius:
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_3_a", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER)
-            self._canvas.create_aa_circle(0, 0, 0, tags=("slider_oval_3_b", "slider_corner_part", "slider_parts"), anchor=tkinter.CENTER, angle=180)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("border_oval_3_a") and not (button_length > 0 and height > 2 * button_corner_radius):
-            self._canvas.delete("slider_oval_3_a", "slider_oval_3_b")
+        # draw normal progressbar
+        progress_bar_sections = self.__calc_rounded_progress_bar_with_border_font_shapes(width, height, corner_radius, border_width, inner_corner_radius,
+                                                                                         0, slider_value, orientation)
 
-        # create the 2 rectangles (if needed)
-        if not self._canvas.find_withtag("slider_rectangle_1") and button_length > 0:
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("slider_rectangle_1", "slider_rectangle_part", "slider_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("slider_rectangle_1") and not button_length > 0:
-            self._canvas.delete("slider_rectangle_1")
-
-        if not self._canvas.find_withtag("slider_rectangle_2") and height > 2 * button_corner_radius:
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("slider_rectangle_2", "slider_rectangle_part", "slider_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("slider_rectangle_2") and not height > 2 * button_corner_radius:
-            self._canvas.delete("slider_rectangle_2")
-
-        # set positions of circles and rectangles
+        # positions of circles and rectangles
         if orientation == "w":
             slider_x_position = corner_radius + (button_length / 2) + (width - 2 * corner_radius - button_length) * slider_value
-            self._canvas.coords("slider_oval_1_a", slider_x_position - (button_length / 2), button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_1_b", slider_x_position - (button_length / 2), button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_2_a", slider_x_position + (button_length / 2), button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_2_b", slider_x_position + (button_length / 2), button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_3_a", slider_x_position + (button_length / 2), height - button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_3_b", slider_x_position + (button_length / 2), height - button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_4_a", slider_x_position - (button_length / 2), height - button_corner_radius, button_corner_radius)
-            self._canvas.coords("slider_oval_4_b", slider_x_position - (button_length / 2), height - button_corner_radius, button_corner_radius)
-
-            self._canvas.coords("slider_rectangle_1",
-                                slider_x_position - (button_length / 2), 0,
-                                slider_x_position + (button_length / 2), height)
-            self._canvas.coords("slider_rectangle_2",
-                                slider_x_position - (button_length / 2) - button_corner_radius, button_corner_radius,
-                                slider_x_position + (button_length / 2) + button_corner_radius, height - button_corner_radius)
+            oval_1_position = (slider_x_position - (button_length / 2), button_corner_radius)
+            oval_2_position = (slider_x_position + (button_length / 2), button_corner_radius)
+            oval_3_position = (slider_x_position + (button_length / 2), height - button_corner_radius)
+            oval_4_position = (slider_x_position - (button_length / 2), height - button_corner_radius)
+
+            rectangle_1_coords = (slider_x_position - (button_length / 2), 0,
+                                  slider_x_position + (button_length / 2), height)
+            rectangle_2_coords = (slider_x_position - (button_length / 2) - button_corner_radius, button_corner_radius,
+                                  slider_x_position + (button_length / 2) + button_corner_radius, height - button_corner_radius)
 
         elif orientation == "s":
             slider_y_position = corner_radius + (button_length / 2) + (height - 2 * corner_radius - button_length) * (1 - slider_value)
-            self._canvas.coords("slider_oval_1_a", button_corner_radius, slider_y_position - (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_1_b", button_corner_radius, slider_y_position - (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_2_a", button_corner_radius, slider_y_position + (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_2_b", button_corner_radius, slider_y_position + (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_3_a", width - button_corner_radius, slider_y_position + (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_3_b", width - button_corner_radius, slider_y_position + (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_4_a", width - button_corner_radius, slider_y_position - (button_length / 2), button_corner_radius)
-            self._canvas.coords("slider_oval_4_b", width - button_corner_radius, slider_y_position - (button_length / 2), button_corner_radius)
-
-            self._canvas.coords("slider_rectangle_1",
-                                0, slider_y_position - (button_length / 2),
-                                width, slider_y_position + (button_length / 2))
-            self._canvas.coords("slider_rectangle_2",
-                                button_corner_radius, slider_y_position - (button_length / 2) - button_corner_radius,
-                                width - button_corner_radius, slider_y_position + (button_length / 2) + button_corner_radius)
-
-        if requires_recoloring:  # new parts were added -> manage z-order
-            self._canvas.tag_raise("slider_parts")
+            oval_1_position = (button_corner_radius, slider_y_position - (button_length / 2))
+            oval_2_position = (button_corner_radius, slider_y_position + (button_length / 2))
+            oval_3_position = (width - button_corner_radius, slider_y_position + (button_length / 2))
+            oval_4_position = (width - button_corner_radius, slider_y_position - (button_length / 2))
+
+            rectangle_1_coords = (0, slider_y_position - (button_length / 2),
+                                  width, slider_y_position + (button_length / 2))
+            rectangle_2_coords = (button_corner_radius, slider_y_position - (button_length / 2) - button_corner_radius,
+                                  width - button_corner_radius, slider_y_position + (button_length / 2) + button_corner_radius)
+        else:
+            oval_1_position = oval_2_position = oval_3_position = oval_4_position = (None, None)
+            rectangle_1_coords = rectangle_2_coords = None
 
-        return requires_recoloring
+        def slider_oval_parts(name: str, x_pos: Union[float, int, None], y_pos: Union[float, int, None]) -> list:
+            oval_parts = self.__aa_circle_parts(name, ("slider_corner_part", "slider_parts"), x_pos, y_pos, button_corner_radius)
+            if x_pos is None:
+                oval_parts = [(part_name, item_type, create_kwargs, None, options) for part_name, item_type, create_kwargs, _, options in oval_parts]
+            return oval_parts
+
+        parts, deleted_tags = [], []
+
+        # create 4 circles (if not needed, then less)
+        parts += slider_oval_parts("slider_oval_1", *oval_1_position)
+
+        if button_length > 0:
+            parts += slider_oval_parts("slider_oval_2", *oval_2_position)
+        else:
+            deleted_tags += ["slider_oval_2_a", "slider_oval_2_b"]
+
+        if height > 2 * button_corner_radius:
+            parts += slider_oval_parts("slider_oval_4", *oval_4_position)
+        else:
+            deleted_tags += ["slider_oval_4_a", "slider_oval_4_b"]
+
+        if button_length > 0 and height > 2 * button_corner_radius:
+            parts += slider_oval_parts("slider_oval_3", *oval_3_position)
+        else:
+            deleted_tags += ["slider_oval_3_a", "slider_oval_3_b"]
+
+        # create the 2 rectangles (if needed)
+        if button_length > 0:
+            parts.append(self.__part("slider_rectangle_1", "rectangle", ("slider_rectangle_part", "slider_parts"), rectangle_1_coords, width=0))
+        else:
+            deleted_tags.append("slider_rectangle_1")
+
+        if height > 2 * button_corner_radius:
+            parts.append(self.__part("slider_rectangle_2", "rectangle", ("slider_rectangle_part", "slider_parts"), rectangle_2_coords, width=0))
+        else:
+            deleted_tags.append("slider_rectangle_2")
+
+        # new parts were added in the slider or progress bar -> manage z-order
+        slider_section = tuple(parts), tuple(deleted_tags), (("tag_raise", ("slider_parts",)),), True
+
+        return progress_bar_sections + (slider_section,)
 
     def draw_rounded_scrollbar(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
                                border_spacing: Union[float, int], start_value: float, end_value: float, orientation: str) -> bool:
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_rounded_scrollbar, width, height, corner_radius,
+                                                          border_spacing, start_value, end_value, orientation))
+
+    def __calc_rounded_scrollbar(self, width: Union[float, int], height: Union[float, int], corner_radius: Union[float, int],
+                                 border_spacing: Union[float, int], start_value: float, end_value: float, orientation: str) -> tuple:
         if self._round_width_to_even_numbers:
             width = math.floor(width / 2) * 2  # round _current_width and _current_height and restrict them to even values only
         if self._round_height_to_even_numbers:
@@ -1047,129 +1039,134 @@ class DrawEngine:
         else:
             inner_corner_radius = 0
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            return self.__draw_rounded_scrollbar_polygon_shapes(width, height, corner_radius, inner_corner_radius,
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            return self.__calc_rounded_scrollbar_image_shapes(width, height, corner_radius, inner_corner_radius,
+                                                              start_value, end_value, orientation)
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            return self.__calc_rounded_scrollbar_polygon_shapes(width, height, corner_radius, inner_corner_radius,
                                                                 start_value, end_value, orientation)
         elif self.preferred_drawing_method == "font_shapes":
-            return self.__draw_rounded_scrollbar_font_shapes(width, height, corner_radius, inner_corner_radius,
-                                                             start_value, end_value, orientation)
-
-    def __draw_rounded_scrollbar_polygon_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
-                                                start_value: float, end_value: float, orientation: str) -> bool:
-        requires_recoloring = False
+            return self.__calc_rounded_scrollbar_font_shapes(width, height, corner_radius, inner_corner_radius,
+                                                             start_value, end_value, orientation),
+        else:
+            return ()
 
-        if not self._canvas.find_withtag("border_parts"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_1", "border_parts"), width=0)
-            requires_recoloring = True
-        self._canvas.coords("border_rectangle_1", 0, 0, width, height)
+    def __calc_rounded_scrollbar_polygon_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
+                                                start_value: float, end_value: float, orientation: str) -> tuple:
 
-        if not self._canvas.find_withtag("scrollbar_parts"):
-            self._canvas.create_polygon((0, 0, 0, 0), tags=("scrollbar_polygon_1", "scrollbar_parts"), joinstyle=tkinter.ROUND)
-            self._canvas.tag_raise("scrollbar_parts", "border_parts")
-            requires_recoloring = True
+        border_section = (self.__part("border_rectangle_1", "rectangle", ("border_parts",), (0, 0, width, height), width=0),), (), (), False
 
         if orientation == "vertical":
-            self._canvas.coords("scrollbar_polygon_1",
-                                corner_radius, corner_radius + (height - 2 * corner_radius) * start_value,
+            scrollbar_coords = (corner_radius, corner_radius + (height - 2 * corner_radius) * start_value,
                                 width - corner_radius, corner_radius + (height - 2 * corner_radius) * start_value,
                                 width - corner_radius, corner_radius + (height - 2 * corner_radius) * end_value,
                                 corner_radius, corner_radius + (height - 2 * corner_radius) * end_value)
         elif orientation == "horizontal":
-            self._canvas.coords("scrollbar_polygon_1",
-                                corner_radius + (width - 2 * corner_radius) * start_value, corner_radius,
+            scrollbar_coords = (corner_radius + (width - 2 * corner_radius) * start_value, corner_radius,
                                 corner_radius + (width - 2 * corner_radius) * end_value, corner_radius,
                                 corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius,
                                 corner_radius + (width - 2 * corner_radius) * start_value, height - corner_radius,)
+        else:
+            scrollbar_coords = None
 
-        self._canvas.itemconfig("scrollbar_polygon_1", width=inner_corner_radius * 2)
+        parts = (self.__part("scrollbar_polygon_1", "polygon", ("scrollbar_parts",), scrollbar_coords, {"width": inner_corner_radius * 2}, joinstyle=tkinter.ROUND),)
+        scrollbar_section = parts, (), (("tag_raise", ("scrollbar_parts", "border_parts")),), False
 
-        return requires_recoloring
+        return border_section, scrollbar_section
 
-    def __draw_rounded_scrollbar_font_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
-                                             start_value: float, end_value: float, orientation: str) -> bool:
-        requires_recoloring = False
+    def __calc_rounded_scrollbar_image_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
+                                              start_value: float, end_value: float, orientation: str) -> tuple:
 
-        if not self._canvas.find_withtag("border_parts"):
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("border_rectangle_1", "border_parts"), width=0)
-            requires_recoloring = True
-        self._canvas.coords("border_rectangle_1", 0, 0, width, height)
+        border_section = (self.__part("border_rectangle_1", "rectangle", ("border_parts",), (0, 0, width, height), width=0),), (), (), False
 
-        if inner_corner_radius > 0:
-            if not self._canvas.find_withtag("scrollbar_oval_1_a"):
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_1_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_1_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-
-            if not self._canvas.find_withtag("scrollbar_oval_2_a") and width > 2 * corner_radius:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_2_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_2_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_2_a") and not width > 2 * corner_radius:
-                self._canvas.delete("scrollbar_oval_2_a", "scrollbar_oval_2_b")
-
-            if not self._canvas.find_withtag("scrollbar_oval_3_a") and height > 2 * corner_radius and width > 2 * corner_radius:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_3_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_3_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_3_a") and not (height > 2 * corner_radius and width > 2 * corner_radius):
-                self._canvas.delete("scrollbar_oval_3_a", "scrollbar_oval_3_b")
-
-            if not self._canvas.find_withtag("scrollbar_oval_4_a") and height > 2 * corner_radius:
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_4_a", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER)
-                self._canvas.create_aa_circle(0, 0, 0, tags=("scrollbar_oval_4_b", "scrollbar_corner_part", "scrollbar_parts"), anchor=tkinter.CENTER, angle=180)
-                requires_recoloring = True
-            elif self._canvas.find_withtag("scrollbar_oval_4_a") and not height > 2 * corner_radius:
-                self._canvas.delete("scrollbar_oval_4_a", "scrollbar_oval_4_b")
+        if orientation == "vertical":
+            y_1 = round(corner_radius - inner_corner_radius + (height - 2 * corner_radius) * start_value)
+            y_2 = round(corner_radius + inner_corner_radius + (height - 2 * corner_radius) * end_value)
+            scrollbar_coords = (corner_radius - inner_corner_radius, y_1)
+            scrollbar_shape = ("rounded_rect", round(width) - 2 * (corner_radius - inner_corner_radius), y_2 - y_1, inner_corner_radius, (True, True, True, True))
+        elif orientation == "horizontal":
+            x_1 = round(corner_radius - inner_corner_radius + (width - 2 * corner_radius) * start_value)
+            x_2 = round(corner_radius + inner_corner_radius + (width - 2 * corner_radius) * end_value)
+            scrollbar_coords = (x_1, corner_radius - inner_corner_radius)
+            scrollbar_shape = ("rounded_rect", x_2 - x_1, round(height) - 2 * (corner_radius - inner_corner_radius), inner_corner_radius, (True, True, True, True))
         else:
-            self._canvas.delete("scrollbar_corner_part")
+            scrollbar_coords, scrollbar_shape = None, None
+
+        parts = (self.__part("scrollbar_image_1", "image_shape", ("scrollbar_parts",), scrollbar_coords,
+                             None if scrollbar_shape is None else {"shape": scrollbar_shape}),)
+        scrollbar_section = parts, (), (("tag_raise", ("scrollbar_parts", "border_parts")),), False
 
-        if not self._canvas.find_withtag("scrollbar_rectangle_1") and height > 2 * corner_radius:
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("scrollbar_rectangle_1", "scrollbar_rectangle_part", "scrollbar_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("scrollbar_rectangle_1") and not height > 2 * corner_radius:
-            self._canvas.delete("scrollbar_rectangle_1")
+        return border_section, scrollbar_section
 
-        if not self._canvas.find_withtag("scrollbar_rectangle_2") and width > 2 * corner_radius:
-            self._canvas.create_rectangle(0, 0, 0, 0, tags=("scrollbar_rectangle_2", "scrollbar_rectangle_part", "scrollbar_parts"), width=0)
-            requires_recoloring = True
-        elif self._canvas.find_withtag("scrollbar_rectangle_2") and not width > 2 * corner_radius:
-            self._canvas.delete("scrollbar_rectangle_2")
+    def __calc_rounded_scrollbar_font_shapes(self, width: int, height: int, corner_radius: int, inner_corner_radius: int,
+                                             start_value: float, end_value: float, orientation: str) -> tuple:
 
         if orientation == "vertical":
-            self._canvas.coords("scrollbar_rectangle_1",
-                                corner_radius - inner_corner_radius, corner_radius + (height - 2 * corner_radius) * start_value,
-                                width - (corner_radius - inner_corner_radius), corner_radius + (height - 2 * corner_radius) * end_value)
-            self._canvas.coords("scrollbar_rectangle_2",
-                                corner_radius, corner_radius - inner_corner_radius + (height - 2 * corner_radius) * start_value,
-                                width - (corner_radius), corner_radius + inner_corner_radius + (height - 2 * corner_radius) * end_value)
-
-            self._canvas.coords("scrollbar_oval_1_a", corner_radius, corner_radius + (height - 2 * corner_radius) * start_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_1_b", corner_radius, corner_radius + (height - 2 * corner_radius) * start_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_2_a", width - corner_radius, corner_radius + (height - 2 * corner_radius) * start_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_2_b", width - corner_radius, corner_radius + (height - 2 * corner_radius) * start_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_3_a", width - corner_radius, corner_radius + (height - 2 * corner_radius) * end_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_3_b", width - corner_radius, corner_radius + (height - 2 * corner_radius) * end_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_4_a", corner_radius, corner_radius + (height - 2 * corner_radius) * end_value, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_4_b", corner_radius, corner_radius + (height - 2 * corner_radius) * end_value, inner_corner_radius)
-
-        if orientation == "horizontal":
-            self._canvas.coords("scrollbar_rectangle_1",
-                                corner_radius - inner_corner_radius + (width - 2 * corner_radius) * start_value, corner_radius,
-                                corner_radius + inner_corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius)
-            self._canvas.coords("scrollbar_rectangle_2",
-                                corner_radius + (width - 2 * corner_radius) * start_value, corner_radius - inner_corner_radius,
-                                corner_radius + (width - 2 * corner_radius) * end_value, height - (corner_radius - inner_corner_radius))
-
-            self._canvas.coords("scrollbar_oval_1_a", corner_radius + (width - 2 * corner_radius) * start_value, corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_1_b", corner_radius + (width - 2 * corner_radius) * start_value, corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_2_a", corner_radius + (width - 2 * corner_radius) * end_value, corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_2_b", corner_radius + (width - 2 * corner_radius) * end_value, corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_3_a", corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_3_b", corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_4_a", corner_radius + (width - 2 * corner_radius) * start_value, height - corner_radius, inner_corner_radius)
-            self._canvas.coords("scrollbar_oval_4_b", corner_radius + (width - 2 * corner_radius) * start_value, height - corner_radius, inner_corner_radius)
+            rectangle_1_coords = (corner_radius - inner_corner_radius, corner_radius + (height - 2 * corner_radius) * start_value,
+                                  width - (corner_radius - inner_corner_radius), corner_radius + (height - 2 * corner_radius) * end_value)
+            rectangle_2_coords = (corner_radius, corner_radius - inner_corner_radius + (height - 2 * corner_radius) * start_value,
+                                  width - (corner_radius), corner_radius + inner_corner_radius + (height - 2 * corner_radius) * end_value)
 
-        return requires_recoloring
+            oval_1_position = (corner_radius, corner_radius + (height - 2 * corner_radius) * start_value)
+            oval_2_position = (width - corner_radius, corner_radius + (height - 2 * corner_radius) * start_value)
+            oval_3_position = (width - corner_radius, corner_radius + (height - 2 * corner_radius) * end_value)
+            oval_4_position = (corner_radius, corner_radius + (height - 2 * corner_radius) * end_value)
+
+        elif orientation == "horizontal":
+            rectangle_1_coords = (corner_radius - inner_corner_radius + (width - 2 * corner_radius) * start_value, corner_radius,
+                                  corner_radius + inner_corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius)
+            rectangle_2_coords = (corner_radius + (width - 2 * corner_radius) * start_value, corner_radius - inner_corner_radius,
+                                  corner_radius + (width - 2 * corner_radius) * end_value, height - (corner_radius - inner_corner_radius))
+
+            oval_1_position = (corner_radius + (width - 2 * corner_radius) * start_value, corner_radius)
+            oval_2_position = (corner_radius + (width - 2 * corner_radius) * end_value, corner_radius)
+            oval_3_position = (corner_radius + (width - 2 * corner_radius) * end_value, height - corner_radius)
+            oval_4_position = (corner_radius + (width - 2 * corner_radius) * start_value, height - corner_radius)
+
+        else:
+            rectangle_1_coords = rectangle_2_coords = None
+            oval_1_position = oval_2_position = oval_3_position = oval_4_position = None
+
+        def scrollbar_oval_parts(name: str, position: Union[tuple, None]) -> list:
+            if position is None:
+                return [(part_name, item_type, create_kwargs, None, options) for part_name, item_type, create_kwargs, _, options
+                        in self.__aa_circle_parts(name, ("scrollbar_corner_part", "scrollbar_parts"), 0, 0, 0)]
+            return self.__aa_circle_parts(name, ("scrollbar_corner_part", "scrollbar_parts"), *position, inner_corner_radius)
+
+        parts = [self.__part("border_rectangle_1", "rectangle", ("border_parts",), (0, 0, width, height), width=0)]
+        deleted_tags = []
+
+        if inner_corner_radius > 0:
+            parts += scrollbar_oval_parts("scrollbar_oval_1", oval_1_position)
+
+            if width > 2 * corner_radius:
+                parts += scrollbar_oval_parts("scrollbar_oval_2", oval_2_position)
+            else:
+                deleted_tags += ["scrollbar_oval_2_a", "scrollbar_oval_2_b"]
+
+            if height > 2 * corner_radius and width > 2 * corner_radius:
+                parts += scrollbar_oval_parts("scrollbar_oval_3", oval_3_position)
+            else:
+                deleted_tags += ["scrollbar_oval_3_a", "scrollbar_oval_3_b"]
+
+            if height > 2 * corner_radius:
+                parts += scrollbar_oval_parts("scrollbar_oval_4", oval_4_position)
+            else:
+                deleted_tags += ["scrollbar_oval_4_a", "scrollbar_oval_4_b"]
+        else:
+            deleted_tags.append("scrollbar_corner_part")
+
+        if height > 2 * corner_radius:
+            parts.append(self.__part("scrollbar_rectangle_1", "rectangle", ("scrollbar_rectangle_part", "scrollbar_parts"), rectangle_1_coords, width=0))
+        else:
+            deleted_tags.append("scrollbar_rectangle_1")
+
+        if width > 2 * corner_radius:
+            parts.append(self.__part("scrollbar_rectangle_2", "rectangle", ("scrollbar_rectangle_part", "scrollbar_parts"), rectangle_2_coords, width=0))
+        else:
+            deleted_tags.append("scrollbar_rectangle_2")
+
+        return tuple(parts), tuple(deleted_tags), (), False
 
     def draw_checkmark(self, width: Union[float, int], height: Union[float, int], size: Union[int, float]) -> bool:
         """ Draws a rounded rectangle with a corner_radius and border_width on the canvas. The border elements have a 'border_parts' tag,
@@ -1177,59 +1174,57 @@ class DrawEngine:
 
             returns bool if recoloring is necessary """
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_checkmark, width, height, size))
+
+    def __calc_checkmark(self, width: Union[float, int], height: Union[float, int], size: Union[int, float]) -> tuple:
         size = round(size)
-        requires_recoloring = False
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            x, y, radius = width / 2, height / 2, size / 2.8
-            if not self._canvas.find_withtag("checkmark"):
-                self._canvas.create_line(0, 0, 0, 0, tags=("checkmark", "create_line"), width=round(height / 8), joinstyle=tkinter.MITER, capstyle=tkinter.ROUND)
-                self._canvas.tag_raise("checkmark")
-                requires_recoloring = True
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            part = self.__part("checkmark", "image_shape", ("create_image",), (0, 0), {"shape": ("checkmark", round(width), round(height), size)})
 
-            self._canvas.coords("checkmark",
-                                x + radius, y - radius,
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            x, y, radius = width / 2, height / 2, size / 2.8
+            part = self.__part("checkmark", "line", ("create_line",),
+                               (x + radius, y - radius,
                                 x - radius / 4, y + radius * 0.8,
-                                x - radius, y + radius / 6)
-        elif self.preferred_drawing_method == "font_shapes":
-            if not self._canvas.find_withtag("checkmark"):
-                self._canvas.create_text(0, 0, text="Z", font=("CustomTkinter_shapes_font", -size), tags=("checkmark", "create_text"), anchor=tkinter.CENTER)
-                self._canvas.tag_raise("checkmark")
-                requires_recoloring = True
+                                x - radius, y + radius / 6),
+                               width=round(height / 8), joinstyle=tkinter.MITER, capstyle=tkinter.ROUND)
 
-            self._canvas.coords("checkmark", round(width / 2), round(height / 2))
+        elif self.preferred_drawing_method == "font_shapes":
+            part = self.__part("checkmark", "text", ("create_text",), (round(width / 2), round(height / 2)),
+                               text="Z", font=("CustomTkinter_shapes_font", -size), anchor=tkinter.CENTER)
+        else:
+            return ()
 
-        return requires_recoloring
+        return ((part,), (), (("tag_raise", ("checkmark",)),), False),
 
     def draw_dropdown_arrow(self, x_position: Union[int, float], y_position: Union[int, float], size: Union[int, float]) -> bool:
         """ Draws a dropdown bottom facing arrow at (x_position, y_position) in a given size
 
             returns bool if recoloring is necessary """
 
+        return self.__replay_geometry(self.__get_geometry(self.__calc_dropdown_arrow, x_position, y_position, size))
+
+    def __calc_dropdown_arrow(self, x_position: Union[int, float], y_position: Union[int, float], size: Union[int, float]) -> tuple:
         x_position, y_position, size = round(x_position), round(y_position), round(size)
-        requires_recoloring = False
 
-        if self.preferred_drawing_method == "polygon_shapes" or self.preferred_drawing_method == "circle_shapes":
-            if not self._canvas.find_withtag("dropdown_arrow"):
-                self._canvas.create_line(0, 0, 0, 0, tags="dropdown_arrow", width=round(size / 3), joinstyle=tkinter.ROUND, capstyle=tkinter.ROUND)
-                self._canvas.tag_raise("dropdown_arrow")
-                requires_recoloring = True
+        if self.preferred_drawing_method == "image_shapes" and ShapeImageAtlas.is_available():
+            part = self.__part("dropdown_arrow", "image_shape", (), (x_position, y_position), {"shape": ("dropdown_arrow", size)}, anchor=tkinter.CENTER)
 
-            self._canvas.coords("dropdown_arrow",
-                                x_position - (size / 2),
+        elif self.preferred_drawing_method in ("polygon_shapes", "circle_shapes", "image_shapes"):
+            part = self.__part("dropdown_arrow", "line", (),
+                               (x_position - (size / 2),
                                 y_position - (size / 5),
                                 x_position,
                                 y_position + (size / 5),
                                 x_position + (size / 2),
-                                y_position - (size / 5))
+                                y_position - (size / 5)),
+                               width=round(size / 3), joinstyle=tkinter.ROUND, capstyle=tkinter.ROUND)
 
         elif self.preferred_drawing_method == "font_shapes":
-            if not self._canvas.find_withtag("dropdown_arrow"):
-                self._canvas.create_text(0, 0, text="Y", font=("CustomTkinter_shapes_font", -size), tags="dropdown_arrow", anchor=tkinter.CENTER)
-                self._canvas.tag_raise("dropdown_arrow")
-                requires_recoloring = True
-
-            self._canvas.itemconfigure("dropdown_arrow", font=("CustomTkinter_shapes_font", -size))
-            self._canvas.coords("dropdown_arrow", x_position, y_position)
+            part = self.__part("dropdown_arrow", "text", (), (x_position, y_position), {"font": ("CustomTkinter_shapes_font", -size)},
+                               text="Y", font=("CustomTkinter_shapes_font", -size), anchor=tkinter.CENTER)
+        else:
+            return ()
 
-        return requires_recoloring
+        return ((part,), (), (("tag_raise", ("dropdown_arrow",)),), False),
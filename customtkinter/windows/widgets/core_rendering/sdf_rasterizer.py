@@ -0,0 +1,121 @@
+from typing import Tuple, Sequence, Union
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+def is_available() -> bool:
+    """ returns True if numpy could be imported """
+    try:
+        _ = np.ndarray
+        return True
+    except NameError:
+        return False
+
+
+def _pixel_centers(width: int, height: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    # coordinates of the pixel centers, x with shape (1, width) and y with shape (height, 1)
+    x = np.arange(width, dtype=np.float32)[np.newaxis, :] + 0.5
+    y = np.arange(height, dtype=np.float32)[:, np.newaxis] + 0.5
+    return x, y
+
+
+def _coverage_from_distance(distance: "np.ndarray") -> "np.ndarray":
+    # signed distance (negative inside) to pixel coverage, linear ramp over one pixel
+    return np.clip(0.5 - distance, 0, 1)
+
+
+def rounded_rect_distance(width: int, height: int, corner_radius: Union[int, float],
+                          corners: Sequence[bool] = (True, True, True, True),
+                          x_offset: Union[int, float] = 0, y_offset: Union[int, float] = 0,
+                          image_width: int = None, image_height: int = None) -> "np.ndarray":
+    """ signed distance field of a rounded rect at (x_offset, y_offset) with the given size,
+        corners is a tuple of 4 bools (nw, ne, se, sw) which corners are rounded """
+
+    image_width = width if image_width is None else image_width
+    image_height = height if image_height is None else image_height
+    corner_radius = max(0, min(corner_radius, width / 2, height / 2))
+
+    x, y = _pixel_centers(image_width, image_height)
+    px = x - (x_offset + width / 2)  # relative to center of rect
+    py = y - (y_offset + height / 2)
+
+    # choose radius of the corner in the quadrant of every pixel
+    nw, ne, se, sw = (corner_radius if rounded else 0 for rounded in corners)
+    radius = np.where(py < 0, np.where(px < 0, nw, ne), np.where(px < 0, sw, se)).astype(np.float32)
+
+    qx = np.abs(px) - width / 2 + radius
+    qy = np.abs(py) - height / 2 + radius
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    inside = np.minimum(np.maximum(qx, qy), 0)
+    return outside + inside - radius
+
+
+def polyline_distance(width: int, height: int, points: Sequence[Tuple[float, float]], line_width: Union[int, float]) -> "np.ndarray":
+    """ signed distance field of a polyline with round caps and joins """
+    x, y = _pixel_centers(width, height)
+    distance = np.full((height, width), np.inf, dtype=np.float32)
+
+    for (ax, ay), (bx, by) in zip(points[:-1], points[1:]):
+        pax, pay = x - ax, y - ay
+        bax, bay = bx - ax, by - ay
+        length_squared = bax * bax + bay * bay
+        if length_squared > 0:
+            h = np.clip((pax * bax + pay * bay) / length_squared, 0, 1)
+        else:
+            h = 0
+        distance = np.minimum(distance, np.hypot(pax - bax * h, pay - bay * h))
+
+    return distance - line_width / 2
+
+
+def rounded_rect_coverage(width: int, height: int, corner_radius: Union[int, float],
+                          corners: Sequence[bool] = (True, True, True, True)) -> "np.ndarray":
+    """ antialiased coverage (0-1) of a rounded rect filling the whole image, also used for pill shapes and circles """
+    return _coverage_from_distance(rounded_rect_distance(width, height, corner_radius, corners))
+
+
+def circle_coverage(diameter: int) -> "np.ndarray":
+    return rounded_rect_coverage(diameter, diameter, diameter / 2)
+
+
+def pill_coverage(width: int, height: int) -> "np.ndarray":
+    return rounded_rect_coverage(width, height, min(width, height) / 2)
+
+
+def polyline_coverage(width: int, height: int, points: Sequence[Tuple[float, float]], line_width: Union[int, float]) -> "np.ndarray":
+    return _coverage_from_distance(polyline_distance(width, height, points, line_width))
+
+
+def coverage_to_rgba(coverage: "np.ndarray", rgb_color: Tuple[int, int, int]) -> "np.ndarray":
+    """ single color RGBA buffer (uint8, shape (height, width, 4)) with coverage as alpha channel """
+    rgba = np.empty(coverage.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = rgb_color
+    rgba[..., 3] = np.round(coverage * 255)
+    return rgba
+
+
+def rounded_rect_with_border_rgba(width: int, height: int, corner_radius: Union[int, float], border_width: int,
+                                  fg_rgb: Tuple[int, int, int], border_rgb: Tuple[int, int, int],
+                                  corners: Sequence[bool] = (True, True, True, True)) -> "np.ndarray":
+    """ RGBA buffer of a rounded rect with border, inner rect has corner radius of corner_radius - border_width
+        like in DrawEngine, use PIL.Image.fromarray(buffer, 'RGBA') to create an image for ImageTk.PhotoImage """
+
+    outer_coverage = rounded_rect_coverage(width, height, corner_radius, corners)
+    if border_width <= 0:
+        return coverage_to_rgba(outer_coverage, fg_rgb)
+
+    inner_corner_radius = max(0, corner_radius - border_width)
+    inner_coverage = _coverage_from_distance(rounded_rect_distance(width - 2 * border_width, height - 2 * border_width, inner_corner_radius, corners,
+                                                                   x_offset=border_width, y_offset=border_width,
+                                                                   image_width=width, image_height=height))
+
+    # inner color over border color, alpha from outer shape
+    mix = inner_coverage[..., np.newaxis]
+    rgb = np.asarray(border_rgb, dtype=np.float32) * (1 - mix) + np.asarray(fg_rgb, dtype=np.float32) * mix
+
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., :3] = np.round(rgb)
+    rgba[..., 3] = np.round(outer_coverage * 255)
+    return rgba
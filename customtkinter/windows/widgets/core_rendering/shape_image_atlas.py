@@ -0,0 +1,210 @@
+import tkinter
+import weakref
+from collections import OrderedDict
+from typing import Union, Tuple
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    pass
+
+from . import sdf_rasterizer
+
+
+class ShapeImageAtlas:
+    """
+    Shared cache of pre-rendered shape images for the 'image_shapes' drawing method.
+
+    Shapes are rasterized once at the exact scaled size, with the vectorized sdf_rasterizer if numpy
+    is available, otherwise with PIL supersampled for antialiasing. Then they get colored and stored
+    as PhotoImages in a process-wide LRU cache. Widgets with the same dimensions and colors share
+    the same PhotoImage.
+
+    Shape specifications (tuples):
+     - ("rounded_rect", width, height, corner_radius, corners), corners is a tuple of 4 bools (nw, ne, se, sw)
+     - ("checkmark", width, height, size)
+     - ("dropdown_arrow", size)
+    """
+
+    max_bytes: int = 32 * 1024 * 1024  # memory budget of cached PhotoImages, estimated with 4 bytes per pixel
+    use_sdf_rasterizer: bool = True  # use numpy signed distance rasterizer if numpy is available
+    supersampling: int = 4  # PIL rasterizer draws shapes at this factor and then downsamples for antialiasing
+    hits: int = 0
+    misses: int = 0
+
+    _photo_images: OrderedDict = OrderedDict()  # (shape, rgb, weak reference to root window) -> (PhotoImage, bytes)
+    _root_references = weakref.WeakKeyDictionary()  # root window -> weak reference used in cache keys
+    _resident_bytes: int = 0
+    _rgb_colors: dict = {}  # color string -> (r, g, b) with 8 bit values
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            _, _, _ = Image, ImageDraw, ImageTk
+            return True
+        except NameError:
+            return False
+
+    @classmethod
+    def get_info(cls) -> dict:
+        """ returns dict with hits, misses, number of images, resident bytes and memory budget of the atlas """
+        return {"hits": cls.hits, "misses": cls.misses, "size": len(cls._photo_images),
+                "resident_bytes": cls._resident_bytes, "max_bytes": cls.max_bytes}
+
+    @classmethod
+    def clear(cls):
+        cls._photo_images.clear()
+        cls._resident_bytes = 0
+        cls._rgb_colors.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def _get_root_reference(cls, canvas: tkinter.Canvas) -> weakref.ref:
+        # PhotoImages keep the Tcl interpreter alive, so the entries of a root window get dropped with it
+        root = canvas._root()
+        reference = cls._root_references.get(root)
+        if reference is None:
+            reference = cls._root_references[root] = weakref.ref(root, cls._forget_root)
+        return reference
+
+    @classmethod
+    def _forget_root(cls, reference: weakref.ref):
+        for cache_key in [cache_key for cache_key in cls._photo_images if cache_key[2] is reference]:
+            cls._resident_bytes -= cls._photo_images.pop(cache_key)[1]
+
+    @classmethod
+    def get_image_size(cls, shape: tuple) -> Tuple[int, int]:
+        if shape[0] == "rounded_rect" or shape[0] == "checkmark":
+            return round(shape[1]), round(shape[2])
+        elif shape[0] == "dropdown_arrow":
+            size = shape[1]
+            padding = size / 6 + 1
+            return round(size + 2 * padding), round(size * 0.4 + 2 * padding)
+        else:
+            raise ValueError(f"unknown shape: {shape[0]}")
+
+    @classmethod
+    def get_rgb_color(cls, canvas: tkinter.Canvas, color: str) -> Union[Tuple[int, int, int], None]:
+        if color not in cls._rgb_colors:
+            try:
+                cls._rgb_colors[color] = tuple(value >> 8 for value in canvas.winfo_rgb(color))
+            except tkinter.TclError:
+                return None  # invalid or empty color, shape stays invisible
+        return cls._rgb_colors[color]
+
+    @classmethod
+    def get_photo_image(cls, canvas: tkinter.Canvas, shape: tuple, color: str) -> Union["ImageTk.PhotoImage", None]:
+        """ returns PhotoImage of shape in given color, or None if shape is empty or color is invalid """
+        image_size = cls.get_image_size(shape)
+        if image_size[0] <= 0 or image_size[1] <= 0:
+            return None
+
+        rgb_color = cls.get_rgb_color(canvas, color)
+        if rgb_color is None:
+            return None
+
+        # PhotoImages belong to a Tcl interpreter and can't be shared between different Tk instances
+        cache_key = (shape, rgb_color, cls._get_root_reference(canvas))
+
+        entry = cls._photo_images.get(cache_key)
+        if entry is None:
+            cls.misses += 1
+            image = cls.render_image(shape, image_size, rgb_color)
+            photo_image = ImageTk.PhotoImage(image, master=canvas)
+
+            # a full sized frame image for every window size while resizing, so the atlas is bounded by bytes
+            image_bytes = image_size[0] * image_size[1] * 4
+            cls._photo_images[cache_key] = (photo_image, image_bytes)
+            cls._resident_bytes += image_bytes
+            while cls._resident_bytes > cls.max_bytes and len(cls._photo_images) > 1:
+                _, (_, evicted_bytes) = cls._photo_images.popitem(last=False)  # canvas items keep their own reference to displayed images
+                cls._resident_bytes -= evicted_bytes
+        else:
+            cls.hits += 1
+            cls._photo_images.move_to_end(cache_key)
+            photo_image = entry[0]
+
+        return photo_image
+
+    @classmethod
+    def render_image(cls, shape: tuple, image_size: Tuple[int, int], rgb_color: Tuple[int, int, int]) -> "Image.Image":
+        """ returns antialiased RGBA image of the shape in the given color """
+        if cls.use_sdf_rasterizer and sdf_rasterizer.is_available():
+            rgba = sdf_rasterizer.coverage_to_rgba(cls._render_sdf_coverage(shape, image_size), rgb_color)
+            return Image.fromarray(rgba, "RGBA")
+
+        image = Image.new("RGB", image_size, rgb_color)
+        image.putalpha(cls.render_mask(shape, image_size))
+        return image
+
+    @classmethod
+    def render_mask(cls, shape: tuple, image_size: Tuple[int, int]) -> "Image.Image":
+        """ returns antialiased 8 bit alpha mask of the shape """
+        if cls.use_sdf_rasterizer and sdf_rasterizer.is_available():
+            coverage = cls._render_sdf_coverage(shape, image_size)
+            return Image.fromarray((coverage * 255).round().astype("uint8"), "L")
+
+        factor = cls.supersampling
+        mask = Image.new("L", (image_size[0] * factor, image_size[1] * factor), 0)
+        draw = ImageDraw.Draw(mask)
+
+        if shape[0] == "rounded_rect":
+            _, width, height, corner_radius, corners = shape
+            width, height = image_size[0] * factor, image_size[1] * factor
+            radius = min(round(corner_radius * factor), width // 2, height // 2)
+
+            draw.rectangle((0, 0, width - 1, height - 1), fill=255)
+            if radius > 0:
+                # (corner square, circle box) for nw, ne, se, sw corner
+                corner_boxes = (((0, 0, radius - 1, radius - 1), (0, 0, 2 * radius - 1, 2 * radius - 1)),
+                                ((width - radius, 0, width - 1, radius - 1), (width - 2 * radius, 0, width - 1, 2 * radius - 1)),
+                                ((width - radius, height - radius, width - 1, height - 1), (width - 2 * radius, height - 2 * radius, width - 1, height - 1)),
+                                ((0, height - radius, radius - 1, height - 1), (0, height - 2 * radius, 2 * radius - 1, height - 1)))
+
+                # cut out corner squares and fill them with a quarter circle
+                for rounded, (corner_square, _) in zip(corners, corner_boxes):
+                    if rounded:
+                        draw.rectangle(corner_square, fill=0)
+                for rounded, (_, circle_box) in zip(corners, corner_boxes):
+                    if rounded:
+                        draw.ellipse(circle_box, fill=255)
+
+        elif shape[0] == "checkmark":
+            _, width, height, size = shape
+            x, y, radius = width / 2, height / 2, size / 2.8
+            points = ((x + radius, y - radius), (x - radius / 4, y + radius * 0.8), (x - radius, y + radius / 6))
+            cls._draw_polyline(draw, points, round(height / 8), factor)
+
+        elif shape[0] == "dropdown_arrow":
+            size = shape[1]
+            x, y = image_size[0] / 2, image_size[1] / 2
+            points = ((x - (size / 2), y - (size / 5)), (x, y + (size / 5)), (x + (size / 2), y - (size / 5)))
+            cls._draw_polyline(draw, points, round(size / 3), factor)
+
+        return mask.resize(image_size, Image.LANCZOS)
+
+    @staticmethod
+    def _render_sdf_coverage(shape: tuple, image_size: Tuple[int, int]):
+        if shape[0] == "rounded_rect":
+            return sdf_rasterizer.rounded_rect_coverage(image_size[0], image_size[1], shape[3], shape[4])
+
+        elif shape[0] == "checkmark":
+            _, width, height, size = shape
+            x, y, radius = width / 2, height / 2, size / 2.8
+            points = ((x + radius, y - radius), (x - radius / 4, y + radius * 0.8), (x - radius, y + radius / 6))
+            return sdf_rasterizer.polyline_coverage(image_size[0], image_size[1], points, round(height / 8))
+
+        elif shape[0] == "dropdown_arrow":
+            size = shape[1]
+            x, y = image_size[0] / 2, image_size[1] / 2
+            points = ((x - (size / 2), y - (size / 5)), (x, y + (size / 5)), (x + (size / 2), y - (size / 5)))
+            return sdf_rasterizer.polyline_coverage(image_size[0], image_size[1], points, round(size / 3))
+
+    @staticmethod
+    def _draw_polyline(draw: "ImageDraw.ImageDraw", points: tuple, line_width: Union[int, float], factor: int):
+        # line with round caps and joins like tkinter.ROUND
+        points = [(px * factor, py * factor) for px, py in points]
+        line_width = line_width * factor
+        draw.line(points, fill=255, width=round(line_width), joint="curve")
+        for px, py in points:
+            draw.ellipse((px - line_width / 2, py - line_width / 2, px + line_width / 2, py + line_width / 2), fill=255)
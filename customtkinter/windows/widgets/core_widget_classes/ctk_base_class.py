@@ -1,5 +1,6 @@
 import sys
 import warnings
+import weakref
 import tkinter
 import tkinter.ttk as ttk
 from typing import Union, Callable, Tuple, Any
@@ -12,9 +13,9 @@ except ImportError:
 from .... import windows  # import windows for isinstance checks
 
 from ..theme import ThemeManager
-from ..font import CTkFont
+from ..font import CTkFont, FontManager
 from ..image import CTkImage
-from ..appearance_mode import CTkAppearanceModeBaseClass
+from ..appearance_mode import CTkAppearanceModeBaseClass, AppearanceModeTracker
 from ..scaling import CTkScalingBaseClass
 
 from ..utility import pop_from_dict_by_set, check_kwargs_empty
@@ -29,6 +30,11 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
     _cursor_manipulation_enabled: bool = True
 
+    # render queue: widgets with pending redraw -> no_color_updates, drawn once per idle-time flush of their root window
+    # weak keys, so widgets and root windows destroyed before the flush are not kept alive
+    _draw_requests: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _draw_request_flushes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # root window -> after_idle id of scheduled flush
+
     def __init__(self,
                  master: Any,
                  width: int = 0,
@@ -37,6 +43,8 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
                  bg_color: Union[str, Tuple[str, str]] = "transparent",
                  **kwargs):
 
+        FontManager.install_fonts()  # only loads fonts if root window is not a CTk
+
         # call init methods of super classes
         tkinter.Frame.__init__(self, master=master, width=width, height=height, **pop_from_dict_by_set(kwargs, self._valid_tk_frame_attributes))
         CTkAppearanceModeBaseClass.__init__(self)
@@ -45,6 +53,10 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         # check if kwargs is empty, if not raise error for unsupported arguments
         check_kwargs_empty(kwargs, raise_error=True)
 
+        # widgets which were never mapped get redrawn on their first map event after an appearance mode switch
+        self._mapped_once = False
+        self._draw_on_map = False
+
         # dimensions independent of scaling
         self._current_width = width  # _current_width and _current_height in pixel, represent current size of the widget
         self._current_height = height  # _current_width and _current_height are independent of the scale
@@ -69,6 +81,7 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
         # add configure callback to tkinter.Frame
         super().bind('<Configure>', self._update_dimensions_event)
+        super().bind('<Map>', self._map_event, add="+")
 
         # overwrite configure methods of master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
         if isinstance(self.master, (tkinter.Tk, tkinter.Toplevel, tkinter.Frame, tkinter.LabelFrame, ttk.Frame, ttk.LabelFrame, ttk.Notebook)) and not isinstance(self.master, (CTkBaseClass, CTkAppearanceModeBaseClass)):
@@ -94,6 +107,9 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
     def destroy(self):
         """ Destroy this and all descendants widgets. """
 
+        CTkBaseClass._draw_requests.pop(self, None)
+        AppearanceModeTracker.unmark_stale(self)
+
         # call destroy methods of super classes
         tkinter.Frame.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
@@ -107,6 +123,33 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
             # super().configure(bg=self._apply_appearance_mode(self._bg_color))
             pass
 
+    def _request_draw(self, no_color_updates: bool = False):
+        """ mark widget for redraw, all requests until the next idle-time flush result in one _draw() call,
+            colors get updated if at least one request needs color updates """
+        CTkBaseClass._draw_requests[self] = CTkBaseClass._draw_requests.get(self, True) and no_color_updates
+        if no_color_updates is False:
+            self._draw_on_map = False  # colors get updated anyway
+            AppearanceModeTracker.unmark_stale(self)
+
+        root = self._root()
+        if root not in CTkBaseClass._draw_request_flushes:
+            CTkBaseClass._draw_request_flushes[root] = root.after_idle(CTkBaseClass._flush_draw_requests, root)
+
+    @classmethod
+    def _flush_draw_requests(cls, root):
+        """ draw every widget of root with pending draw request, requests made while drawing get a new flush,
+            errors are reported per widget like errors in tkinter callbacks, so one failing widget doesn't drop the others """
+        cls._draw_request_flushes.pop(root, None)
+
+        for widget in [widget for widget in cls._draw_requests if widget._root() is root]:
+            no_color_updates = cls._draw_requests.pop(widget, None)
+            if no_color_updates is None:
+                continue  # destroyed by the draw of another widget
+            try:
+                widget._draw(no_color_updates=no_color_updates)
+            except Exception:
+                widget._report_exception()
+
     def config(self, *args, **kwargs):
         raise AttributeError("'config' is not implemented for CTk widgets. For consistency, always use 'configure' instead.")
 
@@ -133,7 +176,7 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         check_kwargs_empty(kwargs, raise_error=True)
 
         if require_redraw:
-            self._draw()
+            self._request_draw()
 
     def cget(self, attribute_name: str):
         """ basic cget with bg_color, width, height support, calls cget of tkinter.Frame """
@@ -150,6 +193,12 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         else:
             raise ValueError(f"'{attribute_name}' is not a supported argument. Look at the documentation for supported arguments.")
 
+    def _get_private_font(self) -> Union[tuple, CTkFont]:
+        """ used by cget("font"), a font shared by CTkFont.get_shared_font() gets replaced with a private copy first,
+            so configuring the returned font only changes this widget """
+        self._font = CTkFont._get_private_font(self._font, self._update_font)
+        return self._font
+
     def _check_font_type(self, font: any):
         """ check font type when passed to widget """
         if isinstance(font, CTkFont):
@@ -185,7 +234,7 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
             self._current_width = self._reverse_widget_scaling(event.width)  # adjust current size according to new size given by event
             self._current_height = self._reverse_widget_scaling(event.height)  # _current_width and _current_height are independent of the scale
 
-            self._draw(no_color_updates=True)  # faster drawing without color changes
+            self._request_draw(no_color_updates=True)  # faster drawing without color changes
 
     def _detect_color_of_master(self, master_widget=None) -> Union[str, Tuple[str, str]]:
         """ detect foreground color of master widget for bg_color and transparent color """
@@ -219,8 +268,45 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
-        self._draw()
-        super().update_idletasks()
+
+        # AppearanceModeTracker flushes all requested draws at once after the switch,
+        # widgets which are not visible get redrawn when they are mapped or scrolled into view
+        if not self._mapped_once:
+            self._draw_on_map = True  # e.g. set_appearance_mode() before mainloop, no visibility check and no tracking needed
+        else:
+            self._request_draw_if_visible()
+
+    def _request_draw_if_visible(self):
+        if self._is_visible():
+            self._request_draw()
+        else:
+            AppearanceModeTracker.mark_stale(self)
+
+    def _is_visible(self) -> bool:
+        """ widget is viewable and not scrolled out of view in a CTkScrollableFrame """
+        if not self.winfo_viewable():
+            return False
+
+        master_widget = self.master
+        while master_widget is not None:
+            if isinstance(master_widget, windows.widgets.ctk_scrollable_frame.CTkScrollableFrame):
+                canvas = master_widget._parent_canvas
+                widget_x, widget_y, canvas_x, canvas_y = self.winfo_rootx(), self.winfo_rooty(), canvas.winfo_rootx(), canvas.winfo_rooty()
+                return (widget_x < canvas_x + canvas.winfo_width() and canvas_x < widget_x + self.winfo_width() and
+                        widget_y < canvas_y + canvas.winfo_height() and canvas_y < widget_y + self.winfo_height())
+            master_widget = master_widget.master
+        return True
+
+    def _map_event(self, event):
+        if not self._mapped_once:
+            # children of a widget which was never mapped get their own first map event, so only check this widget
+            self._mapped_once = True
+            if self._draw_on_map:
+                self._draw_on_map = False
+                self._request_draw_if_visible()  # may be scrolled out of view in a CTkScrollableFrame
+        else:
+            # children of a widget which is mapped again don't get map events
+            AppearanceModeTracker.update_stale_widgets(self)
 
     def _set_scaling(self, new_widget_scaling, new_window_scaling):
         super()._set_scaling(new_widget_scaling, new_window_scaling)
@@ -27,12 +27,13 @@ class DropdownMenu(tkinter.Menu, CTkAppearanceModeBaseClass, CTkScalingBaseClass
         CTkScalingBaseClass.__init__(self, scaling_type="widget")
 
         self._min_character_width = min_character_width
-        self._fg_color = ThemeManager.theme["DropdownMenu"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._hover_color = ThemeManager.theme["DropdownMenu"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._text_color = ThemeManager.theme["DropdownMenu"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        theme_defaults = ThemeManager.get_defaults("DropdownMenu")
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._hover_color = theme_defaults["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -160,6 +161,7 @@ class DropdownMenu(tkinter.Menu, CTkAppearanceModeBaseClass, CTkScalingBaseClass
             return self._text_color
 
         elif attribute_name == "font":
+            self._font = CTkFont._get_private_font(self._font, self._update_font)  # configuring the returned font only changes this menu
             return self._font
         elif attribute_name == "command":
             return self._command
@@ -51,18 +51,20 @@ class CTkButton(CTkBaseClass):
         # transfer basic functionality (bg_color, size, appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkButton")
+
         # shape
-        self._corner_radius: int = ThemeManager.theme["CTkButton"]["corner_radius"] if corner_radius is None else corner_radius
+        self._corner_radius: int = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
         self._corner_radius = min(self._corner_radius, round(self._current_height / 2))
-        self._border_width: int = ThemeManager.theme["CTkButton"]["border_width"] if border_width is None else border_width
+        self._border_width: int = theme_defaults["border_width"] if border_width is None else border_width
         self._border_spacing: int = border_spacing
 
         # color
-        self._fg_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._hover_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._border_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._text_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._fg_color: Union[str, Tuple[str, str]] = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._hover_color: Union[str, Tuple[str, str]] = theme_defaults["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._border_color: Union[str, Tuple[str, str]] = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._text_color: Union[str, Tuple[str, str]] = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled: Union[str, Tuple[str, str]] = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # rendering options
         self._background_corner_colors: Union[Tuple[Union[str, Tuple[str, str]]], None] = background_corner_colors  # rendering options for DrawEngine
@@ -73,7 +75,7 @@ class CTkButton(CTkBaseClass):
         self._text = text
         self._text_label: Union[tkinter.Label, None] = None
         self._textvariable: tkinter.Variable = textvariable
-        self._font: Union[tuple, CTkFont] = CTkFont() if font is None else self._check_font_type(font)
+        self._font: Union[tuple, CTkFont] = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -144,7 +146,7 @@ class CTkButton(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
@@ -155,7 +157,7 @@ class CTkButton(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
@@ -465,7 +467,7 @@ class CTkButton(CTkBaseClass):
         elif attribute_name == "text":
             return self._text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "textvariable":
             return self._textvariable
         elif attribute_name == "image":
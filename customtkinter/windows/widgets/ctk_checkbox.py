@@ -50,24 +50,26 @@ class CTkCheckBox(CTkBaseClass):
         self._checkbox_width = checkbox_width
         self._checkbox_height = checkbox_height
 
+        theme_defaults = ThemeManager.get_defaults("CTkCheckBox")
+
         # color
-        self._fg_color = ThemeManager.theme["CTkCheckBox"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._hover_color = ThemeManager.theme["CTkCheckBox"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._border_color = ThemeManager.theme["CTkCheckBox"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._checkmark_color = ThemeManager.theme["CTkCheckBox"]["checkmark_color"] if checkmark_color is None else self._check_color_type(checkmark_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._hover_color = theme_defaults["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._checkmark_color = theme_defaults["checkmark_color"] if checkmark_color is None else self._check_color_type(checkmark_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkCheckBox"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkCheckBox"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
 
         # text
         self._text = text
         self._text_label: Union[tkinter.Label, None] = None
-        self._text_color = ThemeManager.theme["CTkCheckBox"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkCheckBox"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -146,7 +148,7 @@ class CTkCheckBox(CTkBaseClass):
                                   height=self._apply_widget_scaling(self._desired_height))
         self._canvas.configure(width=self._apply_widget_scaling(self._checkbox_width),
                                height=self._apply_widget_scaling(self._checkbox_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width: int = None, height: int = None):
         super()._set_dimensions(width, height)
@@ -330,7 +332,7 @@ class CTkCheckBox(CTkBaseClass):
         elif attribute_name == "text":
             return self._text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "textvariable":
             return self._textvariable
         elif attribute_name == "state":
@@ -409,10 +411,10 @@ class CTkCheckBox(CTkBaseClass):
         if self._state == tkinter.NORMAL:
             if self._check_state is True:
                 self._check_state = False
-                self._draw()
+                self._request_draw()
             else:
                 self._check_state = True
-                self._draw()
+                self._request_draw()
 
             if self._variable is not None:
                 self._variable_callback_blocked = True
@@ -424,7 +426,7 @@ class CTkCheckBox(CTkBaseClass):
 
     def select(self, from_variable_callback=False):
         self._check_state = True
-        self._draw()
+        self._request_draw()
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
@@ -433,7 +435,7 @@ class CTkCheckBox(CTkBaseClass):
 
     def deselect(self, from_variable_callback=False):
         self._check_state = False
-        self._draw()
+        self._request_draw()
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
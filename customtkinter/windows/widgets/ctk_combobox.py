@@ -48,20 +48,22 @@ class CTkComboBox(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkComboBox")
+
         # shape
-        self._corner_radius = ThemeManager.theme["CTkComboBox"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkComboBox"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
 
         # color
-        self._fg_color = ThemeManager.theme["CTkComboBox"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._border_color = ThemeManager.theme["CTkComboBox"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._button_color = ThemeManager.theme["CTkComboBox"]["button_color"] if button_color is None else self._check_color_type(button_color)
-        self._button_hover_color = ThemeManager.theme["CTkComboBox"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
-        self._text_color = ThemeManager.theme["CTkComboBox"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkComboBox"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._button_color = theme_defaults["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = theme_defaults["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -144,14 +146,14 @@ class CTkComboBox(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width: int = None, height: int = None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
@@ -323,7 +325,7 @@ class CTkComboBox(CTkBaseClass):
             return self._text_color_disabled
 
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "dropdown_font":
             return self._dropdown_menu.cget("font")
         elif attribute_name == "values":
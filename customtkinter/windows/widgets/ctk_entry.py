@@ -48,15 +48,17 @@ class CTkEntry(CTkBaseClass):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        theme_defaults = ThemeManager.get_defaults("CTkEntry")
+
         # color
-        self._fg_color = ThemeManager.theme["CTkEntry"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._text_color = ThemeManager.theme["CTkEntry"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._placeholder_text_color = ThemeManager.theme["CTkEntry"]["placeholder_text_color"] if placeholder_text_color is None else self._check_color_type(placeholder_text_color)
-        self._border_color = ThemeManager.theme["CTkEntry"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._placeholder_text_color = theme_defaults["placeholder_text_color"] if placeholder_text_color is None else self._check_color_type(placeholder_text_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkEntry"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkEntry"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
 
         # text and state
         self._is_focused: bool = True
@@ -68,7 +70,7 @@ class CTkEntry(CTkBaseClass):
         self._textvariable_callback_name: str = ""
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -126,14 +128,14 @@ class CTkEntry(CTkBaseClass):
         self._entry.configure(font=self._apply_font_scaling(self._font))
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width), height=self._apply_widget_scaling(self._desired_height))
         self._create_grid()
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
@@ -272,7 +274,7 @@ class CTkEntry(CTkBaseClass):
         elif attribute_name == "placeholder_text":
             return self._placeholder_text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "state":
             return self._state
 
@@ -32,26 +32,28 @@ class CTkFrame(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkFrame")
+
         # color
-        self._border_color = ThemeManager.theme["CTkFrame"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
 
         # determine fg_color of frame
         if fg_color is None:
             if isinstance(self.master, CTkFrame):
-                if self.master._fg_color == ThemeManager.theme["CTkFrame"]["fg_color"]:
-                    self._fg_color = ThemeManager.theme["CTkFrame"]["top_fg_color"]
+                if self.master._fg_color == theme_defaults["fg_color"]:
+                    self._fg_color = theme_defaults["top_fg_color"]
                 else:
-                    self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"]
+                    self._fg_color = theme_defaults["fg_color"]
             else:
-                self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"]
+                self._fg_color = theme_defaults["fg_color"]
         else:
             self._fg_color = self._check_color_type(fg_color, transparency=True)
 
         self._background_corner_colors = background_corner_colors  # rendering options for DrawEngine
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkFrame"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkFrame"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
 
         self._canvas = CTkCanvas(master=self,
                                  highlightthickness=0,
@@ -82,14 +84,14 @@ class CTkFrame(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def _draw(self, no_color_updates=False):
         super()._draw(no_color_updates)
@@ -44,20 +44,22 @@ class CTkLabel(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height)
 
+        theme_defaults = ThemeManager.get_defaults("CTkLabel")
+
         # color
-        self._fg_color = ThemeManager.theme["CTkLabel"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._text_color = ThemeManager.theme["CTkLabel"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
 
         if text_color_disabled is None:
-            if "text_color_disabled" in ThemeManager.theme["CTkLabel"]:
-                self._text_color_disabled = ThemeManager.theme["CTkLabel"]["text_color"]
+            if "text_color_disabled" in theme_defaults:
+                self._text_color_disabled = theme_defaults["text_color"]
             else:
                 self._text_color_disabled = self._text_color
         else:
             self._text_color_disabled = self._check_color_type(text_color_disabled)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkLabel"]["corner_radius"] if corner_radius is None else corner_radius
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
 
         # text
         self._anchor = anchor
@@ -71,7 +73,7 @@ class CTkLabel(CTkBaseClass):
             self._image.add_configure_callback(self._update_image)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -113,7 +115,7 @@ class CTkLabel(CTkBaseClass):
 
         self._create_grid()
         self._update_image()
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_appearance_mode(self, mode_string):
         super()._set_appearance_mode(mode_string)
@@ -125,7 +127,7 @@ class CTkLabel(CTkBaseClass):
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
         self._create_grid()
-        self._draw()
+        self._request_draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
@@ -251,7 +253,7 @@ class CTkLabel(CTkBaseClass):
         elif attribute_name == "text":
             return self._text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "image":
             return self._image
         elif attribute_name == "compound":
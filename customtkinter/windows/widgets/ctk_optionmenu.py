@@ -47,20 +47,22 @@ class CTkOptionMenu(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkOptionMenu")
+
         # color variables
-        self._fg_color = ThemeManager.theme["CTkOptionMenu"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._button_color = ThemeManager.theme["CTkOptionMenu"]["button_color"] if button_color is None else self._check_color_type(button_color)
-        self._button_hover_color = ThemeManager.theme["CTkOptionMenu"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._button_color = theme_defaults["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = theme_defaults["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkOptionMenu"]["corner_radius"] if corner_radius is None else corner_radius
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
 
         # text and font
-        self._text_color = ThemeManager.theme["CTkOptionMenu"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkOptionMenu"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -155,14 +157,14 @@ class CTkOptionMenu(CTkBaseClass):
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
         self._create_grid()
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width: int = None, height: int = None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
@@ -219,8 +221,6 @@ class CTkOptionMenu(CTkBaseClass):
 
             self._text_label.configure(bg=self._apply_appearance_mode(self._fg_color))
 
-        self._canvas.update_idletasks()
-
     def configure(self, require_redraw=False, **kwargs):
         if "corner_radius" in kwargs:
             self._corner_radius = kwargs.pop("corner_radius")
@@ -329,7 +329,7 @@ class CTkOptionMenu(CTkBaseClass):
             return self._dropdown_menu.cget("text_color")
 
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "dropdown_font":
             return self._dropdown_menu.cget("font")
         elif attribute_name == "values":
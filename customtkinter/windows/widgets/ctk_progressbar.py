@@ -53,10 +53,12 @@ class CTkProgressBar(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkProgressBar")
+
         # color
-        self._border_color = ThemeManager.theme["CTkProgressBar"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._fg_color = ThemeManager.theme["CTkProgressBar"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._progress_color = ThemeManager.theme["CTkProgressBar"]["progress_color"] if progress_color is None else self._check_color_type(progress_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._progress_color = theme_defaults["progress_color"] if progress_color is None else self._check_color_type(progress_color)
 
         # control variable
         self._variable = variable
@@ -65,8 +67,8 @@ class CTkProgressBar(CTkBaseClass):
         self._loop_after_id = None
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkProgressBar"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkProgressBar"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
         self._determinate_value: float = 0.5  # range 0-1
         self._determinate_speed = determinate_speed  # range 0-1
         self._indeterminate_value: float = 0  # range 0-inf
@@ -99,14 +101,14 @@ class CTkProgressBar(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def destroy(self):
         if self._variable is not None:
@@ -242,7 +244,7 @@ class CTkProgressBar(CTkBaseClass):
         elif self._determinate_value < 0:
             self._determinate_value = 0
 
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
@@ -271,11 +273,11 @@ class CTkProgressBar(CTkBaseClass):
                 self._determinate_value += self._determinate_speed / 50
                 if self._determinate_value > 1:
                     self._determinate_value -= 1
-                self._draw()
+                self._request_draw()
                 self._loop_after_id = self.after(20, self._internal_loop)
             else:
                 self._indeterminate_value += self._indeterminate_speed
-                self._draw()
+                self._request_draw()
                 self._loop_after_id = self.after(20, self._internal_loop)
 
     def step(self):
@@ -284,10 +286,10 @@ class CTkProgressBar(CTkBaseClass):
             self._determinate_value += self._determinate_speed / 50
             if self._determinate_value > 1:
                 self._determinate_value -= 1
-            self._draw()
+            self._request_draw()
         else:
             self._indeterminate_value += self._indeterminate_speed
-            self._draw()
+            self._request_draw()
 
     def bind(self, sequence: str = None, command: Callable = None, add: Union[str, bool] = True):
         """ called on the tkinter.Canvas """
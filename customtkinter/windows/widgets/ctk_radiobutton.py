@@ -49,24 +49,26 @@ class CTkRadioButton(CTkBaseClass):
         self._radiobutton_width = radiobutton_width
         self._radiobutton_height = radiobutton_height
 
+        theme_defaults = ThemeManager.get_defaults("CTkRadioButton")
+
         # color
-        self._fg_color = ThemeManager.theme["CTkRadioButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._hover_color = ThemeManager.theme["CTkRadioButton"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._border_color = ThemeManager.theme["CTkRadioButton"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._hover_color = theme_defaults["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkRadioButton"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width_unchecked = ThemeManager.theme["CTkRadioButton"]["border_width_unchecked"] if border_width_unchecked is None else border_width_unchecked
-        self._border_width_checked = ThemeManager.theme["CTkRadioButton"]["border_width_checked"] if border_width_checked is None else border_width_checked
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width_unchecked = theme_defaults["border_width_unchecked"] if border_width_unchecked is None else border_width_unchecked
+        self._border_width_checked = theme_defaults["border_width_checked"] if border_width_checked is None else border_width_checked
 
         # text
         self._text = text
         self._text_label: Union[tkinter.Label, None] = None
-        self._text_color = ThemeManager.theme["CTkRadioButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkRadioButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -141,7 +143,7 @@ class CTkRadioButton(CTkBaseClass):
                                   height=self._apply_widget_scaling(self._desired_height))
         self._canvas.configure(width=self._apply_widget_scaling(self._radiobutton_width),
                                height=self._apply_widget_scaling(self._radiobutton_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width: int = None, height: int = None):
         super()._set_dimensions(width, height)
@@ -315,7 +317,7 @@ class CTkRadioButton(CTkBaseClass):
         elif attribute_name == "text":
             return self._text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "textvariable":
             return self._textvariable
         elif attribute_name == "variable":
@@ -388,7 +390,7 @@ class CTkRadioButton(CTkBaseClass):
 
     def select(self, from_variable_callback=False):
         self._check_state = True
-        self._draw()
+        self._request_draw()
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
@@ -397,7 +399,7 @@ class CTkRadioButton(CTkBaseClass):
 
     def deselect(self, from_variable_callback=False):
         self._check_state = False
-        self._draw()
+        self._request_draw()
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
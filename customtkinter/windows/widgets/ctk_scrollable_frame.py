@@ -8,7 +8,7 @@ import sys
 
 from .ctk_frame import CTkFrame
 from .ctk_scrollbar import CTkScrollbar
-from .appearance_mode import CTkAppearanceModeBaseClass
+from .appearance_mode import CTkAppearanceModeBaseClass, AppearanceModeTracker
 from .scaling import CTkScalingBaseClass
 from .core_widget_classes import CTkBaseClass
 from .ctk_label import CTkLabel
@@ -53,11 +53,11 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
         if self._orientation == "horizontal":
             self._scrollbar = CTkScrollbar(master=self._parent_frame, orientation="horizontal", command=self._parent_canvas.xview,
                                            fg_color=scrollbar_fg_color, button_color=scrollbar_button_color, button_hover_color=scrollbar_button_hover_color)
-            self._parent_canvas.configure(xscrollcommand=self._scrollbar.set)
+            self._parent_canvas.configure(xscrollcommand=self._parent_canvas_scrolled)
         elif self._orientation == "vertical":
             self._scrollbar = CTkScrollbar(master=self._parent_frame, orientation="vertical", command=self._parent_canvas.yview,
                                            fg_color=scrollbar_fg_color, button_color=scrollbar_button_color, button_hover_color=scrollbar_button_hover_color)
-            self._parent_canvas.configure(yscrollcommand=self._scrollbar.set)
+            self._parent_canvas.configure(yscrollcommand=self._parent_canvas_scrolled)
 
         self._label_text = label_text
         self._label = CTkLabel(self._parent_frame, text=label_text, anchor=label_anchor, font=label_font,
@@ -236,6 +236,10 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
         else:
             return self._parent_frame.cget(attribute_name)
 
+    def _parent_canvas_scrolled(self, *args):
+        self._scrollbar.set(*args)
+        AppearanceModeTracker.update_stale_widgets(self)  # redraw widgets which missed appearance mode switch while out of view
+
     def _fit_frame_dimensions_to_canvas(self, event):
         if self._orientation == "horizontal":
             self._parent_canvas.itemconfigure(self._create_window_id, height=self._parent_canvas.winfo_height())
@@ -47,14 +47,16 @@ class CTkScrollbar(CTkBaseClass):
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkScrollbar")
+
         # color
-        self._fg_color = ThemeManager.theme["CTkScrollbar"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._button_color = ThemeManager.theme["CTkScrollbar"]["button_color"] if button_color is None else self._check_color_type(button_color)
-        self._button_hover_color = ThemeManager.theme["CTkScrollbar"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._button_color = theme_defaults["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = theme_defaults["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkScrollbar"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_spacing = ThemeManager.theme["CTkScrollbar"]["border_spacing"] if border_spacing is None else border_spacing
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_spacing = theme_defaults["border_spacing"] if border_spacing is None else border_spacing
 
         self._hover = hover
         self._hover_state: bool = False
@@ -92,14 +94,14 @@ class CTkScrollbar(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _get_scrollbar_values_for_minimum_pixel_size(self):
         # correct scrollbar float values if scrollbar is too small
@@ -158,8 +160,6 @@ class CTkScrollbar(CTkBaseClass):
                                         fill=self._apply_appearance_mode(self._fg_color),
                                         outline=self._apply_appearance_mode(self._fg_color))
 
-        self._canvas.update_idletasks()
-
     def configure(self, require_redraw=False, **kwargs):
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
@@ -237,7 +237,7 @@ class CTkScrollbar(CTkBaseClass):
         value = max(current_scrollbar_length / 2, min(value, 1 - (current_scrollbar_length / 2)))
         self._start_value = value - (current_scrollbar_length / 2)
         self._end_value = value + (current_scrollbar_length / 2)
-        self._draw()
+        self._request_draw()
 
         if self._command is not None:
             self._command('moveto', self._start_value)
@@ -252,7 +252,7 @@ class CTkScrollbar(CTkBaseClass):
     def set(self, start_value: float, end_value: float):
         self._start_value = float(start_value)
         self._end_value = float(end_value)
-        self._draw()
+        self._request_draw()
 
     def get(self):
         return self._start_value, self._end_value
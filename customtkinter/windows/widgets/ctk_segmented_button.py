@@ -45,24 +45,25 @@ class CTkSegmentedButton(CTkFrame):
 
         super().__init__(master=master, bg_color=bg_color, width=width, height=height)
 
-        self._sb_fg_color = ThemeManager.theme["CTkSegmentedButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        theme_defaults = ThemeManager.get_defaults("CTkSegmentedButton")
+        self._sb_fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
 
-        self._sb_selected_color = ThemeManager.theme["CTkSegmentedButton"]["selected_color"] if selected_color is None else self._check_color_type(selected_color)
-        self._sb_selected_hover_color = ThemeManager.theme["CTkSegmentedButton"]["selected_hover_color"] if selected_hover_color is None else self._check_color_type(selected_hover_color)
+        self._sb_selected_color = theme_defaults["selected_color"] if selected_color is None else self._check_color_type(selected_color)
+        self._sb_selected_hover_color = theme_defaults["selected_hover_color"] if selected_hover_color is None else self._check_color_type(selected_hover_color)
 
-        self._sb_unselected_color = ThemeManager.theme["CTkSegmentedButton"]["unselected_color"] if unselected_color is None else self._check_color_type(unselected_color)
-        self._sb_unselected_hover_color = ThemeManager.theme["CTkSegmentedButton"]["unselected_hover_color"] if unselected_hover_color is None else self._check_color_type(unselected_hover_color)
+        self._sb_unselected_color = theme_defaults["unselected_color"] if unselected_color is None else self._check_color_type(unselected_color)
+        self._sb_unselected_hover_color = theme_defaults["unselected_hover_color"] if unselected_hover_color is None else self._check_color_type(unselected_hover_color)
 
-        self._sb_text_color = ThemeManager.theme["CTkSegmentedButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._sb_text_color_disabled = ThemeManager.theme["CTkSegmentedButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._sb_text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._sb_text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
-        self._sb_corner_radius = ThemeManager.theme["CTkSegmentedButton"]["corner_radius"] if corner_radius is None else corner_radius
-        self._sb_border_width = ThemeManager.theme["CTkSegmentedButton"]["border_width"] if border_width is None else border_width
+        self._sb_corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._sb_border_width = theme_defaults["border_width"] if border_width is None else border_width
 
         self._background_corner_colors = background_corner_colors  # rendering options for DrawEngine
 
         self._command: Callable[[str], None] = command
-        self._font = CTkFont() if font is None else font
+        self._font = CTkFont.get_shared_font() if font is None else font
         self._state = state
 
         self._buttons_dict: Dict[str, CTkButton] = {}  # mapped from value to button object
@@ -343,7 +344,7 @@ class CTkSegmentedButton(CTkFrame):
             return self._sb_text_color_disabled
 
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "values":
             return copy.copy(self._value_list)
         elif attribute_name == "variable":
@@ -57,16 +57,17 @@ class CTkSlider(CTkBaseClass):
 
         # color
         self._border_color = self._check_color_type(border_color, transparency=True)
-        self._fg_color = ThemeManager.theme["CTkSlider"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._progress_color = ThemeManager.theme["CTkSlider"]["progress_color"] if progress_color is None else self._check_color_type(progress_color, transparency=True)
-        self._button_color = ThemeManager.theme["CTkSlider"]["button_color"] if button_color is None else self._check_color_type(button_color)
-        self._button_hover_color = ThemeManager.theme["CTkSlider"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        theme_defaults = ThemeManager.get_defaults("CTkSlider")
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._progress_color = theme_defaults["progress_color"] if progress_color is None else self._check_color_type(progress_color, transparency=True)
+        self._button_color = theme_defaults["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = theme_defaults["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkSlider"]["corner_radius"] if corner_radius is None else corner_radius
-        self._button_corner_radius = ThemeManager.theme["CTkSlider"]["button_corner_radius"] if button_corner_radius is None else button_corner_radius
-        self._border_width = ThemeManager.theme["CTkSlider"]["border_width"] if border_width is None else border_width
-        self._button_length = ThemeManager.theme["CTkSlider"]["button_length"] if button_length is None else button_length
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._button_corner_radius = theme_defaults["button_corner_radius"] if button_corner_radius is None else button_corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
+        self._button_length = theme_defaults["button_length"] if button_length is None else button_length
         self._value: float = 0.5  # initial value of slider in percent
         self._orientation = orientation
         self._hover_state: bool = False
@@ -122,14 +123,14 @@ class CTkSlider(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
-        self._draw()
+        self._request_draw()
 
     def destroy(self):
         # remove variable_callback from variable callbacks if variable exists
@@ -329,7 +330,7 @@ class CTkSlider(CTkBaseClass):
             self._output_value = self._round_to_step_size(self._from_ + (self._value * (self._to - self._from_)))
             self._value = (self._output_value - self._from_) / (self._to - self._from_)
 
-            self._draw(no_color_updates=False)
+            self._request_draw(no_color_updates=False)
 
             if self._variable is not None:
                 self._variable_callback_blocked = True
@@ -378,7 +379,7 @@ class CTkSlider(CTkBaseClass):
         self._output_value = self._round_to_step_size(output_value)
         self._value = (self._output_value - self._from_) / (self._to - self._from_)
 
-        self._draw(no_color_updates=False)
+        self._request_draw(no_color_updates=False)
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
@@ -54,26 +54,27 @@ class CTkSwitch(CTkBaseClass):
 
         # color
         self._border_color = self._check_color_type(border_color, transparency=True)
-        self._fg_color = ThemeManager.theme["CTkSwitch"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._progress_color = ThemeManager.theme["CTkSwitch"]["progress_color"] if progress_color is None else self._check_color_type(progress_color, transparency=True)
-        self._button_color = ThemeManager.theme["CTkSwitch"]["button_color"] if button_color is None else self._check_color_type(button_color)
-        self._button_hover_color = ThemeManager.theme["CTkSwitch"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
-        self._text_color = ThemeManager.theme["CTkSwitch"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkSwitch"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        theme_defaults = ThemeManager.get_defaults("CTkSwitch")
+        self._fg_color = theme_defaults["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._progress_color = theme_defaults["progress_color"] if progress_color is None else self._check_color_type(progress_color, transparency=True)
+        self._button_color = theme_defaults["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = theme_defaults["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        self._text_color = theme_defaults["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = theme_defaults["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
 
         # text
         self._text = text
         self._text_label = None
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = CTkFont.get_shared_font() if font is None else self._check_font_type(font)
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkSwitch"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkSwitch"]["border_width"] if border_width is None else border_width
-        self._button_length = ThemeManager.theme["CTkSwitch"]["button_length"] if button_length is None else button_length
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
+        self._button_length = theme_defaults["button_length"] if button_length is None else button_length
         self._hover_state: bool = False
         self._check_state: bool = False  # True if switch is activated
         self._hover = hover
@@ -148,7 +149,7 @@ class CTkSwitch(CTkBaseClass):
                                   height=self._apply_widget_scaling(self._desired_height))
         self._canvas.configure(width=self._apply_widget_scaling(self._switch_width),
                                height=self._apply_widget_scaling(self._switch_height))
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width: int = None, height: int = None):
         super()._set_dimensions(width, height)
@@ -376,7 +377,7 @@ class CTkSwitch(CTkBaseClass):
         elif attribute_name == "text":
             return self._text
         elif attribute_name == "font":
-            return self._font
+            return self._get_private_font()
         elif attribute_name == "textvariable":
             return self._textvariable
         elif attribute_name == "onvalue":
@@ -402,7 +403,7 @@ class CTkSwitch(CTkBaseClass):
             else:
                 self._check_state = True
 
-            self._draw(no_color_updates=True)
+            self._request_draw(no_color_updates=True)
 
             if self._variable is not None:
                 self._variable_callback_blocked = True
@@ -416,7 +417,7 @@ class CTkSwitch(CTkBaseClass):
         if self._state is not tkinter.DISABLED or from_variable_callback:
             self._check_state = True
 
-            self._draw(no_color_updates=True)
+            self._request_draw(no_color_updates=True)
 
             if self._variable is not None and not from_variable_callback:
                 self._variable_callback_blocked = True
@@ -427,7 +428,7 @@ class CTkSwitch(CTkBaseClass):
         if self._state is not tkinter.DISABLED or from_variable_callback:
             self._check_state = False
 
-            self._draw(no_color_updates=True)
+            self._request_draw(no_color_updates=True)
 
             if self._variable is not None and not from_variable_callback:
                 self._variable_callback_blocked = True
@@ -48,24 +48,26 @@ class CTkTabview(CTkBaseClass):
         # transfer some functionality to CTkFrame
         super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
 
+        theme_defaults = ThemeManager.get_defaults("CTkFrame")
+
         # color
-        self._border_color = ThemeManager.theme["CTkFrame"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._border_color = theme_defaults["border_color"] if border_color is None else self._check_color_type(border_color)
 
         # determine fg_color of frame
         if fg_color is None:
             if isinstance(self.master, (CTkFrame, CTkTabview)):
-                if self.master.cget("fg_color") == ThemeManager.theme["CTkFrame"]["fg_color"]:
-                    self._fg_color = ThemeManager.theme["CTkFrame"]["top_fg_color"]
+                if self.master.cget("fg_color") == theme_defaults["fg_color"]:
+                    self._fg_color = theme_defaults["top_fg_color"]
                 else:
-                    self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"]
+                    self._fg_color = theme_defaults["fg_color"]
             else:
-                self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"]
+                self._fg_color = theme_defaults["fg_color"]
         else:
             self._fg_color = self._check_color_type(fg_color, transparency=True)
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkFrame"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkFrame"]["border_width"] if border_width is None else border_width
+        self._corner_radius = theme_defaults["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = theme_defaults["border_width"] if border_width is None else border_width
         self._anchor = anchor
 
         self._canvas = CTkCanvas(master=self,
@@ -128,14 +130,14 @@ class CTkTabview(CTkBaseClass):
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height - self._outer_spacing - self._outer_button_overhang))
         self._configure_grid()
-        self._draw(no_color_updates=True)
+        self._request_draw(no_color_updates=True)
 
     def _set_dimensions(self, width=None, height=None):
         super()._set_dimensions(width, height)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height - self._outer_spacing - self._outer_button_overhang))
-        self._draw()
+        self._request_draw()
 
     def _configure_segmented_button_background_corners(self):
         """ needs to be called for changes in fg_color, bg_color """
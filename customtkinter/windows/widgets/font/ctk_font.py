@@ -1,6 +1,9 @@
+import tkinter
 from tkinter.font import Font
 import copy
-from typing import List, Callable, Tuple, Optional
+import weakref
+from collections import OrderedDict
+from typing import Callable, Tuple, Optional, Hashable, Iterable, List, Union
 try:
     from typing import Literal
 except ImportError:
@@ -12,7 +15,7 @@ from ..theme import ThemeManager
 class CTkFont(Font):
     """
     Font object with size in pixel, independent of scaling.
-    To get scaled tuple representation use create_scaled_tuple() method.
+    To get scaled named font use get_scaled_font() method, scaled tuple representation with create_scaled_tuple() method.
 
     family	The font family name as a string.
     size	The font height as an integer in pixel.
@@ -22,8 +25,56 @@ class CTkFont(Font):
     overstrike	1 for overstruck text, 0 for normal.
 
     Tkinter Font: https://anzeljg.github.io/rin2/book2/2405/docs/tkinter/fonts.html
+
+    Widgets created without font argument share one CTkFont instance, see get_shared_font().
     """
 
+    scaled_font_cache_size: int = 4  # max number of unused scaling factors with named scaled font kept per CTkFont
+    # text widths measured by measure_text() and measure_texts(), shared by all fonts, least recently used first
+    measure_cache_size: int = 10_000
+    measure_cache_hits: int = 0
+    measure_cache_misses: int = 0
+    # font names are only unique per Tcl interpreter (derived from id() on Python 3.7), so the root window is part of the key,
+    # it is referenced weakly and its entries get dropped with it, so the cache doesn't keep Tcl interpreters alive
+    _measure_cache: OrderedDict = OrderedDict()  # (weak reference to root, font name, font version, text) -> width in pixel
+    _root_references = weakref.WeakKeyDictionary()  # root -> weak reference used in measure cache keys
+
+    # measures a list of texts in one Tcl call
+    _measure_lambda: str = "{font texts} {set widths {}; foreach text $texts {lappend widths [font measure $font $text]}; return $widths}"
+
+    _shared_fonts = weakref.WeakKeyDictionary()  # root -> WeakValueDictionary of font key -> shared CTkFont
+
+    @classmethod
+    def get_shared_font(cls,
+                        family: Optional[str] = None,
+                        size: Optional[int] = None,
+                        weight: Literal["normal", "bold"] = None,
+                        slant: Literal["italic", "roman"] = "roman",
+                        underline: bool = False,
+                        overstrike: bool = False) -> "CTkFont":
+        """ returns an interned CTkFont with these attributes, without arguments the default font of the theme,
+            configuring a shared font changes all widgets using it, so create a CTkFont for an independent font,
+            widgets never return a shared font in cget("font"), they replace it with a private copy first """
+        theme_defaults = ThemeManager.get_defaults("CTkFont")
+        key = (theme_defaults["family"] if family is None else family,
+               theme_defaults["size"] if size is None else size,
+               theme_defaults["weight"] if weight is None else weight,
+               slant, bool(underline), bool(overstrike))
+
+        root = tkinter._default_root
+        if root is None:
+            return cls(*key)  # no root to share the font in yet
+
+        shared_fonts = cls._shared_fonts.get(root)
+        if shared_fonts is None:
+            shared_fonts = cls._shared_fonts[root] = weakref.WeakValueDictionary()
+
+        font = shared_fonts.get(key)
+        if font is None:
+            font = shared_fonts[key] = cls(*key)
+            font._shared_key = (weakref.ref(root), key)
+        return font
+
     def __init__(self,
                  family: Optional[str] = None,
                  size: Optional[int] = None,
@@ -32,39 +83,165 @@ class CTkFont(Font):
                  underline: bool = False,
                  overstrike: bool = False):
 
-        self._size_configure_callback_list: List[Callable] = []
+        self._size_configure_callback_dict: dict = {}  # callback key -> callback, ordered like added
+        self._shared_key: Optional[tuple] = None  # (weak reference to root, font key) if font is interned by get_shared_font()
+        self._scaled_fonts: dict = {}  # scaling factor -> named Font with scaled size, least recently used first
+        self._scaled_font_refs = weakref.WeakValueDictionary()  # scaling factor -> every named scaled Font still in use
+        self._version: int = 0  # increased by configure(), invalidates measured text widths
+        self._metrics_cache: dict = {}  # scaling factor -> metrics dict
 
-        self._size = ThemeManager.theme["CTkFont"]["size"] if size is None else size
+        theme_defaults = ThemeManager.get_defaults("CTkFont")
+        self._size = theme_defaults["size"] if size is None else size
 
-        super().__init__(family=ThemeManager.theme["CTkFont"]["family"] if family is None else family,
+        super().__init__(family=theme_defaults["family"] if family is None else family,
                          size=-abs(self._size),
-                         weight=ThemeManager.theme["CTkFont"]["weight"] if weight is None else weight,
+                         weight=theme_defaults["weight"] if weight is None else weight,
                          slant=slant,
                          underline=underline,
                          overstrike=overstrike)
 
         self._family = super().cget("family")
         self._tuple_style_string = f"{super().cget('weight')} {slant} {'underline' if underline else ''} {'overstrike' if overstrike else ''}"
+        self._root_reference = self._get_root_reference(tkinter._default_root)  # font was created in the interpreter of the default root
+
+    @staticmethod
+    def _get_callback_key(callback: Callable) -> Hashable:
+        # bound methods are recreated on every attribute access, so they are identified by object id and function
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return id(callback.__self__), callback.__func__
+        else:
+            return callback
 
     def add_size_configure_callback(self, callback: Callable):
         """ add function, that gets called when font got configured """
-        self._size_configure_callback_list.append(callback)
+        self._size_configure_callback_dict[self._get_callback_key(callback)] = callback
 
     def remove_size_configure_callback(self, callback: Callable):
         """ remove function, that gets called when font got configured """
-        try:
-            self._size_configure_callback_list.remove(callback)
-        except ValueError:
-            pass
+        self._size_configure_callback_dict.pop(self._get_callback_key(callback), None)
 
     def create_scaled_tuple(self, font_scaling: float) -> Tuple[str, int, str]:
         """ return scaled tuple representation of font in the form (family: str, size: int, style: str)"""
         return self._family, round(-abs(self._size) * font_scaling), self._tuple_style_string
 
+    def _get_scaled_options(self, font_scaling: float) -> dict:
+        return {"family": self._family,
+                "size": round(-abs(self._size) * font_scaling),
+                "weight": super().cget("weight"),
+                "slant": super().cget("slant"),
+                "underline": super().cget("underline"),
+                "overstrike": super().cget("overstrike")}
+
+    def get_scaled_font(self, font_scaling: float) -> Font:
+        """ return named font with scaled size, which gets updated when the CTkFont is configured,
+            so widgets using it don't need to resolve a new font tuple, the Tk font gets deleted when the
+            returned object is garbage collected, so widgets keep a reference while they use it """
+        scaled_font = self._scaled_fonts.pop(font_scaling, None)
+        if scaled_font is None:
+            scaled_font = self._scaled_font_refs.get(font_scaling)  # dropped from cache, but still used by a widget
+        if scaled_font is None:
+            scaled_font = self._scaled_font_refs[font_scaling] = Font(root=self._tk, **self._get_scaled_options(font_scaling))
+
+        if len(self._scaled_fonts) >= self.scaled_font_cache_size:
+            del self._scaled_fonts[next(iter(self._scaled_fonts))]  # drop least recently used, widgets still using it keep it alive
+        self._scaled_fonts[font_scaling] = scaled_font
+        return scaled_font
+
+    @classmethod
+    def get_measure_cache_info(cls) -> dict:
+        """ returns dict with hits, misses and number of cached text widths """
+        return {"hits": cls.measure_cache_hits,
+                "misses": cls.measure_cache_misses,
+                "size": len(cls._measure_cache)}
+
+    @classmethod
+    def _get_root_reference(cls, root) -> weakref.ref:
+        reference = cls._root_references.get(root)
+        if reference is None:
+            reference = cls._root_references[root] = weakref.ref(root, cls._forget_root)
+        return reference
+
+    @classmethod
+    def _forget_root(cls, reference: weakref.ref):
+        for key in [key for key in cls._measure_cache if key[0] is reference]:
+            del cls._measure_cache[key]
+
+    @classmethod
+    def clear_measure_cache(cls):
+        cls._measure_cache.clear()
+        cls.measure_cache_hits = 0
+        cls.measure_cache_misses = 0
+
+    def _get_measure_font(self, font_scaling: float) -> Font:
+        return self if font_scaling == 1 else self.get_scaled_font(font_scaling)
+
+    def measure_text(self, text: str, font_scaling: float = 1) -> int:
+        """ return width of text in pixel with scaled font, results are cached """
+        return self.measure_texts((text,), font_scaling)[0]
+
+    def measure_texts(self, texts: Iterable[str], font_scaling: float = 1) -> List[int]:
+        """ return widths of texts in pixel with scaled font, all texts without cached width are measured with one Tcl call """
+        font_name = self._get_measure_font(font_scaling).name
+        cache = self._measure_cache
+
+        widths = []
+        uncached_texts = {}  # text -> indices in widths
+        for index, text in enumerate(texts):
+            key = (self._root_reference, font_name, self._version, text)
+            width = cache.get(key)
+            if width is None:
+                uncached_texts.setdefault(text, []).append(index)
+            else:
+                cache.move_to_end(key)
+            widths.append(width)
+
+        CTkFont.measure_cache_hits += len(widths) - sum(len(indices) for indices in uncached_texts.values())
+        CTkFont.measure_cache_misses += len(uncached_texts)
+
+        if len(uncached_texts) > 0:
+            measured_widths = self._tk.splitlist(self._tk.call("apply", self._measure_lambda, font_name, tuple(uncached_texts)))
+            for (text, indices), width in zip(uncached_texts.items(), measured_widths):
+                cache[(self._root_reference, font_name, self._version, text)] = int(width)
+                for index in indices:
+                    widths[index] = int(width)
+
+            while len(cache) > self.measure_cache_size:
+                cache.popitem(last=False)
+
+        return widths
+
+    def _is_shared(self) -> bool:
+        return self._shared_key is not None
+
+    @staticmethod
+    def _get_private_font(font: Union[tuple, "CTkFont"], size_configure_callback: Callable) -> Union[tuple, "CTkFont"]:
+        """ returns font, or a private copy of it if it is shared by get_shared_font(), the copy takes over size_configure_callback,
+            so configuring it only changes the widget of the callback, the copy has the same attributes and needs no update """
+        if isinstance(font, CTkFont) and font._is_shared():
+            font.remove_size_configure_callback(size_configure_callback)
+            font = CTkFont(*font._shared_key[1])
+            font.add_size_configure_callback(size_configure_callback)
+        return font
+
+    def get_metrics(self, font_scaling: float = 1) -> dict:
+        """ return dict with ascent, descent, linespace and fixed of scaled font, results are cached """
+        metrics = self._metrics_cache.get(font_scaling)
+        if metrics is None:
+            metrics = self._metrics_cache[font_scaling] = Font.metrics(self._get_measure_font(font_scaling))
+        return dict(metrics)
+
     def config(self, *args, **kwargs):
         raise AttributeError("'config' is not implemented for CTk widgets. For consistency, always use 'configure' instead.")
 
     def configure(self, **kwargs):
+        if self._shared_key is not None:
+            # attributes don't match the key anymore, later get_shared_font() calls create a new font
+            root, key = self._shared_key[0](), self._shared_key[1]
+            shared_fonts = None if root is None else self._shared_fonts.get(root)
+            if shared_fonts is not None and shared_fonts.get(key) is self:
+                del shared_fonts[key]
+            self._shared_key = None
+
         if "size" in kwargs:
             self._size = kwargs.pop("size")
             super().configure(size=-abs(self._size))
@@ -78,8 +255,16 @@ class CTkFont(Font):
         # update style string for create_scaled_tuple() method
         self._tuple_style_string = f"{super().cget('weight')} {super().cget('slant')} {'underline' if super().cget('underline') else ''} {'overstrike' if super().cget('overstrike') else ''}"
 
+        # cached text widths and metrics are outdated
+        self._version += 1
+        self._metrics_cache.clear()
+
+        # update named scaled fonts in place, widgets using them get updated by Tk
+        for font_scaling, scaled_font in list(self._scaled_font_refs.items()):
+            scaled_font.configure(**self._get_scaled_options(font_scaling))
+
         # call all functions registered with add_size_configure_callback()
-        for callback in self._size_configure_callback_list:
+        for callback in list(self._size_configure_callback_dict.values()):
             callback()
 
     def cget(self, attribute_name: str) -> any:
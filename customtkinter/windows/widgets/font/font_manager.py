@@ -1,12 +1,60 @@
 import sys
 import os
 import shutil
-from typing import Union
+import filecmp
+import tkinter
+from typing import Union, Callable, Optional, List, Tuple
 
 
 class FontManager:
 
-    linux_font_path = "~/.fonts/"
+    # font directory on Linux, can be set to a shared or read-only directory with the fonts already installed
+    linux_font_path = os.environ.get("CUSTOMTKINTER_FONT_PATH", "~/.fonts/")
+
+    # fonts registered with register_font() get loaded by install_fonts() when the first window or widget is created,
+    # on Linux a Tk instance started before (e.g. plain tkinter.Tk() root) may not find fonts copied after its start
+    _registered_fonts: List[Tuple[str, Optional[Callable]]] = []
+    _fonts_installed: bool = True
+
+    @classmethod
+    def register_font(cls, font_path: str, failure_callback: Optional[Callable] = None):
+        """ load font with the next install_fonts() call, failure_callback gets called if loading fails,
+            the font gets loaded immediately if a tkinter root window exists already """
+        cls._registered_fonts.append((font_path, failure_callback))
+        cls._fonts_installed = False
+
+        if tkinter._default_root is not None:
+            cls.install_fonts()  # Tk is running already, waiting for the first window or widget doesn't help
+
+    @classmethod
+    def install_fonts(cls):
+        """ load all registered fonts, returns immediately if they are loaded already """
+        if cls._fonts_installed:
+            return
+        cls._fonts_installed = True
+
+        cls.init_font_manager()
+        registered_fonts, cls._registered_fonts = cls._registered_fonts, []
+        copied_fonts = []
+        for font_path, failure_callback in registered_fonts:
+            loaded, copied = cls._load_font(font_path)
+            if copied:
+                copied_fonts.append(os.path.basename(font_path))
+            if loaded is False and failure_callback is not None:
+                failure_callback()
+
+        if len(copied_fonts) > 0 and tkinter._default_root is not None:
+            sys.stderr.write(f"FontManager warning: fonts {', '.join(copied_fonts)} were installed after a tkinter root window was created " +
+                             "and may only be available after a restart. Call customtkinter.FontManager.install_fonts() before creating a tkinter.Tk root.\n")
+
+    @classmethod
+    def _linux_font_up_to_date(cls, font_path: str) -> bool:
+        # compares size and modification time, copy2 keeps the modification time of the source
+        installed_font_path = os.path.join(os.path.expanduser(cls.linux_font_path), os.path.basename(font_path))
+        try:
+            return os.path.isfile(installed_font_path) and filecmp.cmp(font_path, installed_font_path, shallow=True)
+        except OSError:
+            return False
 
     @classmethod
     def init_font_manager(cls):
@@ -14,7 +62,7 @@ class FontManager:
         if sys.platform.startswith("linux"):
             try:
                 if not os.path.isdir(os.path.expanduser(cls.linux_font_path)):
-                    os.mkdir(os.path.expanduser(cls.linux_font_path))
+                    os.makedirs(os.path.expanduser(cls.linux_font_path))
                 return True
             except Exception as err:
                 sys.stderr.write("FontManager error: " + str(err) + "\n")
@@ -48,19 +96,27 @@ class FontManager:
 
     @classmethod
     def load_font(cls, font_path: str) -> bool:
+        return cls._load_font(font_path)[0]
+
+    @classmethod
+    def _load_font(cls, font_path: str) -> Tuple[bool, bool]:
+        """ returns (loaded, copied), copied is True if the font file was copied to linux_font_path """
         # Windows
         if sys.platform.startswith("win"):
-            return cls.windows_load_font(font_path, private=True, enumerable=False)
+            return cls.windows_load_font(font_path, private=True, enumerable=False), False
 
         # Linux
         elif sys.platform.startswith("linux"):
             try:
-                shutil.copy(font_path, os.path.expanduser(cls.linux_font_path))
-                return True
+                if cls._linux_font_up_to_date(font_path):
+                    return True, False
+
+                shutil.copy2(font_path, os.path.join(os.path.expanduser(cls.linux_font_path), os.path.basename(font_path)))
+                return True, True
             except Exception as err:
                 sys.stderr.write("FontManager error: " + str(err) + "\n")
-                return False
+                return False, False
 
         # macOS and others
         else:
-            return False
+            return False, False
@@ -1,4 +1,6 @@
-from typing import Tuple, Dict, Callable, List
+import weakref
+from collections import OrderedDict
+from typing import Tuple, Dict, Callable, List, Optional
 try:
     from PIL import Image, ImageTk
 except ImportError:
@@ -14,10 +16,22 @@ class CTkImage:
     size: tuple (<width>, <height>) with display size for both images
 
     One of the two images can be None and will be replaced by the other image.
+
+    Scaled photo images of all CTkImage instances share the memory budget photo_image_memory_budget (bytes, None for no limit).
+    Least recently used photo images are evicted when the budget is exceeded and created again when needed,
+    photo images currently displayed by a widget are never evicted.
     """
 
     _checked_PIL_import = False
 
+    photo_image_memory_budget: Optional[int] = 64 * 1024 * 1024
+    photo_image_hits: int = 0
+    photo_image_misses: int = 0
+    photo_image_evictions: int = 0
+    photo_image_eviction_checks: int = 16  # max number of photo images in use skipped per created photo image
+    _photo_image_resident_bytes: int = 0
+    _photo_image_lru: OrderedDict = OrderedDict()  # (weak reference to CTkImage, mode, scaled size) -> bytes
+
     def __init__(self,
                  light_image: "Image.Image" = None,
                  dark_image: "Image.Image" = None,
@@ -35,6 +49,10 @@ class CTkImage:
         self._scaled_light_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
         self._scaled_dark_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
 
+        # keys of photo images in _photo_image_lru, which get removed with the CTkImage object
+        self._photo_image_keys: set = set()
+        self._weak_reference = weakref.ref(self, lambda _, keys=self._photo_image_keys: CTkImage._forget_photo_images(keys))
+
     @classmethod
     def _check_pil_import(cls):
         try:
@@ -42,6 +60,56 @@ class CTkImage:
         except NameError:
             raise ImportError("PIL.Image and PIL.ImageTk couldn't be imported")
 
+    @classmethod
+    def get_photo_image_cache_info(cls) -> dict:
+        """ returns dict with hits, misses, evictions, number and resident bytes of the scaled photo images """
+        return {"hits": cls.photo_image_hits,
+                "misses": cls.photo_image_misses,
+                "evictions": cls.photo_image_evictions,
+                "images": len(cls._photo_image_lru),
+                "resident_bytes": cls._photo_image_resident_bytes}
+
+    @classmethod
+    def _forget_photo_images(cls, keys: set):
+        for key in keys:
+            cls._photo_image_resident_bytes -= cls._photo_image_lru.pop(key, 0)
+        keys.clear()
+
+    @staticmethod
+    def _photo_image_in_use(photo_image: "ImageTk.PhotoImage") -> bool:
+        try:
+            return bool(photo_image.tk.getboolean(photo_image.tk.call("image", "inuse", str(photo_image))))
+        except Exception:
+            return True  # can't be checked, so it is not evicted
+
+    @classmethod
+    def _evict_photo_images(cls, keep_key: tuple):
+        if cls.photo_image_memory_budget is None:
+            return
+
+        # photo images in use are moved to the end, so later calls continue with the other photo images,
+        # a call stops after one pass or after photo_image_eviction_checks photo images in use
+        lru = cls._photo_image_lru
+        in_use_checks = 0
+        while cls._photo_image_resident_bytes > cls.photo_image_memory_budget and in_use_checks < cls.photo_image_eviction_checks:
+            key = next(iter(lru))  # least recently used
+            if key == keep_key:
+                break  # all other photo images were checked, photo image which is just returned is next
+
+            reference, mode, scaled_size = key
+            image = reference()
+            if image is not None:
+                photo_images = image._scaled_light_photo_images if mode == "light" else image._scaled_dark_photo_images
+                if scaled_size in photo_images and cls._photo_image_in_use(photo_images[scaled_size]):
+                    in_use_checks += 1
+                    lru.move_to_end(key)
+                    continue
+                photo_images.pop(scaled_size, None)
+                image._photo_image_keys.discard(key)
+
+            cls._photo_image_resident_bytes -= lru.pop(key)
+            cls.photo_image_evictions += 1
+
     def add_configure_callback(self, callback: Callable):
         """ add function, that gets called when image got configured """
         self._configure_callback_list.append(callback)
@@ -54,10 +122,16 @@ class CTkImage:
         if "light_image" in kwargs:
             self._light_image = kwargs.pop("light_image")
             self._scaled_light_photo_images = {}
+            keys = {key for key in self._photo_image_keys if key[1] == "light"}
+            self._photo_image_keys.difference_update(keys)
+            self._forget_photo_images(keys)
             self._check_images()
         if "dark_image" in kwargs:
             self._dark_image = kwargs.pop("dark_image")
             self._scaled_dark_photo_images = {}
+            keys = {key for key in self._photo_image_keys if key[1] == "dark"}
+            self._photo_image_keys.difference_update(keys)
+            self._forget_photo_images(keys)
             self._check_images()
         if "size" in kwargs:
             self._size = kwargs.pop("size")
@@ -92,19 +166,32 @@ class CTkImage:
     def _get_scaled_size(self, widget_scaling: float) -> Tuple[int, int]:
         return round(self._size[0] * widget_scaling), round(self._size[1] * widget_scaling)
 
+    def _get_scaled_photo_image(self, mode: str, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
+        photo_images = self._scaled_light_photo_images if mode == "light" else self._scaled_dark_photo_images
+        key = (self._weak_reference, mode, scaled_size)
+
+        if scaled_size in photo_images:
+            CTkImage.photo_image_hits += 1
+            self._photo_image_lru.move_to_end(key)
+            return photo_images[scaled_size]
+
+        CTkImage.photo_image_misses += 1
+        image = self._light_image if mode == "light" else self._dark_image
+        photo_images[scaled_size] = ImageTk.PhotoImage(image.resize(scaled_size))
+
+        # Tk stores photo images with 4 bytes per pixel
+        self._photo_image_lru[key] = scaled_size[0] * scaled_size[1] * 4
+        CTkImage._photo_image_resident_bytes += self._photo_image_lru[key]
+        self._photo_image_keys.add(key)
+
+        self._evict_photo_images(keep_key=key)
+        return photo_images[scaled_size]
+
     def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_light_photo_images:
-            return self._scaled_light_photo_images[scaled_size]
-        else:
-            self._scaled_light_photo_images[scaled_size] = ImageTk.PhotoImage(self._light_image.resize(scaled_size))
-            return self._scaled_light_photo_images[scaled_size]
+        return self._get_scaled_photo_image("light", scaled_size)
 
     def _get_scaled_dark_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_dark_photo_images:
-            return self._scaled_dark_photo_images[scaled_size]
-        else:
-            self._scaled_dark_photo_images[scaled_size] = ImageTk.PhotoImage(self._dark_image.resize(scaled_size))
-            return self._scaled_dark_photo_images[scaled_size]
+        return self._get_scaled_photo_image("dark", scaled_size)
 
     def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> "ImageTk.PhotoImage":
         scaled_size = self._get_scaled_size(widget_scaling)
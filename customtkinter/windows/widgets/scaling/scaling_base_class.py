@@ -1,5 +1,6 @@
 from typing import Union, Tuple
-import copy
+from collections import OrderedDict
+from tkinter.font import Font
 import re
 try:
     from typing import Literal
@@ -28,17 +29,70 @@ class CTkScalingBaseClass:
     - _reverse_geometry_scaling()
     - _parse_geometry_string()
 
+    Scaled fonts, arguments and geometry strings are memorized per scaling factor and shared between
+    all instances, memos of scaling factors no longer in use get dropped when _set_scaling() runs.
     """
+
+    scaling_memo_max_factors: int = 4  # number of scaling factors with memorized values
+    scaling_memo_max_size: int = 1024  # max number of memorized values per scaling factor
+    scaling_memo_hits: int = 0
+    scaling_memo_misses: int = 0
+    _scaling_memo: OrderedDict = OrderedDict()  # (scaling type, scaling factor) -> dict of (kind, value) -> scaled value
+
     def __init__(self, scaling_type: Literal["widget", "window"] = "widget"):
         self.__scaling_type = scaling_type
 
         if self.__scaling_type == "widget":
+            self.__scaled_font: Union[Font, None] = None  # named font returned by _apply_font_scaling(), kept alive while used
             ScalingTracker.add_widget(self._set_scaling, self)  # add callback for automatic scaling changes
             self.__widget_scaling = ScalingTracker.get_widget_scaling(self)
+            self.__scaling_memo = self._get_scaling_memo(("widget", self.__widget_scaling))
         elif self.__scaling_type == "window":
             ScalingTracker.activate_high_dpi_awareness()  # make process DPI aware
             ScalingTracker.add_window(self._set_scaling, self)  # add callback for automatic scaling changes
             self.__window_scaling = ScalingTracker.get_window_scaling(self)
+            self.__scaling_memo = self._get_scaling_memo(("window", self.__window_scaling))
+
+    @classmethod
+    def _get_scaling_memo(cls, key: tuple) -> dict:
+        memo = cls._scaling_memo.get(key)
+        if memo is None:
+            memo = cls._scaling_memo[key] = {}
+            if len(cls._scaling_memo) > cls.scaling_memo_max_factors:
+                cls._scaling_memo.popitem(last=False)  # drop memo of least recently set scaling factor
+        return memo
+
+    @classmethod
+    def get_scaling_memo_info(cls) -> dict:
+        """ returns dict with hits, misses and number of memorized values of the scaled value memo """
+        return {"hits": cls.scaling_memo_hits,
+                "misses": cls.scaling_memo_misses,
+                "size": sum(len(memo) for memo in cls._scaling_memo.values()),
+                "factors": len(cls._scaling_memo)}
+
+    @classmethod
+    def clear_scaling_memo(cls):
+        for memo in cls._scaling_memo.values():
+            memo.clear()
+        cls.scaling_memo_hits = 0
+        cls.scaling_memo_misses = 0
+
+    def __memorized(self, key: tuple, function, *args):
+        # returns memorized result of function(*args) for the current scaling factor
+        try:
+            result = self.__scaling_memo[key]
+            CTkScalingBaseClass.scaling_memo_hits += 1
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            return function(*args)  # unhashable value, can't be memorized
+
+        CTkScalingBaseClass.scaling_memo_misses += 1
+        if len(self.__scaling_memo) >= self.scaling_memo_max_size:
+            self.__scaling_memo.clear()
+        result = self.__scaling_memo[key] = function(*args)
+        return result
 
     def destroy(self):
         if self.__scaling_type == "widget":
@@ -51,6 +105,13 @@ class CTkScalingBaseClass:
         self.__widget_scaling = new_widget_scaling
         self.__window_scaling = new_window_scaling
 
+        if self.__scaling_type == "widget":
+            key = ("widget", self.__widget_scaling)
+        else:
+            key = ("window", self.__window_scaling)
+        self.__scaling_memo = self._get_scaling_memo(key)
+        self._scaling_memo.move_to_end(key)
+
     def _get_widget_scaling(self) -> float:
         return self.__widget_scaling
 
@@ -73,50 +134,56 @@ class CTkScalingBaseClass:
         assert self.__scaling_type == "window"
         return int(scaled_value / self.__window_scaling)
 
-    def _apply_font_scaling(self, font: Union[Tuple, CTkFont]) -> tuple:
-        """ Takes CTkFont object and returns tuple font with scaled size, has to be called again for every change of font object """
+    def _apply_font_scaling(self, font: Union[Tuple, CTkFont]) -> Union[tuple, Font]:
+        """ Takes CTkFont object and returns named font with scaled size, or tuple font and returns tuple with scaled size,
+            has to be called again for every change of font object, only the last returned named font is kept alive """
         assert self.__scaling_type == "widget"
 
         if type(font) == tuple:
             if len(font) == 1:
                 return font
-            elif len(font) == 2:
-                return font[0], -abs(round(font[1] * self.__widget_scaling))
-            elif 3 <= len(font) <= 6:
-                return font[0], -abs(round(font[1] * self.__widget_scaling)), font[2:]
+            elif 2 <= len(font) <= 6:
+                return self.__memorized(("font", font), self.__scale_font_tuple, font)
             else:
                 raise ValueError(f"Can not scale font {font}. font needs to be tuple of len 1, 2 or 3")
 
         elif isinstance(font, CTkFont):
-            return font.create_scaled_tuple(self.__widget_scaling)
+            self.__scaled_font = font.get_scaled_font(self.__widget_scaling)
+            return self.__scaled_font
         else:
             raise ValueError(f"Can not scale font '{font}' of type {type(font)}. font needs to be tuple or instance of CTkFont")
 
+    def __scale_font_tuple(self, font: tuple) -> tuple:
+        if len(font) == 2:
+            return font[0], -abs(round(font[1] * self.__widget_scaling))
+        else:
+            return font[0], -abs(round(font[1] * self.__widget_scaling)), font[2:]
+
     def _apply_argument_scaling(self, kwargs: dict) -> dict:
+        """ returns kwargs with scaled padding and place coordinates, returns kwargs itself if there is nothing to scale """
         assert self.__scaling_type == "widget"
 
-        scaled_kwargs = copy.copy(kwargs)
-
-        # scale padding values
-        if "pady" in scaled_kwargs:
-            if isinstance(scaled_kwargs["pady"], (int, float)):
-                scaled_kwargs["pady"] = self._apply_widget_scaling(scaled_kwargs["pady"])
-            elif isinstance(scaled_kwargs["pady"], tuple):
-                scaled_kwargs["pady"] = tuple([self._apply_widget_scaling(v) for v in scaled_kwargs["pady"]])
-        if "padx" in kwargs:
-            if isinstance(scaled_kwargs["padx"], (int, float)):
-                scaled_kwargs["padx"] = self._apply_widget_scaling(scaled_kwargs["padx"])
-            elif isinstance(scaled_kwargs["padx"], tuple):
-                scaled_kwargs["padx"] = tuple([self._apply_widget_scaling(v) for v in scaled_kwargs["padx"]])
-
-        # scaled x, y values for place geometry manager
-        if "x" in scaled_kwargs:
-            scaled_kwargs["x"] = self._apply_widget_scaling(scaled_kwargs["x"])
-        if "y" in scaled_kwargs:
-            scaled_kwargs["y"] = self._apply_widget_scaling(scaled_kwargs["y"])
+        scaled_arguments = tuple((key, kwargs[key]) for key in ("padx", "pady", "x", "y") if key in kwargs)
+        if len(scaled_arguments) == 0:
+            return kwargs
 
+        scaled_kwargs = dict(kwargs)
+        scaled_kwargs.update(self.__memorized(("arguments", scaled_arguments), self.__scale_arguments, scaled_arguments))
         return scaled_kwargs
 
+    def __scale_arguments(self, arguments: tuple) -> tuple:
+        scaled_arguments = []
+        for key, value in arguments:
+            if key in ("padx", "pady"):  # scale padding values
+                if isinstance(value, (int, float)):
+                    value = self._apply_widget_scaling(value)
+                elif isinstance(value, tuple):
+                    value = tuple([self._apply_widget_scaling(v) for v in value])
+            else:  # scaled x, y values for place geometry manager
+                value = self._apply_widget_scaling(value)
+            scaled_arguments.append((key, value))
+        return tuple(scaled_arguments)
+
     @staticmethod
     def _parse_geometry_string(geometry_string: str) -> tuple:
         #                 index:   1                   2           3          4             5       6
@@ -132,7 +199,9 @@ class CTkScalingBaseClass:
 
     def _apply_geometry_scaling(self, geometry_string: str) -> str:
         assert self.__scaling_type == "window"
+        return self.__memorized(("geometry", geometry_string), self.__scale_geometry_string, geometry_string)
 
+    def __scale_geometry_string(self, geometry_string: str) -> str:
         width, height, x, y = self._parse_geometry_string(geometry_string)
 
         if x is None and y is None:  # no <x> and <y> in geometry_string
@@ -146,7 +215,9 @@ class CTkScalingBaseClass:
 
     def _reverse_geometry_scaling(self, scaled_geometry_string: str) -> str:
         assert self.__scaling_type == "window"
+        return self.__memorized(("reverse_geometry", scaled_geometry_string), self.__reverse_scale_geometry_string, scaled_geometry_string)
 
+    def __reverse_scale_geometry_string(self, scaled_geometry_string: str) -> str:
         width, height, x, y = self._parse_geometry_string(scaled_geometry_string)
 
         if x is None and y is None:  # no <x> and <y> in geometry_string
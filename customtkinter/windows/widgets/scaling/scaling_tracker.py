@@ -1,17 +1,28 @@
 import tkinter
 import sys
-from typing import Callable
+import time
+import weakref
+from typing import Callable, Hashable
 
 
 class ScalingTracker:
     deactivate_automatic_dpi_awareness = False
 
-    window_widgets_dict = {}  # contains window objects as keys with list of widget callbacks as elements
-    window_dpi_scaling_dict = {}  # contains window objects as keys and corresponding scaling factors
+    # windows are referenced weakly, so nothing is retained after a window is deleted
+    window_widgets_dict = weakref.WeakKeyDictionary()  # window -> dict of callback key -> weak reference to the callback of the window and its widgets
+    window_dpi_scaling_dict = weakref.WeakKeyDictionary()  # window -> scaling factor
+    _widget_window_dict = weakref.WeakKeyDictionary()  # widget -> window root of widget
 
     widget_scaling = 1  # user values which multiply to detected window scaling factor
     window_scaling = 1
 
+    # DPI scaling is checked when a window got moved or resized and no further <Configure> event came in for dpi_check_delay,
+    # polling all windows every update_loop_interval is only used if use_dpi_polling is set before the first window is created
+    dpi_check_delay = 100  # ms
+    use_dpi_polling = False
+    _last_configure_times = weakref.WeakKeyDictionary()  # window -> time of last <Configure> event
+    _scheduled_dpi_checks = weakref.WeakSet()  # windows with scheduled debounced DPI check
+
     update_loop_running = False
     update_loop_interval = 100  # ms
     loop_pause_after_new_scaling = 1500  # ms
@@ -38,72 +49,121 @@ class ScalingTracker:
 
     @classmethod
     def get_window_root_of_widget(cls, widget):
+        window_root = cls._widget_window_dict.get(widget)
+        if window_root is not None:
+            return window_root
+
         current_widget = widget
 
         while isinstance(current_widget, tkinter.Tk) is False and\
                 isinstance(current_widget, tkinter.Toplevel) is False:
             current_widget = current_widget.master
 
+        cls._widget_window_dict[widget] = current_widget  # master of a widget never changes
         return current_widget
 
+    @staticmethod
+    def _get_callback_key(callback: Callable) -> Hashable:
+        # bound methods are recreated on every attribute access, so they are identified by object id and function
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return id(callback.__self__), callback.__func__
+        else:
+            return callback
+
+    @classmethod
+    def _add_callback(cls, window, callback: Callable):
+        callback_dict = cls.window_widgets_dict.get(window)
+        if callback_dict is None:
+            callback_dict = cls.window_widgets_dict[window] = {}
+
+        key = cls._get_callback_key(callback)
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            callback_dict[key] = weakref.WeakMethod(callback, lambda _, key=key: callback_dict.pop(key, None))
+        else:
+            callback_dict[key] = callback
+
+    @classmethod
+    def _get_callbacks(cls, window) -> list:
+        callbacks = []
+        callback_dict = cls.window_widgets_dict.get(window, {})
+        for key, callback in list(callback_dict.items()):
+            if isinstance(callback, weakref.WeakMethod):
+                callback = callback()
+                if callback is None:
+                    callback_dict.pop(key, None)  # object was deleted
+                    continue
+            callbacks.append(callback)
+        return callbacks
+
     @classmethod
     def update_scaling_callbacks_all(cls):
-        for window, callback_list in cls.window_widgets_dict.items():
-            for set_scaling_callback in callback_list:
-                if not cls.deactivate_automatic_dpi_awareness:
-                    set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
-                                         cls.window_dpi_scaling_dict[window] * cls.window_scaling)
-                else:
-                    set_scaling_callback(cls.widget_scaling,
-                                         cls.window_scaling)
+        cls._rescale_windows(list(cls.window_widgets_dict.keys()))
 
     @classmethod
     def update_scaling_callbacks_for_window(cls, window):
-        for set_scaling_callback in cls.window_widgets_dict[window]:
-            if not cls.deactivate_automatic_dpi_awareness:
-                set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
-                                     cls.window_dpi_scaling_dict[window] * cls.window_scaling)
-            else:
-                set_scaling_callback(cls.widget_scaling,
-                                     cls.window_scaling)
+        cls._rescale_windows([window])
+
+    @classmethod
+    def _rescale_windows(cls, windows: list):
+        """ Rescale transaction: all windows and widgets get their new scaling first, while the dimension events
+            of the windows are blocked. Widgets only request redraws and Tk only schedules the layout when
+            sizes change, so a single idle flush at the end does one layout pass and draws every widget once.
+            Widgets which get a different size from the new layout (e.g. sticky or fill) are drawn again
+            when their <Configure> event arrives, so this is not strictly one draw per widget. """
+
+        for window in windows:
+            if hasattr(window, "block_update_dimensions_event"):
+                window.block_update_dimensions_event()
+
+        try:
+            for window in windows:
+                for set_scaling_callback in cls._get_callbacks(window):
+                    if not cls.deactivate_automatic_dpi_awareness:
+                        set_scaling_callback(cls.window_dpi_scaling_dict[window] * cls.widget_scaling,
+                                             cls.window_dpi_scaling_dict[window] * cls.window_scaling)
+                    else:
+                        set_scaling_callback(cls.widget_scaling,
+                                             cls.window_scaling)
+
+            for app in {window._root() for window in windows}:
+                try:
+                    app.update_idletasks()
+                except tkinter.TclError:
+                    continue
+        finally:
+            for window in windows:
+                if hasattr(window, "unblock_update_dimensions_event"):
+                    window.unblock_update_dimensions_event()
 
     @classmethod
     def add_widget(cls, widget_callback: Callable, widget):
         window_root = cls.get_window_root_of_widget(widget)
-
-        if window_root not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window_root] = [widget_callback]
-        else:
-            cls.window_widgets_dict[window_root].append(widget_callback)
+        cls._add_callback(window_root, widget_callback)
 
         if window_root not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window_root] = cls.get_window_dpi_scaling(window_root)
 
-        if not cls.update_loop_running:
+        if cls.use_dpi_polling and not cls.update_loop_running:
             window_root.after(100, cls.check_dpi_scaling)
             cls.update_loop_running = True
 
     @classmethod
     def remove_widget(cls, widget_callback, widget):
-        window_root = cls.get_window_root_of_widget(widget)
-        try:
-            cls.window_widgets_dict[window_root].remove(widget_callback)
-        except:
-            pass
+        window_root = cls._widget_window_dict.pop(widget, None)
+        if window_root is None:
+            window_root = cls.get_window_root_of_widget(widget)
+            cls._widget_window_dict.pop(widget, None)
+        cls.window_widgets_dict.get(window_root, {}).pop(cls._get_callback_key(widget_callback), None)
 
     @classmethod
     def remove_window(cls, window_callback, window):
-        try:
-            del cls.window_widgets_dict[window]
-        except:
-            pass
+        cls.window_widgets_dict.pop(window, None)
+        cls.window_dpi_scaling_dict.pop(window, None)
+        cls._widget_window_dict.pop(window, None)
 
     @classmethod
     def add_window(cls, window_callback, window):
-        if window not in cls.window_widgets_dict:
-            cls.window_widgets_dict[window] = [window_callback]
-        else:
-            cls.window_widgets_dict[window].append(window_callback)
+        cls._add_callback(window, window_callback)
 
         if window not in cls.window_dpi_scaling_dict:
             cls.window_dpi_scaling_dict[window] = cls.get_window_dpi_scaling(window)
@@ -170,30 +230,63 @@ class ScalingTracker:
             return 1
 
     @classmethod
-    def check_dpi_scaling(cls):
-        new_scaling_detected = False
+    def request_dpi_check(cls, window):
+        """ called on <Configure> events of windows, checks DPI scaling of window after dpi_check_delay without further events """
+        if cls.deactivate_automatic_dpi_awareness or not sys.platform.startswith("win"):
+            return  # DPI scaling is only detected on Windows
 
-        # check for every window if scaling value changed
-        for window in cls.window_widgets_dict:
-            if window.winfo_exists() and not window.state() == "iconic":
-                current_dpi_scaling_value = cls.get_window_dpi_scaling(window)
-                if current_dpi_scaling_value != cls.window_dpi_scaling_dict[window]:
-                    cls.window_dpi_scaling_dict[window] = current_dpi_scaling_value
+        cls._last_configure_times[window] = time.perf_counter()
+        if window not in cls._scheduled_dpi_checks:
+            cls._scheduled_dpi_checks.add(window)
+            window.after(cls.dpi_check_delay, cls._debounced_dpi_check, window)
 
-                    if sys.platform.startswith("win"):
-                        window.attributes("-alpha", 0.15)
+    @classmethod
+    def _debounced_dpi_check(cls, window):
+        remaining_delay = cls.dpi_check_delay - (time.perf_counter() - cls._last_configure_times.get(window, 0)) * 1000
+        if remaining_delay >= 1:
+            window.after(int(remaining_delay), cls._debounced_dpi_check, window)  # window is still moving
+            return
 
-                    window.block_update_dimensions_event()
-                    cls.update_scaling_callbacks_for_window(window)
-                    window.unblock_update_dimensions_event()
+        cls._scheduled_dpi_checks.discard(window)
+        try:
+            cls.check_dpi_scaling_for_window(window)
+        except tkinter.TclError:
+            pass  # window got destroyed
+
+    @classmethod
+    def check_dpi_scaling_for_window(cls, window) -> bool:
+        """ checks if DPI scaling of window changed and updates window and widgets, returns True on change """
+        if window not in cls.window_dpi_scaling_dict or not window.winfo_exists() or window.state() == "iconic":
+            return False
 
-                    if sys.platform.startswith("win"):
-                        window.attributes("-alpha", 1)
+        current_dpi_scaling_value = cls.get_window_dpi_scaling(window)
+        if current_dpi_scaling_value == cls.window_dpi_scaling_dict[window]:
+            return False
 
-                    new_scaling_detected = True
+        cls.window_dpi_scaling_dict[window] = current_dpi_scaling_value
+
+        if sys.platform.startswith("win"):
+            window.attributes("-alpha", 0.15)
+
+        cls.update_scaling_callbacks_for_window(window)
+
+        if sys.platform.startswith("win"):
+            window.attributes("-alpha", 1)
+
+        return True
+
+    @classmethod
+    def check_dpi_scaling(cls):
+        """ polling fallback, only running if use_dpi_polling is True """
+        new_scaling_detected = False
+
+        # check for every window if scaling value changed
+        for window in list(cls.window_widgets_dict.keys()):
+            if cls.check_dpi_scaling_for_window(window):
+                new_scaling_detected = True
 
         # find an existing tkinter object for the next call of .after()
-        for app in cls.window_widgets_dict.keys():
+        for app in list(cls.window_widgets_dict.keys()):
             try:
                 if new_scaling_detected:
                     app.after(cls.loop_pause_after_new_scaling, cls.check_dpi_scaling)
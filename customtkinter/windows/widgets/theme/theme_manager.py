@@ -1,7 +1,11 @@
 import sys
 import os
+import warnings
 import pathlib
 import json
+import hashlib
+import marshal
+from types import MappingProxyType
 from typing import List, Union
 
 
@@ -11,37 +15,159 @@ class ThemeManager:
     _built_in_themes: List[str] = ["blue", "green", "dark-blue", "sweetkind"]
     _currently_loaded_theme: Union[str, None] = None
 
+    # theme_version gets increased on every load_theme() call, the per-class defaults are read-only views
+    # of the theme data, so direct edits of values still take effect, and they get created and validated
+    # again when the class dict or the whole theme dict is replaced
+    theme_version: int = 0
+    _defaults: dict = {}  # class name -> (theme[class name], MappingProxyType of theme[class name])
+
+    # the platform-resolved and normalized theme gets cached in marshal format together with size and modification
+    # time of the .json file, so later starts skip parsing and normalization, the cache is rewritten when the .json
+    # file changes, disabled by default because it writes to the user cache directory
+    use_theme_cache: bool = False
+    theme_cache_directory: Union[str, None] = None  # None: platform specific user cache directory
+    _theme_cache_format: int = 2
+
     @classmethod
     def load_theme(cls, theme_name_or_path: str):
         script_directory = os.path.dirname(os.path.abspath(__file__))
 
         if theme_name_or_path in cls._built_in_themes:
             customtkinter_path = pathlib.Path(script_directory).parent.parent.parent
-            with open(os.path.join(customtkinter_path, "assets", "themes", f"{theme_name_or_path}.json"), "r") as f:
-                cls.theme = json.load(f)
+            theme_path = os.path.join(customtkinter_path, "assets", "themes", f"{theme_name_or_path}.json")
+        else:
+            theme_path = theme_name_or_path
+
+        # the cache is checked with size and modification time of the .json file, so cache hits don't read the .json file
+        source_stat = cls._get_source_stat(theme_path) if cls.use_theme_cache else None
+        cached_theme = None if source_stat is None else cls._read_theme_cache(theme_path, source_stat)
+        if cached_theme is None:
+            with open(theme_path, "r") as f:
+                cls.theme = cls._normalize_theme(json.load(f))
         else:
-            with open(theme_name_or_path, "r") as f:
-                cls.theme = json.load(f)
+            cls.theme = cached_theme
 
         # store theme path for saving
         cls._currently_loaded_theme = theme_name_or_path
 
+        # cached themes got validated before they were written
+        cls.theme_version += 1
+        cls._compile_defaults(validate=cached_theme is None)
+
+        if cached_theme is None and source_stat is not None:
+            cls._write_theme_cache(theme_path, source_stat, cls.theme)
+
+    @staticmethod
+    def _normalize_theme(theme: dict) -> dict:
         # filter theme values for platform
-        for key in cls.theme.keys():
+        for key in theme.keys():
             # check if values for key differ on platforms
-            if "macOS" in cls.theme[key].keys():
+            if "macOS" in theme[key].keys():
                 if sys.platform == "darwin":
-                    cls.theme[key] = cls.theme[key]["macOS"]
+                    theme[key] = theme[key]["macOS"]
                 elif sys.platform.startswith("win"):
-                    cls.theme[key] = cls.theme[key]["Windows"]
+                    theme[key] = theme[key]["Windows"]
                 else:
-                    cls.theme[key] = cls.theme[key]["Linux"]
+                    theme[key] = theme[key]["Linux"]
 
         # fix name inconsistencies
-        if "CTkCheckbox" in cls.theme.keys():
-            cls.theme["CTkCheckBox"] = cls.theme.pop("CTkCheckbox")
-        if "CTkRadiobutton" in cls.theme.keys():
-            cls.theme["CTkRadioButton"] = cls.theme.pop("CTkRadiobutton")
+        if "CTkCheckbox" in theme.keys():
+            theme["CTkCheckBox"] = theme.pop("CTkCheckbox")
+        if "CTkRadiobutton" in theme.keys():
+            theme["CTkRadioButton"] = theme.pop("CTkRadiobutton")
+
+        return theme
+
+    @classmethod
+    def _get_theme_cache_path(cls, theme_path: str) -> str:
+        if cls.theme_cache_directory is not None:
+            cache_directory = cls.theme_cache_directory
+        elif sys.platform.startswith("win"):
+            cache_directory = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "customtkinter", "cache")
+        elif sys.platform == "darwin":
+            cache_directory = os.path.join(os.path.expanduser("~"), "Library", "Caches", "customtkinter")
+        else:
+            cache_directory = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "customtkinter")
+
+        path_hash = hashlib.sha1(os.path.abspath(theme_path).encode("utf-8")).hexdigest()
+        return os.path.join(cache_directory, f"theme_{path_hash}.marshal")
+
+    @staticmethod
+    def _get_source_stat(theme_path: str) -> Union[tuple, None]:
+        try:
+            stat_result = os.stat(theme_path)
+        except OSError:
+            return None  # error gets raised when the .json file is opened
+        return stat_result.st_size, stat_result.st_mtime_ns
+
+    @classmethod
+    def _read_theme_cache(cls, theme_path: str, source_stat: tuple) -> Union[dict, None]:
+        try:
+            with open(cls._get_theme_cache_path(theme_path), "rb") as f:
+                cache_format, platform, cached_source_stat, theme = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None  # no cache or unreadable cache
+
+        if cache_format != cls._theme_cache_format or platform != sys.platform or tuple(cached_source_stat) != source_stat:
+            return None  # outdated cache
+        return theme
+
+    @classmethod
+    def _write_theme_cache(cls, theme_path: str, source_stat: tuple, theme: dict):
+        cache_path = cls._get_theme_cache_path(theme_path)
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, "wb") as f:
+                f.write(marshal.dumps((cls._theme_cache_format, sys.platform, source_stat, theme)))
+            os.replace(temporary_path, cache_path)  # atomic, other processes never read a partial file
+        except (OSError, ValueError):
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass  # cache directory not writable, theme is loaded without cache
+
+    @staticmethod
+    def _check_color_value(class_name: str, key: str, value):
+        if isinstance(value, str):
+            return
+        if isinstance(value, (list, tuple)) and len(value) == 2 and all(isinstance(color, str) for color in value):
+            return
+        warnings.warn(f"ThemeManager Warning: theme value {class_name}['{key}'] is not a valid color: {value!r}, " +
+                      f"must be a string or a list of two strings (light, dark)\n")
+
+    @classmethod
+    def _compile_class_defaults(cls, class_name: str, values: dict, validate: bool = True) -> MappingProxyType:
+        if validate:
+            for key, value in values.items():
+                if "color" in key:
+                    cls._check_color_value(class_name, key, value)
+
+        defaults = MappingProxyType(values)
+        cls._defaults[class_name] = (values, defaults)
+        return defaults
+
+    @classmethod
+    def _compile_defaults(cls, validate: bool = True):
+        cls._defaults = {}
+        for class_name, values in cls.theme.items():
+            if isinstance(values, dict):
+                cls._compile_class_defaults(class_name, values, validate=validate)
+
+    @classmethod
+    def get_defaults(cls, class_name: str) -> MappingProxyType:
+        """ returns the validated, read-only default values of a widget class for the currently loaded theme """
+        values = cls.theme[class_name]
+        entry = cls._defaults.get(class_name)
+        if entry is None or entry[0] is not values:
+            return cls._compile_class_defaults(class_name, values)  # theme or class dict got replaced, or class was added
+        return entry[1]
+
+    @classmethod
+    def theme_changed(cls):
+        """ call after replacing or extending the theme data directly, validates the theme again """
+        cls.theme_version += 1
+        cls._compile_defaults()
 
     @classmethod
     def save_theme(cls):
@@ -0,0 +1,190 @@
+"""
+Micro-benchmark of the DrawEngine routines for every drawing method.
+
+Every routine is timed for three cases over a sweep of sizes, corner radii and scaling factors:
+ - first_draw: draw on an empty canvas with an empty geometry cache
+ - resize_redraw: redraw with a different width, existing canvas items get moved
+ - noop_redraw: redraw with unchanged arguments
+
+By default the DrawEngine draws on a headless RecordingCanvas, so the results contain the time spent
+in the DrawEngine and the number of canvas operations per draw, but no Tcl or rendering time.
+With --tk the draws go to a CTkCanvas in a real window (needs a display), and after every draw the parts get
+colored like a widget does it, so the times include rasterizing the images of the 'image_shapes' method.
+
+Usage:
+    python benchmark_draw_engine.py [--tk] [--number N] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import customtkinter
+from customtkinter.windows.widgets.core_rendering import DrawEngine, CTkCanvas, ShapeImageAtlas
+
+# RecordingCanvas is a test helper next to the unit tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "unit_tests"))
+from recording_canvas import RecordingCanvas
+
+DRAWING_METHODS = ["polygon_shapes", "font_shapes", "circle_shapes", "image_shapes"]
+SIZES = [(28, 28), (140, 28), (200, 16), (300, 200)]
+CORNER_RADII = [0, 6, 14]
+SCALING_FACTORS = [1, 1.25, 1.5, 2]
+
+# routine name -> function(draw_engine, width, height, corner_radius, scaling) that calls the routine
+ROUTINES = {
+    "draw_rounded_rect_with_border":
+        lambda e, w, h, r, s: e.draw_rounded_rect_with_border(w, h, r, 2 * s),
+    "draw_rounded_rect_with_border_vertical_split":
+        lambda e, w, h, r, s: e.draw_rounded_rect_with_border_vertical_split(w, h, r, 2 * s, w / 3),
+    "draw_rounded_progress_bar_with_border":
+        lambda e, w, h, r, s: e.draw_rounded_progress_bar_with_border(w, h, r, 2 * s, 0, 0.6, "w"),
+    "draw_rounded_slider_with_border_and_button":
+        lambda e, w, h, r, s: e.draw_rounded_slider_with_border_and_button(w, h, r, 6 * s, 0, h / 2, 0.4, "w"),
+    "draw_rounded_scrollbar":
+        lambda e, w, h, r, s: e.draw_rounded_scrollbar(w, h, r, 3 * s, 0.2, 0.7, "horizontal"),
+    "draw_checkmark":
+        lambda e, w, h, r, s: e.draw_checkmark(h, h, h * 0.58),
+    "draw_dropdown_arrow":
+        lambda e, w, h, r, s: e.draw_dropdown_arrow(w - h / 2, h / 2, 9.5 * s),
+}
+
+# part tag -> colors set with itemconfig() after every draw with --tk, like the widgets do
+PART_COLORS = {
+    "background_parts": {"fill": "gray86", "outline": "gray86"},
+    "border_parts": {"fill": "gray40", "outline": "gray40"},
+    "inner_parts": {"fill": "#3B8ED0", "outline": "#3B8ED0"},
+    "left_parts": {"fill": "#3B8ED0", "outline": "#3B8ED0"},
+    "right_parts": {"fill": "gray60", "outline": "gray60"},
+    "progress_parts": {"fill": "#1F6AA5", "outline": "#1F6AA5"},
+    "scrollbar_parts": {"fill": "gray55", "outline": "gray55"},
+    "slider_parts": {"fill": "#1F6AA5", "outline": "#1F6AA5"},
+    "checkmark": {"fill": "white"},
+    "dropdown_arrow": {"fill": "white"},
+}
+
+
+class Benchmark:
+    def __init__(self, number: int, use_tk: bool):
+        self.number = number
+        self.results = []
+
+        self.root = customtkinter.CTk() if use_tk else None
+        self.canvas_class = CTkCanvas if use_tk else RecordingCanvas
+
+    def create_canvas(self):
+        if self.root is None:
+            return RecordingCanvas()
+        canvas = CTkCanvas(self.root, highlightthickness=0)
+        canvas.pack()
+        return canvas
+
+    def destroy_canvas(self, canvas):
+        if self.root is not None:
+            canvas.destroy()
+
+    def draw(self, routine, engine, width: float, height: float, corner_radius: float, scaling: float):
+        routine(engine, width, height, corner_radius, scaling)
+        if self.root is not None:
+            # image shapes are only rasterized when they have a fill color, unchanged colors are skipped by the CTkCanvas
+            for tag, options in PART_COLORS.items():
+                engine._canvas.itemconfig(tag, **options)
+
+    def count_operations(self, canvas, function) -> int:
+        # only possible on the RecordingCanvas
+        if self.root is not None:
+            function()
+            return -1
+        canvas.clear_log()
+        function()
+        return len(canvas.log)
+
+    def time_draws(self, functions) -> dict:
+        times = []
+        for function in functions:
+            start_time = time.perf_counter_ns()
+            function()
+            times.append(time.perf_counter_ns() - start_time)
+        if self.root is not None:
+            self.root.update_idletasks()
+        times.sort()
+        return {"mean_us": sum(times) / len(times) / 1000, "median_us": times[len(times) // 2] / 1000, "min_us": times[0] / 1000}
+
+    def run_case(self, routine_name: str, drawing_method: str, width: float, height: float, corner_radius: float, scaling: float):
+        routine = ROUTINES[routine_name]
+        case = {"routine": routine_name, "drawing_method": drawing_method, "scaling": scaling,
+                "width": width, "height": height, "corner_radius": corner_radius}
+
+        # first draw, every draw on a new canvas with empty geometry cache
+        canvases = [self.create_canvas() for _ in range(self.number + 1)]
+        engines = [DrawEngine(canvas) for canvas in canvases]
+
+        def first_draw(engine):
+            DrawEngine.clear_geometry_cache()
+            self.draw(routine, engine, width, height, corner_radius, scaling)
+
+        result = self.time_draws([lambda engine=engine: first_draw(engine) for engine in engines[1:]])
+        DrawEngine.clear_geometry_cache()
+        result["operations"] = self.count_operations(canvases[0], lambda: self.draw(routine, engines[0], width, height, corner_radius, scaling))
+        self.results.append(dict(case, case="first_draw", **result))
+        for canvas in canvases[1:]:
+            self.destroy_canvas(canvas)
+
+        # resize redraw, width changes by one pixel every draw like when the window gets resized
+        canvas, engine = canvases[0], engines[0]
+        result = self.time_draws([lambda i=i: self.draw(routine, engine, width + 1 + i, height, corner_radius, scaling) for i in range(self.number)])
+        result["operations"] = self.count_operations(canvas, lambda: self.draw(routine, engine, width, height, corner_radius, scaling))
+        self.results.append(dict(case, case="resize_redraw", **result))
+
+        # redraw with unchanged arguments
+        result = self.time_draws([lambda: self.draw(routine, engine, width, height, corner_radius, scaling) for _ in range(self.number)])
+        result["operations"] = self.count_operations(canvas, lambda: self.draw(routine, engine, width, height, corner_radius, scaling))
+        self.results.append(dict(case, case="noop_redraw", **result))
+        self.destroy_canvas(canvas)
+
+    def run(self):
+        preferred_drawing_method = DrawEngine.preferred_drawing_method
+        try:
+            for drawing_method in DRAWING_METHODS:
+                if drawing_method == "image_shapes" and not ShapeImageAtlas.is_available():
+                    continue
+                DrawEngine.preferred_drawing_method = drawing_method
+
+                for routine_name in ROUTINES:
+                    for scaling in SCALING_FACTORS:
+                        for width, height in SIZES:
+                            for corner_radius in CORNER_RADII:
+                                self.run_case(routine_name, drawing_method, round(width * scaling), round(height * scaling),
+                                              round(corner_radius * scaling), scaling)
+        finally:
+            DrawEngine.preferred_drawing_method = preferred_drawing_method
+            if self.root is not None:
+                self.root.destroy()
+
+    def get_report(self) -> dict:
+        return {"customtkinter_version": customtkinter.__version__,
+                "python_version": platform.python_version(),
+                "platform": sys.platform,
+                "canvas": self.canvas_class.__name__,
+                "number": self.number,
+                "results": self.results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DrawEngine micro-benchmark")
+    parser.add_argument("--tk", action="store_true", help="draw on a CTkCanvas in a window instead of the headless RecordingCanvas")
+    parser.add_argument("--number", type=int, default=50, help="number of draws per case")
+    parser.add_argument("--output", type=str, default=None, help="write JSON results to this file instead of stdout")
+    arguments = parser.parse_args()
+
+    benchmark = Benchmark(number=arguments.number, use_tk=arguments.tk)
+    benchmark.run()
+
+    if arguments.output is None:
+        json.dump(benchmark.get_report(), sys.stdout, indent=2)
+    else:
+        with open(arguments.output, "w") as f:
+            json.dump(benchmark.get_report(), f, indent=2)
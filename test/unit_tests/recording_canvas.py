@@ -0,0 +1,188 @@
+import tkinter
+from collections import Counter
+from typing import Union, Tuple, List
+
+
+class RecordingCanvas:
+    """
+    Headless stand-in for CTkCanvas, implements the subset of the CTkCanvas API used by the DrawEngine.
+
+    Items are kept in plain Python structures and every canvas operation is logged, so the DrawEngine
+    can be tested and benchmarked without a display. Each logged operation corresponds to one Tcl
+    command a CTkCanvas would execute (before skipping unchanged values and batching).
+
+    - .log is a list of (operation, args, kwargs) tuples, .clear_log() resets it
+    - .get_operation_counts() returns a Counter with the number of logged calls per operation
+    - .items maps item id to a dict with 'type', 'coords', 'options' and 'tags'
+    - .find_all() returns all item ids in display order (lowest first)
+
+    Tag expressions are not supported, tags are matched literally.
+    """
+
+    def __init__(self):
+        self.items: dict = {}  # item id -> {"type": str, "coords": list, "options": dict, "tags": list}
+        self.log: List[tuple] = []
+        self.batch_count: int = 0  # number of outermost begin_batch() calls
+
+        self._display_list: list = []  # item ids, lowest first
+        self._next_id: int = 1
+        self._batch_depth: int = 0
+
+    def clear_log(self):
+        self.log.clear()
+        self.batch_count = 0
+
+    def get_operation_counts(self) -> Counter:
+        return Counter(operation for operation, _, _ in self.log)
+
+    def find_all(self) -> tuple:
+        return tuple(self._display_list)
+
+    def _log(self, operation: str, *args, **kwargs):
+        self.log.append((operation, args, kwargs))
+
+    def _find(self, tag_or_id) -> list:
+        if type(tag_or_id) == int or (type(tag_or_id) == str and tag_or_id.isdigit()):
+            return [int(tag_or_id)] if int(tag_or_id) in self.items else []
+        elif tag_or_id == tkinter.ALL:
+            return list(self._display_list)
+        else:
+            return [item_id for item_id in self._display_list if tag_or_id in self.items[item_id]["tags"]]
+
+    def begin_batch(self):
+        if self._batch_depth == 0:
+            self.batch_count += 1
+        self._batch_depth += 1
+
+    def end_batch(self):
+        self._batch_depth = max(0, self._batch_depth - 1)
+
+    def _create(self, item_type: str, coords: tuple, options: dict) -> int:
+        tags = options.pop("tags", ())
+        tags = tags.split() if isinstance(tags, str) else [str(tag) for tag in tags]
+
+        item_id = self._next_id
+        self._next_id += 1
+        self.items[item_id] = {"type": item_type, "coords": [float(value) for value in coords], "options": options, "tags": tags}
+        self._display_list.append(item_id)
+        self._log("create", item_type, *coords, **options, tags=tuple(tags))
+        return item_id
+
+    def create_line(self, *coords, **kwargs) -> int:
+        return self._create("line", coords, kwargs)
+
+    def create_oval(self, *coords, **kwargs) -> int:
+        return self._create("oval", coords, kwargs)
+
+    def create_polygon(self, *coords, **kwargs) -> int:
+        return self._create("polygon", coords, kwargs)
+
+    def create_rectangle(self, *coords, **kwargs) -> int:
+        return self._create("rectangle", coords, kwargs)
+
+    def create_text(self, *coords, **kwargs) -> int:
+        return self._create("text", coords, kwargs)
+
+    def create_image(self, *coords, **kwargs) -> int:
+        return self._create("image", coords, kwargs)
+
+    def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
+                         tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.CENTER) -> int:
+        tags = tuple(tags.split()) if isinstance(tags, str) else tuple(tags)
+        return self._create("text", (x_pos, y_pos), {"radius": radius, "angle": angle, "fill": fill, "anchor": anchor,
+                                                     "tags": tags + ("ctk_aa_circle_font_element",)})
+
+    def create_image_shape(self, x_pos: int, y_pos: int, shape: tuple = None, fill: str = None,
+                           tags: Union[str, Tuple[str, ...]] = "", anchor: str = tkinter.NW) -> int:
+        # the shape image is not rendered, shape and fill are only stored as options
+        tags = tuple(tags.split()) if isinstance(tags, str) else tuple(tags)
+        return self._create("image", (x_pos, y_pos), {"shape": shape, "fill": fill, "anchor": anchor,
+                                                      "tags": tags + ("ctk_image_shape",)})
+
+    def get_item_handle(self, name: str) -> Union[int, None]:
+        # pure Python lookup in CTkCanvas too, so it is not logged
+        for item_id in self._display_list:
+            if len(self.items[item_id]["tags"]) > 0 and self.items[item_id]["tags"][0] == name:
+                return item_id
+        return None
+
+    def coords(self, tag_or_id, *args):
+        if len(args) == 0:
+            self._log("coords", tag_or_id)
+            item_ids = self._find(tag_or_id)
+            return self.items[item_ids[0]]["coords"] if len(item_ids) > 0 else []
+
+        self._log("coords", tag_or_id, *args)
+        for item_id in self._find(tag_or_id)[:1]:  # coords only changes the first matching item
+            item = self.items[item_id]
+            if "ctk_aa_circle_font_element" in item["tags"]:
+                item["coords"] = [float(value) for value in args[:2]]
+                if len(args) == 3:
+                    item["options"]["radius"] = args[2]
+            else:
+                item["coords"] = [float(value) for value in tkinter._flatten(args)]
+
+    def itemconfig(self, tag_or_id, **kwargs):
+        self._log("itemconfigure", tag_or_id, **kwargs)
+        for item_id in self._find(tag_or_id):
+            item = self.items[item_id]
+            if "ctk_aa_circle_font_element" in item["tags"] or "ctk_image_shape" in item["tags"]:
+                item["options"].update({key: value for key, value in kwargs.items() if key != "outline"})
+            else:
+                item["options"].update(kwargs)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id, option: str):
+        self._log("itemcget", tag_or_id, option)
+        item_ids = self._find(tag_or_id)
+        return self.items[item_ids[0]]["options"].get(option, "") if len(item_ids) > 0 else ""
+
+    def find_withtag(self, tag_or_id) -> tuple:
+        self._log("find", "withtag", tag_or_id)
+        return tuple(self._find(tag_or_id))
+
+    def gettags(self, tag_or_id) -> tuple:
+        self._log("gettags", tag_or_id)
+        item_ids = self._find(tag_or_id)
+        return tuple(self.items[item_ids[0]]["tags"]) if len(item_ids) > 0 else ()
+
+    def addtag_withtag(self, new_tag: str, tag_or_id):
+        self._log("addtag", new_tag, "withtag", tag_or_id)
+        for item_id in self._find(tag_or_id):
+            if new_tag not in self.items[item_id]["tags"]:
+                self.items[item_id]["tags"].append(new_tag)
+
+    def delete(self, *args):
+        self._log("delete", *args)
+        for tag_or_id in args:
+            for item_id in self._find(tag_or_id):
+                del self.items[item_id]
+                self._display_list.remove(item_id)
+
+    def tag_lower(self, tag_or_id, below_this=None):
+        self._log("lower", tag_or_id, *(() if below_this is None else (below_this,)))
+        self._restack(tag_or_id, below_this, lower=True)
+
+    def tag_raise(self, tag_or_id, above_this=None):
+        self._log("raise", tag_or_id, *(() if above_this is None else (above_this,)))
+        self._restack(tag_or_id, above_this, lower=False)
+
+    lower = tag_lower
+    lift = tkraise = tag_raise
+
+    def _restack(self, tag_or_id, reference, lower: bool):
+        moving = self._find(tag_or_id)
+        if len(moving) == 0:
+            return
+        remaining = [item_id for item_id in self._display_list if item_id not in moving]
+
+        reference_ids = [] if reference is None else [item_id for item_id in self._find(reference) if item_id in remaining]
+        if len(reference_ids) == 0:
+            self._display_list = moving + remaining if lower else remaining + moving
+        elif lower:
+            index = remaining.index(reference_ids[0])  # below the lowest item of reference
+            self._display_list = remaining[:index] + moving + remaining[index:]
+        else:
+            index = remaining.index(reference_ids[-1]) + 1  # above the highest item of reference
+            self._display_list = remaining[:index] + moving + remaining[index:]
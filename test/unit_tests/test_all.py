@@ -1,7 +1,29 @@
 from test_ctk import TestCTk
 from test_ctk_toplevel import TestCTkToplevel
 from test_ctk_button import TestCTkButton
+from test_draw_engine import TestDrawEngine
+from test_ctk_canvas import TestCTkCanvas
+from test_sdf_rasterizer import TestSdfRasterizer
+from test_ctk_base_class import TestCTkBaseClass
+from test_appearance_mode_tracker import TestAppearanceModeTracker
+from test_scaling_tracker import TestScalingTracker
+from test_scaling_base_class import TestScalingBaseClass
+from test_theme_manager import TestThemeManager
+from test_ctk_font import TestCTkFont
+from test_font_manager import TestFontManager
+from test_ctk_image import TestCTkImage
 
 TestCTk().main()
 TestCTkToplevel().main()
 TestCTkButton().main()
+TestDrawEngine().main()
+TestCTkCanvas().main()
+TestSdfRasterizer().main()
+TestCTkBaseClass().main()
+TestAppearanceModeTracker().main()
+TestScalingTracker().main()
+TestScalingBaseClass().main()
+TestThemeManager().main()
+TestCTkFont().main()
+TestFontManager().main()
+TestCTkImage().main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+import gc
+import io
+import sys
+
+from customtkinter.windows.widgets.appearance_mode import AppearanceModeTracker
+
+
+class CallbackObject:
+    def __init__(self):
+        self.modes = []
+
+    def callback(self, mode_string):
+        self.modes.append(mode_string)
+
+    def failing_callback(self, mode_string):
+        raise ValueError("callback failed")
+
+
+class TestAppearanceModeTracker():
+    """ tests the weak callback registry of AppearanceModeTracker without Tk, no widget and app is registered """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        callback_dict, appearance_mode = AppearanceModeTracker.callback_dict, AppearanceModeTracker.appearance_mode
+        AppearanceModeTracker.callback_dict = {}
+        try:
+            self.test_bound_method_registry()
+            self.test_weak_bound_methods()
+            self.test_plain_function()
+            self.test_callback_list()
+            self.test_callback_errors()
+        finally:
+            AppearanceModeTracker.callback_dict, AppearanceModeTracker.appearance_mode = callback_dict, appearance_mode
+
+    def test_bound_method_registry(self):
+        print(" -> test_bound_method_registry: ", end="")
+        obj = CallbackObject()
+
+        # every attribute access creates a new bound method object, they must map to the same entry
+        AppearanceModeTracker.add(obj.callback)
+        AppearanceModeTracker.add(obj.callback)
+        assert len(AppearanceModeTracker.callback_dict) == 1
+
+        AppearanceModeTracker.appearance_mode = 1
+        AppearanceModeTracker.update_callbacks()
+        assert obj.modes == ["Dark"]
+
+        AppearanceModeTracker.remove(obj.callback)
+        assert len(AppearanceModeTracker.callback_dict) == 0
+        AppearanceModeTracker.remove(obj.callback)  # removing twice is no error
+        print("successful")
+
+    def test_weak_bound_methods(self):
+        print(" -> test_weak_bound_methods: ", end="")
+        obj_1, obj_2 = CallbackObject(), CallbackObject()
+        AppearanceModeTracker.add(obj_1.callback)
+        AppearanceModeTracker.add(obj_2.callback)
+        assert len(AppearanceModeTracker.callback_dict) == 2
+
+        # registry doesn't keep objects alive and removes their entries
+        del obj_1
+        gc.collect()
+        assert len(AppearanceModeTracker.callback_dict) == 1
+
+        AppearanceModeTracker.appearance_mode = 0
+        AppearanceModeTracker.update_callbacks()
+        assert obj_2.modes == ["Light"]
+
+        AppearanceModeTracker.remove(obj_2.callback)
+        print("successful")
+
+    def test_plain_function(self):
+        print(" -> test_plain_function: ", end="")
+        modes = []
+        AppearanceModeTracker.add(lambda mode_string: modes.append(mode_string))
+        gc.collect()
+
+        # functions are referenced strongly like before
+        AppearanceModeTracker.appearance_mode = 1
+        AppearanceModeTracker.update_callbacks()
+        assert modes == ["Dark"]
+        AppearanceModeTracker.callback_dict.clear()
+        print("successful")
+
+    def test_callback_list(self):
+        print(" -> test_callback_list: ", end="")
+        obj = CallbackObject()
+
+        def function(mode_string):
+            pass
+
+        AppearanceModeTracker.add(obj.callback)
+        AppearanceModeTracker.add(function)
+        assert AppearanceModeTracker.callback_list == (obj.callback, function)
+        assert obj.callback in AppearanceModeTracker.callback_list
+
+        # read-only, changing it raises an error instead of having no effect
+        try:
+            AppearanceModeTracker.callback_list.append(function)
+            assert False, "callback_list must be read-only"
+        except AttributeError:
+            pass
+
+        del obj
+        gc.collect()
+        assert AppearanceModeTracker.callback_list == (function,)
+        AppearanceModeTracker.callback_dict.clear()
+        print("successful")
+
+    def test_callback_errors(self):
+        print(" -> test_callback_errors: ", end="")
+        obj_1, obj_2 = CallbackObject(), CallbackObject()
+        AppearanceModeTracker.add(obj_1.failing_callback)
+        AppearanceModeTracker.add(obj_2.callback)
+        error_count = AppearanceModeTracker.callback_error_count
+
+        durations = []
+        switch_duration_callback = AppearanceModeTracker.switch_duration_callback
+        AppearanceModeTracker.switch_duration_callback = lambda mode_string, duration: durations.append(mode_string)
+
+        stderr, sys.stderr = sys.stderr, io.StringIO()
+        try:
+            AppearanceModeTracker.appearance_mode = 0
+            AppearanceModeTracker.update_callbacks()
+            error_output = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+            AppearanceModeTracker.switch_duration_callback = switch_duration_callback
+
+        # failing callback doesn't stop the switch
+        assert obj_2.modes == ["Light"] and durations == ["Light"]
+        assert AppearanceModeTracker.callback_error_count == error_count + 1
+        assert str(AppearanceModeTracker.last_callback_error) == "callback failed"
+        assert "callback failed" in error_output
+        AppearanceModeTracker.callback_dict.clear()
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestAppearanceModeTracker().main()
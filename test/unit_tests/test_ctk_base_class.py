@@ -0,0 +1,176 @@
+import gc
+
+from customtkinter.windows.widgets.core_widget_classes import CTkBaseClass
+from customtkinter.windows.widgets.appearance_mode import AppearanceModeTracker
+
+
+class FakeRoot:
+    """ root window without Tk, runs after_idle callbacks when flush() is called """
+
+    def __init__(self):
+        self.idle_callbacks = []
+        self.reported_exceptions = []
+
+    def after_idle(self, func, *args):
+        self.idle_callbacks.append((func, args))
+        return f"after#{len(self.idle_callbacks)}"
+
+    def flush(self):
+        idle_callbacks, self.idle_callbacks = self.idle_callbacks, []
+        for func, args in idle_callbacks:
+            func(*args)
+
+    def report_callback_exception(self, exc, val, tb):
+        self.reported_exceptions.append(val)
+
+
+class FakeWidget:
+    """ implements the parts of CTkBaseClass used by the render queue and the appearance mode switch """
+
+    _request_draw = CTkBaseClass._request_draw
+    _request_draw_if_visible = CTkBaseClass._request_draw_if_visible
+    _map_event = CTkBaseClass._map_event
+
+    def __init__(self, root: FakeRoot, error: Exception = None, path: str = ".widget"):
+        self.root = root
+        self.error = error
+        self.path = path
+        self.visible = False
+        self.draw_calls = []
+        self._mapped_once = False
+        self._draw_on_map = False
+
+    def __str__(self):
+        return self.path
+
+    def _root(self):
+        return self.root
+
+    def winfo_toplevel(self):
+        return self.root
+
+    def _is_visible(self):
+        return self.visible
+
+    def map(self):
+        self.visible = True
+        self._map_event(None)
+
+    def _report_exception(self):
+        CTkBaseClass._report_exception(self)
+
+    def _draw(self, no_color_updates=False):
+        self.draw_calls.append(no_color_updates)
+        if self.error is not None:
+            raise self.error
+
+
+class TestCTkBaseClass():
+    """ tests the render queue of CTkBaseClass with fake widgets and root windows without Tk """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_coalesce_draw_requests()
+        self.test_draw_error()
+        self.test_destroyed_root()
+        self.test_draw_on_first_map()
+        self.test_stale_widgets_on_map()
+
+    def test_coalesce_draw_requests(self):
+        print(" -> test_coalesce_draw_requests: ", end="")
+        root = FakeRoot()
+        widget_1, widget_2 = FakeWidget(root), FakeWidget(root)
+
+        widget_1._request_draw(no_color_updates=True)
+        widget_1._request_draw()
+        widget_2._request_draw(no_color_updates=True)
+        widget_2._request_draw(no_color_updates=True)
+        assert len(root.idle_callbacks) == 1
+
+        root.flush()
+        assert widget_1.draw_calls == [False] and widget_2.draw_calls == [True]
+        assert root not in CTkBaseClass._draw_request_flushes
+        print("successful")
+
+    def test_draw_error(self):
+        print(" -> test_draw_error: ", end="")
+        root = FakeRoot()
+        widgets = [FakeWidget(root), FakeWidget(root, error=ValueError("draw failed")), FakeWidget(root)]
+        for widget in widgets:
+            widget._request_draw()
+
+        root.flush()
+        assert [len(widget.draw_calls) for widget in widgets] == [1, 1, 1]
+        assert len(root.reported_exceptions) == 1 and str(root.reported_exceptions[0]) == "draw failed"
+
+        widgets[0]._request_draw()  # next request gets a new flush
+        assert len(root.idle_callbacks) == 1
+        root.flush()
+        print("successful")
+
+    def test_destroyed_root(self):
+        print(" -> test_destroyed_root: ", end="")
+        root = FakeRoot()
+        widget = FakeWidget(root)
+        widget._request_draw()
+        assert len(CTkBaseClass._draw_request_flushes) == 1 and len(CTkBaseClass._draw_requests) == 1
+
+        # root window and widget destroyed before idle-time flush
+        del root, widget
+        gc.collect()
+        assert len(CTkBaseClass._draw_request_flushes) == 0 and len(CTkBaseClass._draw_requests) == 0
+        print("successful")
+
+    def test_draw_on_first_map(self):
+        print(" -> test_draw_on_first_map: ", end="")
+        root = FakeRoot()
+        widget = FakeWidget(root)
+
+        # appearance mode switch before first map, like set_appearance_mode() before mainloop
+        widget._draw_on_map = True
+        widget.map()
+        assert not AppearanceModeTracker.is_stale(widget)
+        root.flush()
+        assert widget.draw_calls == [False] and widget._draw_on_map is False
+
+        # first map while not visible, e.g. scrolled out of view
+        widget = FakeWidget(root)
+        widget._draw_on_map = True
+        widget._mapped_once = False
+        widget._map_event(None)
+        assert AppearanceModeTracker.is_stale(widget) and len(root.idle_callbacks) == 0
+        AppearanceModeTracker.unmark_stale(widget)
+        print("successful")
+
+    def test_stale_widgets_on_map(self):
+        print(" -> test_stale_widgets_on_map: ", end="")
+        root, other_root = FakeRoot(), FakeRoot()
+        frame = FakeWidget(root, path=".frame")
+        children = [FakeWidget(root, path=f".frame.button{i}") for i in range(3)]
+        other_widget = FakeWidget(root, path=".frame2.button")
+        other_window_widget = FakeWidget(other_root, path=".toplevel.frame.button")
+        for widget in [frame, *children, other_widget, other_window_widget]:
+            widget._mapped_once = True
+            AppearanceModeTracker.mark_stale(widget)
+        assert len(AppearanceModeTracker._stale_widgets[root]) == 5
+
+        # frame mapped again, its visible children get redrawn, other widgets stay stale
+        for widget in [frame, *children[:2]]:
+            widget.visible = True
+        frame._map_event(None)
+        root.flush()
+        assert [len(widget.draw_calls) for widget in [frame, *children, other_widget]] == [1, 1, 1, 0, 0]
+        assert [AppearanceModeTracker.is_stale(widget) for widget in [frame, *children, other_widget, other_window_widget]] == [False, False, False, True, True, True]
+
+        for widget in [children[2], other_widget, other_window_widget]:
+            AppearanceModeTracker.unmark_stale(widget)
+        assert len(AppearanceModeTracker._stale_widget_toplevels) == 0
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestCTkBaseClass().main()
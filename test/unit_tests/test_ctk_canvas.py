@@ -0,0 +1,187 @@
+import tkinter
+
+from customtkinter.windows.widgets.core_rendering import CTkCanvas
+
+
+class FakeCanvasCommand:
+    """ Python implementation of the Tcl canvas widget command, registered in a Tcl interpreter without Tk """
+
+    def __init__(self):
+        self.calls = []  # every command as tuple of strings
+        self.items = {}  # item id -> {"tags": list, "coords": tuple, "options": dict}
+        self.next_id = 1
+
+    def _find(self, tag_or_id: str) -> list:
+        if tag_or_id.isdigit():
+            return [int(tag_or_id)] if int(tag_or_id) in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        return [item_id for item_id, item in self.items.items() if tag_or_id in item["tags"]]
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        command = args[0]
+
+        if command == "create":
+            option_index = next((i for i, arg in enumerate(args) if i >= 2 and arg.startswith("-")), len(args))
+            coords, options = args[2:option_index], dict(zip(args[option_index::2], args[option_index + 1::2]))
+            item_id = self.next_id
+            self.next_id += 1
+            self.items[item_id] = {"tags": options.pop("-tags", "").split(), "coords": coords, "options": options}
+            return str(item_id)
+        elif command == "find":
+            return " ".join(str(item_id) for item_id in self._find(args[2]))
+        elif command == "gettags":
+            item_ids = self._find(args[1])
+            return " ".join(self.items[item_ids[0]]["tags"]) if len(item_ids) > 0 else ""
+        elif command == "coords":
+            for item_id in self._find(args[1])[:1]:
+                if len(args) == 2:
+                    return " ".join(self.items[item_id]["coords"])
+                self.items[item_id]["coords"] = args[2:]
+        elif command == "itemconfigure":
+            for item_id in self._find(args[1]):
+                self.items[item_id]["options"].update(dict(zip(args[2::2], args[3::2])))
+        elif command == "delete":
+            for tag_or_id in args[1:]:
+                for item_id in self._find(tag_or_id):
+                    del self.items[item_id]
+        return ""
+
+    def count(self, command: str) -> int:
+        return sum(1 for call in self.calls if call[0] == command)
+
+
+class TestCTkCanvas():
+    """ runs CTkCanvas on a Tcl interpreter without Tk, the canvas widget command is a FakeCanvasCommand """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_item_handles()
+        self.test_coords_memo()
+        self.test_itemconfig_memo()
+        self.test_itemconfig_digit_string()
+        self.test_batch()
+        self.test_batch_procedure_flag()
+
+    @staticmethod
+    def create_canvas():
+        root = tkinter.Tcl()
+        command = FakeCanvasCommand()
+        root.tk.createcommand(".canvas", command)
+
+        def widget_init(self, master=None, cnf={}, **kw):
+            self.master, self.tk, self._w, self._name = master, master.tk, ".canvas", "canvas"
+            self.children, self._tclCommands = {}, None
+
+        original_init = tkinter.Canvas.__init__
+        tkinter.Canvas.__init__ = widget_init
+        try:
+            canvas = CTkCanvas(root)
+        finally:
+            tkinter.Canvas.__init__ = original_init
+        return canvas, command
+
+    def test_item_handles(self):
+        print(" -> test_item_handles: ", end="")
+        canvas, command = self.create_canvas()
+        item_1 = canvas.create_rectangle(0, 0, 10, 10, tags=("border_line_1", "border_parts"))
+        item_2 = canvas.create_rectangle(0, 0, 10, 10, tags=("inner_line_1", "inner_parts"))
+
+        calls = len(command.calls)
+        assert canvas.get_item_handle("border_line_1") == item_1
+        assert canvas.get_item_handle("inner_line_1") == item_2
+        assert canvas.get_item_handle("missing") is None
+        assert len(command.calls) == calls  # lookups without Tcl round-trip
+
+        canvas.delete("border_line_1")
+        assert canvas.get_item_handle("border_line_1") is None
+        canvas.delete(str(item_2))
+        assert canvas.get_item_handle("inner_line_1") is None
+        print("successful")
+
+    def test_coords_memo(self):
+        print(" -> test_coords_memo: ", end="")
+        canvas, command = self.create_canvas()
+        item = canvas.create_line(0, 0, 10, 10, tags="line")
+
+        coords = [0, 0, 20, 20]
+        canvas.coords(item, coords)
+        canvas.coords(item, coords)
+        assert command.count("coords") == 1
+
+        coords[2] = 30  # list changed after call, memo must not follow
+        canvas.coords(item, coords)
+        assert command.count("coords") == 2
+        assert command.items[item]["coords"] == ("0", "0", "30", "20")
+        print("successful")
+
+    def test_itemconfig_memo(self):
+        print(" -> test_itemconfig_memo: ", end="")
+        canvas, command = self.create_canvas()
+        item_1 = canvas.create_rectangle(0, 0, 10, 10, tags=("rect_1", "border_parts"))
+        item_2 = canvas.create_rectangle(0, 0, 10, 10, tags=("rect_2", "border_parts"))
+
+        canvas.itemconfig("border_parts", fill="red")
+        canvas.itemconfig("border_parts", fill="red")
+        canvas.itemconfig(item_1, fill="red")
+        assert command.count("itemconfigure") == 1
+
+        canvas.itemconfig(item_2, fill="blue")
+        canvas.itemconfig("border_parts", fill="red")
+        assert command.count("itemconfigure") == 3
+        assert command.items[item_1]["options"]["-fill"] == command.items[item_2]["options"]["-fill"] == "red"
+        print("successful")
+
+    def test_itemconfig_digit_string(self):
+        print(" -> test_itemconfig_digit_string: ", end="")
+        canvas, command = self.create_canvas()
+        item = canvas.create_rectangle(0, 0, 10, 10, tags="rect")
+
+        canvas.itemconfig(str(item), fill="green")
+        assert command.items[item]["options"]["-fill"] == "green"
+        canvas.itemconfig(item, fill="green")
+        assert command.count("itemconfigure") == 1
+        print("successful")
+
+    def test_batch(self):
+        print(" -> test_batch: ", end="")
+        canvas, command = self.create_canvas()
+        item_1 = canvas.create_rectangle(0, 0, 10, 10, tags="rect_1")
+        item_2 = canvas.create_rectangle(0, 0, 10, 10, tags="rect_2")
+
+        calls = len(command.calls)
+        canvas.begin_batch()
+        canvas.coords(item_1, 1, 1, 5, 5)
+        canvas.itemconfig(item_2, fill="red")
+        canvas.tag_raise(item_1)
+        assert len(command.calls) == calls  # nothing sent before end_batch()
+        canvas.end_batch()
+
+        # all commands are run by the Tcl batch procedure in order
+        assert [call[0] for call in command.calls[calls:]] == ["coords", "itemconfigure", "raise"]
+        assert command.items[item_1]["coords"] == ("1", "1", "5", "5")
+        assert command.items[item_2]["options"]["-fill"] == "red"
+
+        # queries flush the batch first
+        canvas.begin_batch()
+        canvas.coords(item_2, 2, 2, 4, 4)
+        assert canvas.coords(item_2) == [2.0, 2.0, 4.0, 4.0]
+        canvas.end_batch()
+        print("successful")
+
+    def test_batch_procedure_flag(self):
+        print(" -> test_batch_procedure_flag: ", end="")
+        canvas, command = self.create_canvas()
+        assert canvas._load_batch_procedure() is True
+        assert canvas._root()._ctk_batch_procedure_loaded is True
+        assert "_ctk_batch_procedure_loaded" not in CTkCanvas.__dict__
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestCTkCanvas().main()
@@ -0,0 +1,233 @@
+import gc
+import tkinter
+
+from customtkinter import CTkFont
+from customtkinter.windows.widgets.core_widget_classes import CTkBaseClass
+
+# Tcl implementation of the Tk font command, measure returns half the size per character
+FAKE_FONT_COMMAND = """
+proc font {command name args} {
+    global fake_fonts
+    switch -- $command {
+        create {
+            set fake_fonts($name) [dict merge {-family Helvetica -size 12 -weight normal -slant roman -underline 0 -overstrike 0} $args]
+            return $name
+        }
+        configure - config - actual {
+            if {[llength $args] == 0} { return $fake_fonts($name) }
+            if {[llength $args] == 1} { return [dict get $fake_fonts($name) [lindex $args 0]] }
+            set fake_fonts($name) [dict merge $fake_fonts($name) $args]
+        }
+        measure {
+            set size [expr {abs([dict get $fake_fonts($name) -size])}]
+            return [expr {[string length [lindex $args 0]] * $size / 2}]
+        }
+        metrics {
+            set size [expr {abs([dict get $fake_fonts($name) -size])}]
+            return [list -ascent $size -descent [expr {$size / 4}] -linespace [expr {$size + $size / 4}] -fixed 0]
+        }
+        delete {
+            unset -nocomplain fake_fonts($name)
+        }
+    }
+    return ""
+}
+"""
+
+
+def create_root() -> tkinter.Tk:
+    """ Tcl interpreter without Tk with fake font command """
+    root = tkinter.Tcl()
+    root.tk.eval(FAKE_FONT_COMMAND)
+    return root
+
+
+class FakeWidget:
+    """ handles font like CTkButton """
+
+    _get_private_font = CTkBaseClass._get_private_font
+
+    def __init__(self, font=None):
+        self._font = CTkFont.get_shared_font() if font is None else font
+        self._font.add_size_configure_callback(self._update_font)
+        self.font_updates = 0
+        self.configure_calls = 0
+
+    def _update_font(self):
+        self.font_updates += 1
+
+    def configure(self, font=None):
+        self.configure_calls += 1
+        self._font.remove_size_configure_callback(self._update_font)
+        self._font = font
+        self._font.add_size_configure_callback(self._update_font)
+        self._update_font()
+
+    def cget(self, attribute_name):
+        if attribute_name == "font":
+            return self._get_private_font()
+
+
+class TestCTkFont():
+    """ tests CTkFont with a Tcl interpreter without Tk as default root """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        default_root = tkinter._default_root
+        tkinter._default_root = create_root()
+        try:
+            self.test_shared_font()
+            self.test_shared_font_cget()
+            self.test_scaled_fonts()
+            self.test_measure_cache()
+            self.test_measure_cache_invalidation()
+            self.test_measure_cache_interpreters()
+            self.test_metrics()
+        finally:
+            tkinter._default_root = default_root
+            CTkFont.clear_measure_cache()
+
+    def test_shared_font(self):
+        print(" -> test_shared_font: ", end="")
+        font = CTkFont.get_shared_font()
+        assert CTkFont.get_shared_font() is font
+        assert CTkFont.get_shared_font(size=20) is not font
+        assert CTkFont(size=font.cget("size")) is not font  # created fonts are never shared
+
+        # configured shared font doesn't match its key anymore
+        font.configure(size=30)
+        assert CTkFont.get_shared_font() is not font and not font._is_shared()
+        print("successful")
+
+    def test_shared_font_cget(self):
+        print(" -> test_shared_font_cget: ", end="")
+        widget_1, widget_2 = FakeWidget(), FakeWidget()
+        shared_font = widget_1._font
+        assert widget_2._font is shared_font
+
+        # cget never returns the shared font, configuring the returned font only changes one widget
+        font = widget_1.cget("font")
+        assert font is not shared_font and not font._is_shared() and widget_1.cget("font") is font
+        assert (font.cget("family"), font.cget("size"), font.cget("weight")) == (shared_font.cget("family"), shared_font.cget("size"), shared_font.cget("weight"))
+
+        # cget doesn't configure or update the widget, the copy took over the callback
+        assert widget_1.configure_calls == 0 and widget_1.font_updates == 0
+        assert widget_1._update_font not in shared_font._size_configure_callback_dict.values()
+
+        font.configure(size=25)
+        assert widget_1.font_updates == 1 and widget_2.font_updates == 0
+        assert shared_font.cget("size") != 25 and CTkFont.get_shared_font() is shared_font
+
+        # fonts given by the user are returned as they are
+        user_font = CTkFont(size=15)
+        assert FakeWidget(user_font).cget("font") is user_font
+        print("successful")
+
+    def test_scaled_fonts(self):
+        print(" -> test_scaled_fonts: ", end="")
+        root = tkinter._default_root
+        font = CTkFont(family="Roboto", size=10)
+        used_scaled_font = font.get_scaled_font(1.5)  # reference like a widget holds it
+        assert font.get_scaled_font(1.5) is used_scaled_font
+        assert int(used_scaled_font.cget("size")) == -15 and used_scaled_font.cget("family") == "Roboto"
+
+        # more scaling factors than cache size, least recently used fonts are dropped from the cache
+        for font_scaling in (1, 1.25, 1.75, 2, 2.25):
+            font.get_scaled_font(font_scaling)
+        gc.collect()
+        assert 1.5 not in font._scaled_fonts and len(font._scaled_fonts) == CTkFont.scaled_font_cache_size
+        assert root.tk.call("info", "exists", f"fake_fonts({font.get_scaled_font(2).name})")
+
+        # font still used by a widget is not deleted and gets updated on configure
+        assert root.tk.call("info", "exists", f"fake_fonts({used_scaled_font.name})")
+        font.configure(size=20)
+        assert int(used_scaled_font.cget("size")) == -30
+        assert font.get_scaled_font(1.5) is used_scaled_font
+
+        # unused fonts dropped from the cache get deleted
+        dropped_font_name = font.get_scaled_font(1).name
+        for font_scaling in (3, 4, 5, 6):
+            font.get_scaled_font(font_scaling)
+        gc.collect()
+        assert not root.tk.call("info", "exists", f"fake_fonts({dropped_font_name})")
+        print("successful")
+
+    def test_measure_cache(self):
+        print(" -> test_measure_cache: ", end="")
+        CTkFont.clear_measure_cache()
+        font = CTkFont(size=10)
+
+        # every text is measured once, duplicates in one call count as a single miss
+        assert font.measure_texts(["ab", "abcd", "ab"]) == [10, 20, 10]
+        assert CTkFont.get_measure_cache_info() == {"hits": 0, "misses": 2, "size": 2}
+        assert font.measure_text("abcd") == 20 and font.measure_text("abcd", font_scaling=2) == 40
+        assert CTkFont.get_measure_cache_info() == {"hits": 1, "misses": 3, "size": 3}
+
+        # least recently used widths are dropped
+        measure_cache_size = CTkFont.measure_cache_size
+        CTkFont.measure_cache_size = 3
+        try:
+            font.measure_text("ab")
+            font.measure_text("abc")
+            assert CTkFont.get_measure_cache_info()["size"] == 3
+            assert (font._root_reference, font.name, font._version, "abcd") not in CTkFont._measure_cache
+            assert (font._root_reference, font.name, font._version, "ab") in CTkFont._measure_cache
+        finally:
+            CTkFont.measure_cache_size = measure_cache_size
+        print("successful")
+
+    def test_measure_cache_invalidation(self):
+        print(" -> test_measure_cache_invalidation: ", end="")
+        CTkFont.clear_measure_cache()
+        font = CTkFont(size=10)
+        assert font.measure_text("abcd") == 20 and font.measure_text("abcd", font_scaling=2) == 40
+
+        font.configure(size=20)
+        assert font.measure_text("abcd") == 40 and font.measure_text("abcd", font_scaling=2) == 80
+        assert CTkFont.get_measure_cache_info()["misses"] == 4
+        print("successful")
+
+    def test_measure_cache_interpreters(self):
+        print(" -> test_measure_cache_interpreters: ", end="")
+        CTkFont.clear_measure_cache()
+        font_1 = CTkFont(size=10)
+
+        # font with the same name in a second interpreter, like font names derived from id() on Python 3.7
+        tkinter._default_root, root_1 = create_root(), tkinter._default_root
+        try:
+            font_2 = CTkFont(size=30)
+            tkinter._default_root.tk.call("font", "create", font_1.name, "-size", -30)
+            font_2.name = font_1.name
+            assert font_1.measure_text("abcd") == 20 and font_2.measure_text("abcd") == 60
+            assert CTkFont.get_measure_cache_info() == {"hits": 0, "misses": 2, "size": 2}
+        finally:
+            tkinter._default_root = root_1
+
+        # entries of a root get dropped with it, so the cache doesn't keep its interpreter alive
+        del font_2
+        gc.collect()
+        assert CTkFont.get_measure_cache_info()["size"] == 1
+        assert font_1.measure_text("abcd") == 20 and CTkFont.get_measure_cache_info()["hits"] == 1
+        print("successful")
+
+    def test_metrics(self):
+        print(" -> test_metrics: ", end="")
+        font = CTkFont(size=20)
+        metrics = font.get_metrics()
+        assert (metrics["ascent"], metrics["descent"], metrics["linespace"]) == (20, 5, 25)
+        assert font.get_metrics(font_scaling=2)["ascent"] == 40
+
+        # returned dict is a copy, configure() invalidates the cached metrics
+        metrics["ascent"] = 0
+        assert font.get_metrics()["ascent"] == 20
+        font.configure(size=40)
+        assert font.get_metrics()["ascent"] == 40 and font.get_metrics(font_scaling=2)["ascent"] == 80
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestCTkFont().main()
@@ -0,0 +1,160 @@
+import gc
+import types
+from collections import OrderedDict
+from PIL import Image
+
+from customtkinter import CTkImage
+from customtkinter.windows.widgets.image import ctk_image
+
+
+class FakePhotoImage:
+    """ photo image without Tk, answers 'image inuse' with the in_use set """
+
+    in_use: set = set()
+    in_use_calls: int = 0
+
+    def __init__(self, image):
+        self.size = image.size
+        self.tk = self
+
+    def call(self, *args):
+        assert args[:2] == ("image", "inuse")
+        FakePhotoImage.in_use_calls += 1
+        return self in FakePhotoImage.in_use
+
+    def getboolean(self, value):
+        return bool(value)
+
+
+class TestCTkImage():
+    """ tests the memory budget of the scaled photo images with fake photo images, the cache state gets restored after every test """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.run_test(self.test_cache_info)
+        self.run_test(self.test_budget_eviction)
+        self.run_test(self.test_in_use_not_evicted)
+        self.run_test(self.test_in_use_checks)
+        self.run_test(self.test_forget_photo_images)
+
+    def run_test(self, test):
+        image_tk, budget, lru = ctk_image.ImageTk, CTkImage.photo_image_memory_budget, CTkImage._photo_image_lru
+        counters = CTkImage.photo_image_hits, CTkImage.photo_image_misses, CTkImage.photo_image_evictions, CTkImage._photo_image_resident_bytes
+        ctk_image.ImageTk = types.SimpleNamespace(PhotoImage=FakePhotoImage)
+        CTkImage._photo_image_lru = OrderedDict()
+        CTkImage.photo_image_hits = CTkImage.photo_image_misses = CTkImage.photo_image_evictions = CTkImage._photo_image_resident_bytes = 0
+        FakePhotoImage.in_use, FakePhotoImage.in_use_calls = set(), 0
+        try:
+            test()
+        finally:
+            ctk_image.ImageTk, CTkImage.photo_image_memory_budget, CTkImage._photo_image_lru = image_tk, budget, lru
+            CTkImage.photo_image_hits, CTkImage.photo_image_misses, CTkImage.photo_image_evictions, CTkImage._photo_image_resident_bytes = counters
+
+    @staticmethod
+    def create_image(size=(10, 10)) -> CTkImage:
+        return CTkImage(light_image=Image.new("RGB", (4, 4)), dark_image=Image.new("RGB", (4, 4)), size=size)
+
+    def test_cache_info(self):
+        print(" -> test_cache_info: ", end="")
+        image = self.create_image()
+        photo_image = image.create_scaled_photo_image(1, "light")
+        assert photo_image.size == (10, 10)
+        assert image.create_scaled_photo_image(1, "light") is photo_image
+        image.create_scaled_photo_image(2, "dark")
+
+        # 4 bytes per pixel
+        assert CTkImage.get_photo_image_cache_info() == {"hits": 1, "misses": 2, "evictions": 0, "images": 2, "resident_bytes": 2000}
+        print("successful")
+
+    def test_budget_eviction(self):
+        print(" -> test_budget_eviction: ", end="")
+        CTkImage.photo_image_memory_budget = 1000  # two 10x10 photo images
+        image = self.create_image()
+        photo_image_1 = image.create_scaled_photo_image(1, "light")
+        image.create_scaled_photo_image(1, "dark")
+        image.create_scaled_photo_image(1, "light")  # light is most recently used now
+
+        image.create_scaled_photo_image(1.1, "light")
+        info = CTkImage.get_photo_image_cache_info()
+        assert info["evictions"] == 1 and info["images"] == 2 and info["resident_bytes"] <= 1000
+        assert image.create_scaled_photo_image(1, "light") is photo_image_1
+        assert (10, 10) not in image._scaled_dark_photo_images
+
+        # photo image which is just returned is kept, even if it doesn't fit the budget
+        photo_image_large = image.create_scaled_photo_image(3, "dark")
+        info = CTkImage.get_photo_image_cache_info()
+        assert info["images"] == 1 and info["resident_bytes"] == 3600
+        assert image.create_scaled_photo_image(3, "dark") is photo_image_large
+        print("successful")
+
+    def test_in_use_not_evicted(self):
+        print(" -> test_in_use_not_evicted: ", end="")
+        CTkImage.photo_image_memory_budget = 1000
+        image = self.create_image()
+        photo_image_1 = image.create_scaled_photo_image(1, "light")
+        image.create_scaled_photo_image(1, "dark")
+        FakePhotoImage.in_use.add(photo_image_1)
+
+        # least recently used photo image is displayed, next one gets evicted
+        image.create_scaled_photo_image(1.1, "light")
+        assert (10, 10) in image._scaled_light_photo_images and (10, 10) not in image._scaled_dark_photo_images
+        assert CTkImage.get_photo_image_cache_info()["evictions"] == 1
+
+        # displayed photo image was moved to the end, evicted when not displayed anymore
+        FakePhotoImage.in_use.clear()
+        image.create_scaled_photo_image(1.2, "light")
+        assert (10, 10) in image._scaled_light_photo_images and (11, 11) not in image._scaled_light_photo_images
+        image.create_scaled_photo_image(1.3, "light")
+        assert (10, 10) not in image._scaled_light_photo_images
+        print("successful")
+
+    def test_in_use_checks(self):
+        print(" -> test_in_use_checks: ", end="")
+        CTkImage.photo_image_memory_budget = 1000
+        image = self.create_image(size=(10, 10))
+        photo_images = []
+        for i in range(60):  # all displayed, over budget
+            photo_images.append(image.create_scaled_photo_image(1 + i / 10, "light"))
+            FakePhotoImage.in_use.add(photo_images[-1])
+
+        # every created photo image checks a limited number of photo images in use
+        for i in range(10):
+            FakePhotoImage.in_use_calls = 0
+            FakePhotoImage.in_use.add(image.create_scaled_photo_image(1 + i / 10, "dark"))
+            assert FakePhotoImage.in_use_calls <= CTkImage.photo_image_eviction_checks
+        assert CTkImage.get_photo_image_cache_info()["evictions"] == 0
+
+        # checks continue with photo images not checked before, so unused photo images are found
+        FakePhotoImage.in_use.difference_update(photo_images[:2])
+        for i in range(10, 15):
+            image.create_scaled_photo_image(1 + i / 10, "dark")
+        assert CTkImage.get_photo_image_cache_info()["evictions"] >= 2
+        assert (10, 10) not in image._scaled_light_photo_images and (11, 11) not in image._scaled_light_photo_images
+        assert (12, 12) in image._scaled_light_photo_images
+        print("successful")
+
+    def test_forget_photo_images(self):
+        print(" -> test_forget_photo_images: ", end="")
+        image_1, image_2 = self.create_image(), self.create_image()
+        image_1.create_scaled_photo_image(1, "light")
+        image_1.create_scaled_photo_image(1, "dark")
+        image_2.create_scaled_photo_image(1, "light")
+
+        # configure() drops the photo images of the replaced image
+        image_1.configure(light_image=Image.new("RGB", (4, 4)))
+        assert CTkImage.get_photo_image_cache_info()["images"] == 2
+
+        # deleted CTkImage objects are removed from the cache
+        del image_1
+        gc.collect()
+        assert CTkImage.get_photo_image_cache_info()["images"] == 1
+        assert CTkImage.get_photo_image_cache_info()["resident_bytes"] == 400
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestCTkImage().main()
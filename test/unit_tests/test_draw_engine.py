@@ -0,0 +1,149 @@
+import gc
+
+from customtkinter.windows.widgets.core_rendering import DrawEngine, ShapeImageAtlas
+from customtkinter.windows.widgets.core_rendering import shape_image_atlas
+
+from recording_canvas import RecordingCanvas
+
+
+class FakeRoot:
+    pass
+
+
+class FakeCanvas:
+    """ canvas for the ShapeImageAtlas without Tk """
+
+    def __init__(self, root: FakeRoot):
+        self.root = root
+
+    def _root(self):
+        return self.root
+
+    @staticmethod
+    def winfo_rgb(color):
+        return 0, 0, 0
+
+
+class TestDrawEngine():
+    """ runs the DrawEngine on a RecordingCanvas, no display needed """
+
+    drawing_methods = ["polygon_shapes", "font_shapes", "circle_shapes", "image_shapes"]
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        preferred_drawing_method = DrawEngine.preferred_drawing_method
+
+        try:
+            self.test_first_draw()
+            self.test_redraw_without_changes()
+            self.test_resize_redraw()
+            self.test_z_order()
+            self.test_shape_atlas_memory_budget()
+            self.test_shape_atlas_root_destroyed()
+        finally:
+            DrawEngine.preferred_drawing_method = preferred_drawing_method
+
+    def test_first_draw(self):
+        print(" -> test_first_draw: ", end="")
+        for drawing_method in self.drawing_methods:
+            DrawEngine.preferred_drawing_method = drawing_method
+            canvas = RecordingCanvas()
+            assert DrawEngine(canvas).draw_rounded_rect_with_border(100, 30, 6, 2) is True
+            assert canvas.get_operation_counts()["create"] == len(canvas.items) > 0
+            assert len(canvas.find_withtag("border_parts")) > 0 and len(canvas.find_withtag("inner_parts")) > 0
+        print("successful")
+
+    def test_redraw_without_changes(self):
+        print(" -> test_redraw_without_changes: ", end="")
+        for drawing_method in self.drawing_methods:
+            DrawEngine.preferred_drawing_method = drawing_method
+            canvas = RecordingCanvas()
+            draw_engine = DrawEngine(canvas)
+            draw_engine.draw_rounded_slider_with_border_and_button(200, 16, 8, 0, 10, 9, 0.5, "w")
+            items = {item_id: (item["coords"], dict(item["options"])) for item_id, item in canvas.items.items()}
+
+            canvas.clear_log()
+            assert draw_engine.draw_rounded_slider_with_border_and_button(200, 16, 8, 0, 10, 9, 0.5, "w") is False
+            assert {item_id: (item["coords"], item["options"]) for item_id, item in canvas.items.items()} == items
+            assert canvas.get_operation_counts()["create"] == 0 and canvas.batch_count == 1
+        print("successful")
+
+    def test_resize_redraw(self):
+        print(" -> test_resize_redraw: ", end="")
+        for drawing_method in self.drawing_methods:
+            DrawEngine.preferred_drawing_method = drawing_method
+            canvas = RecordingCanvas()
+            draw_engine = DrawEngine(canvas)
+            draw_engine.draw_rounded_rect_with_border(100, 30, 6, 2)
+            item_ids = canvas.find_all()
+
+            canvas.clear_log()
+            assert draw_engine.draw_rounded_rect_with_border(140, 40, 6, 2) is False
+            assert canvas.find_all() == item_ids
+            assert canvas.get_operation_counts()["create"] == 0
+        print("successful")
+
+    def test_z_order(self):
+        print(" -> test_z_order: ", end="")
+        for drawing_method in self.drawing_methods:
+            DrawEngine.preferred_drawing_method = drawing_method
+            canvas = RecordingCanvas()
+            draw_engine = DrawEngine(canvas)
+            draw_engine.draw_rounded_rect_with_border(100, 30, 6, 2)
+            draw_engine.draw_background_corners(100, 30)
+
+            display_list = canvas.find_all()
+            background_ids = canvas.find_withtag("background_parts")
+            assert display_list[:len(background_ids)] == background_ids
+            assert max(display_list.index(item_id) for item_id in canvas.find_withtag("border_parts")) < \
+                   min(display_list.index(item_id) for item_id in canvas.find_withtag("inner_parts"))
+        print("successful")
+
+    def test_shape_atlas_memory_budget(self):
+        print(" -> test_shape_atlas_memory_budget: ", end="")
+        # PhotoImages need a Tk interpreter, the atlas only keeps references to them
+        photo_image_class, max_bytes = shape_image_atlas.ImageTk.PhotoImage, ShapeImageAtlas.max_bytes
+        shape_image_atlas.ImageTk.PhotoImage = lambda image, master=None: object()
+        ShapeImageAtlas.clear()
+        try:
+            ShapeImageAtlas.max_bytes = 3 * 100 * 100 * 4
+            root = FakeRoot()
+            for width in range(100, 110):  # window gets resized
+                ShapeImageAtlas.get_photo_image(FakeCanvas(root), ("rounded_rect", width, 100, 6, (True, True, True, True)), "black")
+
+            info = ShapeImageAtlas.get_info()
+            assert info["resident_bytes"] <= ShapeImageAtlas.max_bytes and info["size"] == 2 and info["misses"] == 10
+            assert info["resident_bytes"] == sum(width * 100 * 4 for width in (108, 109))
+        finally:
+            shape_image_atlas.ImageTk.PhotoImage, ShapeImageAtlas.max_bytes = photo_image_class, max_bytes
+            ShapeImageAtlas.clear()
+        print("successful")
+
+    def test_shape_atlas_root_destroyed(self):
+        print(" -> test_shape_atlas_root_destroyed: ", end="")
+        photo_image_class = shape_image_atlas.ImageTk.PhotoImage
+        shape_image_atlas.ImageTk.PhotoImage = lambda image, master=None: object()
+        ShapeImageAtlas.clear()
+        try:
+            root_1, root_2 = FakeRoot(), FakeRoot()
+            shape = ("rounded_rect", 100, 100, 6, (True, True, True, True))
+            photo_image = ShapeImageAtlas.get_photo_image(FakeCanvas(root_1), shape, "black")
+            assert ShapeImageAtlas.get_photo_image(FakeCanvas(root_2), shape, "black") is not photo_image  # not shared between roots
+            assert ShapeImageAtlas.get_photo_image(FakeCanvas(root_1), shape, "black") is photo_image
+
+            # entries of a root window get dropped with it, so they don't keep its Tcl interpreter alive
+            del root_1
+            gc.collect()
+            info = ShapeImageAtlas.get_info()
+            assert info["size"] == 1 and info["resident_bytes"] == 100 * 100 * 4
+        finally:
+            shape_image_atlas.ImageTk.PhotoImage = photo_image_class
+            ShapeImageAtlas.clear()
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestDrawEngine().main()
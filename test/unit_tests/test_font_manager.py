@@ -0,0 +1,143 @@
+import io
+import os
+import sys
+import shutil
+import tempfile
+import tkinter
+
+from customtkinter import FontManager
+
+
+class TestFontManager():
+    """ tests register_font() and install_fonts() with font files in a temporary directory, font loading is tested on Linux only """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.run_test(self.test_install_fonts)
+        self.run_test(self.test_failure_callback)
+        self.run_test(self.test_existing_root)
+        self.run_test(self.test_failed_copy_not_reported)
+
+    def run_test(self, test):
+        linux_font_path, registered_fonts, fonts_installed = FontManager.linux_font_path, FontManager._registered_fonts, FontManager._fonts_installed
+        default_root = tkinter._default_root
+        self.directory = tempfile.mkdtemp()
+        FontManager.linux_font_path = os.path.join(self.directory, "installed_fonts")
+        FontManager._registered_fonts, FontManager._fonts_installed = [], True
+        tkinter._default_root = None
+        try:
+            if sys.platform.startswith("linux"):
+                test()
+            else:
+                print(f" -> {test.__name__}: skipped, Linux only")
+        finally:
+            FontManager.linux_font_path, FontManager._registered_fonts, FontManager._fonts_installed = linux_font_path, registered_fonts, fonts_installed
+            tkinter._default_root = default_root
+            shutil.rmtree(self.directory)
+
+    def create_font_file(self, name: str) -> str:
+        font_path = os.path.join(self.directory, name)
+        with open(font_path, "wb") as f:
+            f.write(b"font data " + name.encode())
+        return font_path
+
+    def test_install_fonts(self):
+        print(" -> test_install_fonts: ", end="")
+        font_paths = [self.create_font_file("Font-Regular.ttf"), self.create_font_file("Font-Bold.ttf")]
+        for font_path in font_paths:
+            FontManager.register_font(font_path)
+
+        # registered fonts are loaded with the first install_fonts() call
+        assert not os.path.exists(FontManager.linux_font_path)
+        FontManager.install_fonts()
+        assert sorted(os.listdir(FontManager.linux_font_path)) == ["Font-Bold.ttf", "Font-Regular.ttf"]
+        assert len(FontManager._registered_fonts) == 0
+
+        # installed fonts which are up to date don't get copied again
+        installed_font_path = os.path.join(FontManager.linux_font_path, "Font-Regular.ttf")
+        with open(installed_font_path, "r+b") as f:
+            f.write(b"FONT")  # same size, content change not detected by shallow compare
+        os.utime(installed_font_path, ns=(os.stat(font_paths[0]).st_atime_ns, os.stat(font_paths[0]).st_mtime_ns))
+        FontManager.register_font(font_paths[0])
+        FontManager.install_fonts()
+        with open(installed_font_path, "rb") as f:
+            assert f.read().startswith(b"FONT")
+
+        # changed font files get copied again
+        with open(font_paths[0], "ab") as f:
+            f.write(b" version 2")
+        FontManager.register_font(font_paths[0])
+        FontManager.install_fonts()
+        with open(installed_font_path, "rb") as f:
+            assert f.read().endswith(b"version 2")
+        print("successful")
+
+    def test_failure_callback(self):
+        print(" -> test_failure_callback: ", end="")
+        failures = []
+        FontManager.register_font(os.path.join(self.directory, "missing.ttf"), failure_callback=lambda: failures.append("missing"))
+        FontManager.register_font(self.create_font_file("Font-Regular.ttf"), failure_callback=lambda: failures.append("regular"))
+
+        stderr, sys.stderr = sys.stderr, io.StringIO()
+        try:
+            FontManager.install_fonts()
+            FontManager.install_fonts()  # nothing registered since last call
+            error_output = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        assert failures == ["missing"] and "missing.ttf" in error_output
+        print("successful")
+
+    def test_existing_root(self):
+        print(" -> test_existing_root: ", end="")
+        tkinter._default_root = tkinter.Tcl()  # root created before the first CTk window or widget
+
+        stderr, sys.stderr = sys.stderr, io.StringIO()
+        try:
+            # font gets installed immediately, with a warning because it was copied after Tk started
+            FontManager.register_font(self.create_font_file("Font-Regular.ttf"))
+            assert os.listdir(FontManager.linux_font_path) == ["Font-Regular.ttf"]
+            assert "Font-Regular.ttf" in sys.stderr.getvalue()
+
+            # no warning for fonts which are installed already
+            sys.stderr.truncate(0)
+            FontManager.register_font(os.path.join(self.directory, "Font-Regular.ttf"))
+            assert sys.stderr.getvalue() == ""
+        finally:
+            sys.stderr = stderr
+        print("successful")
+
+    def test_failed_copy_not_reported(self):
+        print(" -> test_failed_copy_not_reported: ", end="")
+        tkinter._default_root = tkinter.Tcl()
+
+        # every font is checked once per install
+        up_to_date_checks = []
+        linux_font_up_to_date = FontManager.__dict__["_linux_font_up_to_date"]
+
+        def counting_linux_font_up_to_date(cls, font_path: str) -> bool:
+            up_to_date_checks.append(font_path)
+            return linux_font_up_to_date.__func__(cls, font_path)
+
+        FontManager._linux_font_up_to_date = classmethod(counting_linux_font_up_to_date)
+
+        stderr, sys.stderr = sys.stderr, io.StringIO()
+        try:
+            FontManager.register_font(os.path.join(self.directory, "Missing.ttf"))
+            error_output = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+            FontManager._linux_font_up_to_date = linux_font_up_to_date
+
+        # copy failed, so the font is reported as error and not as installed
+        assert up_to_date_checks == [os.path.join(self.directory, "Missing.ttf")]
+        assert "FontManager error" in error_output and "were installed" not in error_output
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestFontManager().main()
@@ -0,0 +1,110 @@
+import tkinter
+
+from customtkinter.windows.widgets.scaling import CTkScalingBaseClass
+
+
+class FakeWindow(tkinter.Toplevel, CTkScalingBaseClass):
+    """ window without Tk with scaling_type window """
+
+    def __init__(self):
+        self.master = None
+        CTkScalingBaseClass.__init__(self, scaling_type="window")
+
+
+class FakeWidget(CTkScalingBaseClass):
+    def __init__(self, master):
+        self.master = master
+        CTkScalingBaseClass.__init__(self, scaling_type="widget")
+
+
+class TestScalingBaseClass():
+    """ tests the scaled value memo of CTkScalingBaseClass without Tk """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        CTkScalingBaseClass.clear_scaling_memo()
+        try:
+            self.test_font_memo()
+            self.test_argument_memo()
+            self.test_geometry_memo()
+            self.test_scaling_change()
+        finally:
+            CTkScalingBaseClass.clear_scaling_memo()
+
+    def test_font_memo(self):
+        print(" -> test_font_memo: ", end="")
+        window = FakeWindow()
+        widget_1, widget_2 = FakeWidget(window), FakeWidget(window)
+        info = CTkScalingBaseClass.get_scaling_memo_info()
+
+        assert widget_1._apply_font_scaling(("Roboto", 13)) == ("Roboto", -13)
+        assert widget_2._apply_font_scaling(("Roboto", 13)) == ("Roboto", -13)  # memo is shared between widgets
+        assert widget_1._apply_font_scaling(("Roboto", 13, "bold")) == ("Roboto", -13, ("bold",))
+
+        new_info = CTkScalingBaseClass.get_scaling_memo_info()
+        assert new_info["misses"] - info["misses"] == 2 and new_info["hits"] - info["hits"] == 1
+        print("successful")
+
+    def test_argument_memo(self):
+        print(" -> test_argument_memo: ", end="")
+        window = FakeWindow()
+        widget = FakeWidget(window)
+        widget._set_scaling(2, 1)
+
+        kwargs = {"row": 0, "padx": 5, "pady": (2, 4)}
+        assert widget._apply_argument_scaling(kwargs) == {"row": 0, "padx": 10, "pady": (4, 8)}
+        assert widget._apply_argument_scaling(kwargs) == {"row": 0, "padx": 10, "pady": (4, 8)}
+        assert kwargs == {"row": 0, "padx": 5, "pady": (2, 4)}  # given kwargs not changed
+
+        # nothing to scale, same dict is returned
+        kwargs = {"row": 0, "sticky": "nsew"}
+        assert widget._apply_argument_scaling(kwargs) is kwargs
+
+        # unhashable values can't be memorized, but get scaled
+        info = CTkScalingBaseClass.get_scaling_memo_info()
+        assert widget._apply_argument_scaling({"padx": [1, 2]})["padx"] == [1, 2]
+        assert widget._apply_argument_scaling({"x": 3})["x"] == 6
+        assert CTkScalingBaseClass.get_scaling_memo_info()["misses"] - info["misses"] == 1
+        print("successful")
+
+    def test_geometry_memo(self):
+        print(" -> test_geometry_memo: ", end="")
+        window = FakeWindow()
+        window._set_scaling(1, 1.5)
+
+        assert window._apply_geometry_scaling("400x300") == "600x450"
+        assert window._apply_geometry_scaling("400x300+10+20") == "600x450+10+20"
+        assert window._apply_geometry_scaling("+10+20") == "+10+20"
+        assert window._reverse_geometry_scaling("600x450") == "400x300"
+
+        info = CTkScalingBaseClass.get_scaling_memo_info()
+        assert window._apply_geometry_scaling("400x300") == "600x450"
+        assert CTkScalingBaseClass.get_scaling_memo_info()["hits"] - info["hits"] == 1
+        print("successful")
+
+    def test_scaling_change(self):
+        print(" -> test_scaling_change: ", end="")
+        window = FakeWindow()
+        widget = FakeWidget(window)
+
+        # values of the old scaling factor are never returned after a change
+        widget._set_scaling(1, 1)
+        assert widget._apply_font_scaling(("Roboto", 10)) == ("Roboto", -10)
+        widget._set_scaling(1.5, 1)
+        assert widget._apply_font_scaling(("Roboto", 10)) == ("Roboto", -15)
+
+        # memos of scaling factors no longer in use get dropped
+        for scaling in (1.25, 1.75, 2, 2.25, 2.5):
+            widget._set_scaling(scaling, 1)
+            widget._apply_font_scaling(("Roboto", 10))
+        assert CTkScalingBaseClass.get_scaling_memo_info()["factors"] <= CTkScalingBaseClass.scaling_memo_max_factors
+        assert ("widget", 2.5) in CTkScalingBaseClass._scaling_memo and ("widget", 1.25) not in CTkScalingBaseClass._scaling_memo
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestScalingBaseClass().main()
@@ -0,0 +1,177 @@
+import gc
+import types
+import tkinter
+
+from customtkinter.windows.widgets.scaling import ScalingTracker
+from customtkinter.windows.widgets.scaling import scaling_tracker
+
+
+class FakeWindow(tkinter.Toplevel):
+    """ window without Tk, ScalingTracker only needs it as key and for block_update_dimensions_event() """
+
+    def __init__(self):
+        self.master = None
+        self.blocked = False
+        self.after_calls = []  # (ms, func, args)
+        self.update_idletasks_calls = []  # blocked state at every update_idletasks() call
+
+    def block_update_dimensions_event(self):
+        self.blocked = True
+
+    def unblock_update_dimensions_event(self):
+        self.blocked = False
+
+    def _root(self):
+        return self
+
+    def update_idletasks(self):
+        self.update_idletasks_calls.append(self.blocked)
+
+    def after(self, ms, func, *args):
+        self.after_calls.append((ms, func, args))
+
+    def run_after_calls(self):
+        after_calls, self.after_calls = self.after_calls, []
+        for _, func, args in after_calls:
+            func(*args)
+
+
+class FakeWidget:
+    def __init__(self, master):
+        self.master = master
+        self.scaling_calls = []
+
+    def set_scaling(self, widget_scaling, window_scaling):
+        self.scaling_calls.append((widget_scaling, window_scaling))
+
+    def set_scaling_with_error(self, widget_scaling, window_scaling):
+        raise ValueError("scaling failed")
+
+
+class TestScalingTracker():
+    """ tests ScalingTracker with fake windows and widgets without Tk """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_widget_registry()
+        self.test_deleted_window()
+        self.test_debounced_dpi_check()
+        self.test_rescale_transaction()
+
+    def test_widget_registry(self):
+        print(" -> test_widget_registry: ", end="")
+        window = FakeWindow()
+        frame = FakeWidget(window)
+        widget_1, widget_2 = FakeWidget(frame), FakeWidget(frame)
+
+        ScalingTracker.add_window(lambda widget_scaling, window_scaling: None, window)
+        ScalingTracker.add_widget(widget_1.set_scaling, widget_1)
+        ScalingTracker.add_widget(widget_2.set_scaling, widget_2)
+        ScalingTracker.add_widget(widget_2.set_scaling, widget_2)  # same callback again
+        assert ScalingTracker.get_window_root_of_widget(widget_1) is window
+        assert len(ScalingTracker.window_widgets_dict[window]) == 3
+
+        ScalingTracker.remove_widget(widget_1.set_scaling, widget_1)
+        assert len(ScalingTracker.window_widgets_dict[window]) == 2
+        assert widget_1 not in ScalingTracker._widget_window_dict
+
+        # widget deleted without remove_widget(), the weak callback removes itself
+        del widget_2
+        gc.collect()
+        assert len(ScalingTracker.window_widgets_dict[window]) == 1
+
+        ScalingTracker.remove_window(None, window)
+        assert window not in ScalingTracker.window_widgets_dict and window not in ScalingTracker.window_dpi_scaling_dict
+        print("successful")
+
+    def test_deleted_window(self):
+        print(" -> test_deleted_window: ", end="")
+        window = FakeWindow()
+        widget = FakeWidget(window)
+        ScalingTracker.add_widget(widget.set_scaling, widget)
+        window_count = len(ScalingTracker.window_widgets_dict)
+
+        # nothing is retained after a window and its widgets are deleted without destroy()
+        del window, widget
+        gc.collect()
+        assert len(ScalingTracker.window_widgets_dict) == window_count - 1
+        assert len(ScalingTracker.window_dpi_scaling_dict) == len(ScalingTracker._widget_window_dict) == 0
+        print("successful")
+
+    def test_debounced_dpi_check(self):
+        print(" -> test_debounced_dpi_check: ", end="")
+        window = FakeWindow()
+        checked_windows = []
+        current_time = [0.0]
+
+        # DPI scaling is only detected on Windows
+        module_sys, module_time = scaling_tracker.sys, scaling_tracker.time
+        check_dpi_scaling_for_window = ScalingTracker.__dict__["check_dpi_scaling_for_window"]
+        scaling_tracker.sys = types.SimpleNamespace(platform="win32")
+        scaling_tracker.time = types.SimpleNamespace(perf_counter=lambda: current_time[0])
+        ScalingTracker.check_dpi_scaling_for_window = classmethod(lambda cls, window: checked_windows.append(window))
+        try:
+            # window gets moved, many <Configure> events result in a single scheduled check
+            for _ in range(10):
+                ScalingTracker.request_dpi_check(window)
+                current_time[0] += 0.01
+            assert len(window.after_calls) == 1 and window.after_calls[0][0] == ScalingTracker.dpi_check_delay
+
+            # scheduled check comes while window is still moving, check is delayed until dpi_check_delay passed without event
+            current_time[0] = 0.1
+            ScalingTracker.request_dpi_check(window)
+            window.run_after_calls()
+            assert len(checked_windows) == 0 and len(window.after_calls) == 1
+
+            current_time[0] = 0.2
+            window.run_after_calls()
+            assert checked_windows == [window] and len(window.after_calls) == 0
+            assert window not in ScalingTracker._scheduled_dpi_checks
+
+            # next move schedules a new check
+            ScalingTracker.request_dpi_check(window)
+            assert len(window.after_calls) == 1
+        finally:
+            scaling_tracker.sys, scaling_tracker.time = module_sys, module_time
+            ScalingTracker.check_dpi_scaling_for_window = check_dpi_scaling_for_window
+        print("successful")
+
+    def test_rescale_transaction(self):
+        print(" -> test_rescale_transaction: ", end="")
+        window = FakeWindow()
+        widgets = [FakeWidget(window) for _ in range(3)]
+        blocked_states = []
+        ScalingTracker.add_window(lambda widget_scaling, window_scaling: blocked_states.append(window.blocked), window)
+        for widget in widgets:
+            ScalingTracker.add_widget(widget.set_scaling, widget)
+
+        widget_scaling = ScalingTracker.widget_scaling
+        try:
+            ScalingTracker.set_widget_scaling(1.5)
+
+            # every callback runs once while the window is blocked, then one idle flush
+            assert blocked_states == [True]
+            assert all(widget.scaling_calls == [(1.5, 1)] for widget in widgets)
+            assert window.update_idletasks_calls == [True] and window.blocked is False
+
+            # window gets unblocked if a callback raises
+            failing_widget = FakeWidget(window)
+            ScalingTracker.add_widget(failing_widget.set_scaling_with_error, failing_widget)
+            try:
+                ScalingTracker.set_widget_scaling(2)
+                assert False, "error of callback must propagate"
+            except ValueError:
+                pass
+            assert window.blocked is False
+        finally:
+            ScalingTracker.widget_scaling = widget_scaling
+            ScalingTracker.remove_window(None, window)
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestScalingTracker().main()
@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+
+from customtkinter.windows.widgets.core_rendering import ShapeImageAtlas, sdf_rasterizer
+
+
+class TestSdfRasterizer():
+    """ compares the numpy coverage functions with exact areas and with the supersampled PIL masks of the ShapeImageAtlas,
+        and checks the RGBA buffers """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.test_rounded_rect_area()
+        self.test_rounded_rect_corners()
+        self.test_polyline_area()
+        self.test_compare_pil_masks()
+        self.test_coverage_to_rgba()
+        self.test_rounded_rect_with_border_rgba()
+        self.test_atlas_render_image()
+
+    def test_rounded_rect_area(self):
+        print(" -> test_rounded_rect_area: ", end="")
+        coverage = sdf_rasterizer.rounded_rect_coverage(40, 20, 0)
+        assert coverage.shape == (20, 40) and np.all(coverage == 1)
+
+        # circle, pill and rounded rect covered area compared to exact area
+        for width, height, radius in ((40, 40, 20), (80, 30, 15), (100, 30, 6)):
+            coverage = sdf_rasterizer.rounded_rect_coverage(width, height, radius)
+            area = width * height - (4 - math.pi) * radius ** 2
+            assert abs(coverage.sum() - area) / area < 0.01
+            assert np.all((coverage >= 0) & (coverage <= 1))
+            assert coverage[height // 2, width // 2] == 1 and coverage[0, 0] == 0
+        print("successful")
+
+    def test_rounded_rect_corners(self):
+        print(" -> test_rounded_rect_corners: ", end="")
+        coverage = sdf_rasterizer.rounded_rect_coverage(60, 20, 8, (True, False, True, False))
+        assert coverage[0, 0] == 0 and coverage[-1, -1] == 0  # nw and se rounded
+        assert coverage[0, -1] == 1 and coverage[-1, 0] == 1  # ne and sw sharp
+
+        # corner radius is clamped to half of the smaller side
+        assert np.array_equal(sdf_rasterizer.rounded_rect_coverage(60, 20, 50), sdf_rasterizer.rounded_rect_coverage(60, 20, 10))
+        print("successful")
+
+    def test_polyline_area(self):
+        print(" -> test_polyline_area: ", end="")
+        # horizontal line with round caps: rectangle plus circle
+        coverage = sdf_rasterizer.polyline_coverage(60, 20, ((10, 10), (50, 10)), 8)
+        area = 40 * 8 + math.pi * 4 ** 2
+        assert abs(coverage.sum() - area) / area < 0.01
+        assert coverage[10, 30] == 1 and coverage[0, 30] == 0 and coverage[10, 2] == 0
+        print("successful")
+
+    def test_compare_pil_masks(self):
+        print(" -> test_compare_pil_masks: ", end="")
+        shapes = (("rounded_rect", 140, 28, 6, (True, True, True, True)),
+                  ("rounded_rect", 28, 28, 14, (True, True, True, True)),
+                  ("rounded_rect", 60, 20, 10, (True, False, True, False)),
+                  ("checkmark", 24, 24, 24),
+                  ("dropdown_arrow", 12))
+
+        use_sdf_rasterizer = ShapeImageAtlas.use_sdf_rasterizer
+        try:
+            for shape in shapes:
+                image_size = ShapeImageAtlas.get_image_size(shape)
+                ShapeImageAtlas.use_sdf_rasterizer = True
+                sdf_mask = np.asarray(ShapeImageAtlas.render_mask(shape, image_size), dtype=np.float32) / 255
+                ShapeImageAtlas.use_sdf_rasterizer = False
+                pil_mask = np.asarray(ShapeImageAtlas.render_mask(shape, image_size), dtype=np.float32) / 255
+
+                # both rasterizers only differ in antialiasing of the edge pixels
+                assert sdf_mask.shape == pil_mask.shape == (image_size[1], image_size[0])
+                assert np.abs(sdf_mask - pil_mask).max() < 0.3, shape
+                assert np.abs(sdf_mask - pil_mask).mean() < 0.05, shape
+                assert abs(sdf_mask.sum() - pil_mask.sum()) / pil_mask.sum() < 0.05, shape
+        finally:
+            ShapeImageAtlas.use_sdf_rasterizer = use_sdf_rasterizer
+        print("successful")
+
+    def test_coverage_to_rgba(self):
+        print(" -> test_coverage_to_rgba: ", end="")
+        rgba = sdf_rasterizer.coverage_to_rgba(sdf_rasterizer.circle_coverage(20), (10, 20, 30))
+        assert rgba.shape == (20, 20, 4) and rgba.dtype == np.uint8
+        assert np.all(rgba[..., :3] == (10, 20, 30))
+        assert rgba[10, 10, 3] == 255 and rgba[0, 0, 3] == 0
+        assert np.array_equal(sdf_rasterizer.pill_coverage(60, 20), sdf_rasterizer.rounded_rect_coverage(60, 20, 10))
+        print("successful")
+
+    def test_rounded_rect_with_border_rgba(self):
+        print(" -> test_rounded_rect_with_border_rgba: ", end="")
+        fg_rgb, border_rgb = (200, 200, 200), (0, 0, 255)
+        rgba = sdf_rasterizer.rounded_rect_with_border_rgba(100, 30, 6, 3, fg_rgb, border_rgb)
+        assert rgba.shape == (30, 100, 4) and rgba.dtype == np.uint8
+        assert tuple(rgba[15, 50]) == fg_rgb + (255,)  # center
+        assert tuple(rgba[15, 1]) == border_rgb + (255,) and tuple(rgba[1, 50]) == border_rgb + (255,)  # border
+        assert rgba[0, 0, 3] == 0  # outside of rounded corner
+
+        # without border it is a single color shape
+        rgba = sdf_rasterizer.rounded_rect_with_border_rgba(100, 30, 6, 0, fg_rgb, border_rgb)
+        assert np.array_equal(rgba, sdf_rasterizer.coverage_to_rgba(sdf_rasterizer.rounded_rect_coverage(100, 30, 6), fg_rgb))
+        print("successful")
+
+    def test_atlas_render_image(self):
+        print(" -> test_atlas_render_image: ", end="")
+        shape = ("rounded_rect", 60, 20, 10, (True, True, True, True))
+        image_size = ShapeImageAtlas.get_image_size(shape)
+        use_sdf_rasterizer = ShapeImageAtlas.use_sdf_rasterizer
+        try:
+            for use_sdf in (True, False):
+                ShapeImageAtlas.use_sdf_rasterizer = use_sdf
+                image = ShapeImageAtlas.render_image(shape, image_size, (255, 0, 0))
+                assert image.mode == "RGBA" and image.size == image_size
+                assert image.getpixel((30, 10)) == (255, 0, 0, 255) and image.getpixel((0, 0))[3] == 0
+                assert np.array_equal(np.asarray(image)[..., 3], np.asarray(ShapeImageAtlas.render_mask(shape, image_size)))
+        finally:
+            ShapeImageAtlas.use_sdf_rasterizer = use_sdf_rasterizer
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestSdfRasterizer().main()
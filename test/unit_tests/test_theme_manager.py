@@ -0,0 +1,188 @@
+import os
+import copy
+import json
+import shutil
+import tempfile
+import warnings
+
+from customtkinter import ThemeManager
+
+
+class TestThemeManager():
+    """ tests the per-class theme defaults, the theme data gets restored after every test """
+
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+
+        self.run_test(self.test_defaults_mapping)
+        self.run_test(self.test_replace_class_dict)
+        self.run_test(self.test_theme_changed)
+        self.run_test(self.test_invalid_color)
+        self.run_test(self.test_theme_cache_disabled)
+        self.run_test(self.test_theme_cache)
+        self.run_test(self.test_theme_cache_invalidation)
+        self.run_test(self.test_corrupt_theme_cache)
+        self.run_test(self.test_unwritable_theme_cache)
+
+    def run_test(self, test):
+        theme, use_theme_cache, theme_cache_directory = ThemeManager.theme, ThemeManager.use_theme_cache, ThemeManager.theme_cache_directory
+        ThemeManager.theme = copy.deepcopy(theme)
+        ThemeManager.use_theme_cache = False
+        self.directory = tempfile.mkdtemp()
+        try:
+            test()
+        finally:
+            ThemeManager.theme, ThemeManager.use_theme_cache, ThemeManager.theme_cache_directory = theme, use_theme_cache, theme_cache_directory
+            ThemeManager.theme_changed()
+            shutil.rmtree(self.directory)
+
+    @staticmethod
+    def create_theme_file(directory: str, corner_radius: int) -> str:
+        theme_path = os.path.join(directory, "theme.json")
+        theme = copy.deepcopy(ThemeManager.theme)
+        theme["CTkButton"]["corner_radius"] = corner_radius
+        with open(theme_path, "w") as f:
+            json.dump(theme, f)
+        return theme_path
+
+    @staticmethod
+    def load_cached_theme(theme_path: str) -> bool:
+        """ loads theme with cache, returns True if theme was read from cache """
+        cache_valid = ThemeManager._read_theme_cache(theme_path, ThemeManager._get_source_stat(theme_path)) is not None
+
+        ThemeManager.use_theme_cache = True
+        ThemeManager.load_theme(theme_path)
+        return cache_valid
+
+    def test_defaults_mapping(self):
+        print(" -> test_defaults_mapping: ", end="")
+        defaults = ThemeManager.get_defaults("CTkButton")
+        assert ThemeManager.get_defaults("CTkButton") is defaults  # created once
+        assert dict(defaults) == ThemeManager.theme["CTkButton"]
+
+        # read-only view, direct edits of the theme values still take effect
+        try:
+            defaults["corner_radius"] = 20
+            assert False, "defaults must be read-only"
+        except TypeError:
+            pass
+        ThemeManager.theme["CTkButton"]["corner_radius"] = 20
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 20
+        print("successful")
+
+    def test_replace_class_dict(self):
+        print(" -> test_replace_class_dict: ", end="")
+        ThemeManager.get_defaults("CTkButton")
+
+        ThemeManager.theme["CTkButton"] = dict(ThemeManager.theme["CTkButton"], corner_radius=30)
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 30
+
+        ThemeManager.theme = copy.deepcopy(ThemeManager.theme)
+        ThemeManager.theme["CTkButton"]["corner_radius"] = 40
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 40
+        print("successful")
+
+    def test_theme_changed(self):
+        print(" -> test_theme_changed: ", end="")
+        theme_version = ThemeManager.theme_version
+        ThemeManager.theme["CTkNewWidget"] = {"fg_color": ["gray90", "gray10"]}
+        ThemeManager.theme_changed()
+
+        assert ThemeManager.theme_version == theme_version + 1
+        assert ThemeManager.get_defaults("CTkNewWidget")["fg_color"] == ["gray90", "gray10"]
+
+        # themes loaded with load_theme() increase the version as well
+        ThemeManager.load_theme("green")
+        assert ThemeManager.theme_version == theme_version + 2 and "CTkNewWidget" not in ThemeManager.theme
+        print("successful")
+
+    def test_invalid_color(self):
+        print(" -> test_invalid_color: ", end="")
+        ThemeManager.theme["CTkButton"]["fg_color"] = ["gray90"]
+        ThemeManager.theme["CTkButton"]["hover_color"] = 5
+
+        # invalid colors are reported as warnings, the theme still gets applied
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            ThemeManager.theme_changed()
+        messages = [str(warning.message) for warning in caught_warnings]
+        assert len(messages) == 2 and "CTkButton['fg_color']" in messages[0] and "CTkButton['hover_color']" in messages[1]
+        assert ThemeManager.get_defaults("CTkButton")["hover_color"] == 5
+        print("successful")
+
+    def test_theme_cache_disabled(self):
+        print(" -> test_theme_cache_disabled: ", end="")
+        # nothing is written to the user cache directory unless the cache is enabled
+        ThemeManager.theme_cache_directory = os.path.join(self.directory, "cache")
+        ThemeManager.load_theme(self.create_theme_file(self.directory, 10))
+        assert not os.path.exists(ThemeManager.theme_cache_directory)
+        print("successful")
+
+    def test_theme_cache(self):
+        print(" -> test_theme_cache: ", end="")
+        ThemeManager.theme_cache_directory = os.path.join(self.directory, "cache")
+        theme_path = self.create_theme_file(self.directory, 11)
+
+        assert self.load_cached_theme(theme_path) is False  # first load writes the cache
+        theme = ThemeManager.theme
+        assert os.listdir(ThemeManager.theme_cache_directory) == [os.path.basename(ThemeManager._get_theme_cache_path(theme_path))]
+
+        assert self.load_cached_theme(theme_path) is True
+        assert ThemeManager.theme == theme and ThemeManager.get_defaults("CTkButton")["corner_radius"] == 11
+        print("successful")
+
+    def test_theme_cache_invalidation(self):
+        print(" -> test_theme_cache_invalidation: ", end="")
+        ThemeManager.theme_cache_directory = os.path.join(self.directory, "cache")
+        theme_path = self.create_theme_file(self.directory, 11)
+        self.load_cached_theme(theme_path)
+
+        # changed .json file has a different size, cache is not used and gets rewritten
+        self.create_theme_file(self.directory, 120)
+        assert self.load_cached_theme(theme_path) is False
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 120
+        assert self.load_cached_theme(theme_path) is True
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 120
+
+        # same size, but different modification time
+        self.create_theme_file(self.directory, 130)
+        source_stat = os.stat(theme_path)
+        os.utime(theme_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 1_000_000_000))
+        assert self.load_cached_theme(theme_path) is False
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 130
+        print("successful")
+
+    def test_corrupt_theme_cache(self):
+        print(" -> test_corrupt_theme_cache: ", end="")
+        ThemeManager.theme_cache_directory = os.path.join(self.directory, "cache")
+        theme_path = self.create_theme_file(self.directory, 13)
+        self.load_cached_theme(theme_path)
+
+        for content in (b"", b"not a marshal file", b"\xe9\x00\x00"):
+            with open(ThemeManager._get_theme_cache_path(theme_path), "wb") as f:
+                f.write(content)
+            assert self.load_cached_theme(theme_path) is False
+            assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 13
+        assert self.load_cached_theme(theme_path) is True  # cache got repaired
+        print("successful")
+
+    def test_unwritable_theme_cache(self):
+        print(" -> test_unwritable_theme_cache: ", end="")
+        # cache directory can't be created because a file has its name
+        ThemeManager.theme_cache_directory = os.path.join(self.directory, "cache")
+        with open(ThemeManager.theme_cache_directory, "w") as f:
+            f.write("")
+        theme_path = self.create_theme_file(self.directory, 14)
+
+        assert self.load_cached_theme(theme_path) is False
+        assert self.load_cached_theme(theme_path) is False
+        assert ThemeManager.get_defaults("CTkButton")["corner_radius"] == 14
+        assert sorted(os.listdir(self.directory)) == ["cache", "theme.json"]  # no temporary files left
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestThemeManager().main()